@@ -4,6 +4,14 @@ This package exposes a simple API and a command line entry point.
 """
 
 from .version import VERSION as __version__  # reexport for consumers
-from . import app as app  # re-export the app module for convenience
 
 __all__ = ["__version__", "app"]
+
+
+def __getattr__(name):
+    # ``input_monitor.app`` (Tk and the widget) is only imported when used,
+    # so reading ``__version__`` stays cheap
+    if name == "app":
+        from . import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
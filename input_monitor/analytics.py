@@ -0,0 +1,219 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Session input analytics (``--analytics``).
+
+Keys per minute, the most used shortcuts, clicks and double clicks per
+button, mouse travel and selection sizes, updated from the event handlers in
+constant memory:
+
+    keys per minute   per-second buckets over a sliding window (60 s by
+                      default), scaled to a minute
+    shortcuts         Space-Saving top-K counters (approximate past K)
+    everything else   streaming counts, sums and maxima
+
+Times are the events' own timestamps, so a replayed recording gives the same
+figures as the live session. The report is written on exit as JSON, or as
+CSV when the path ends in ``.csv``.
+"""
+import csv
+import io
+import json
+import math
+import sys
+
+
+class SlidingCounter:
+    """Events in the last ``window`` seconds, in one-second buckets."""
+
+    def __init__(self, window=60):
+        self.window = window
+        self._buckets = [0] * window
+        self._second = None
+        self.total = 0
+        self.peak = 0
+
+    def _advance(self, second):
+        if self._second is None or second - self._second >= self.window:
+            self._buckets = [0] * self.window
+            self.total = 0
+        elif second > self._second:
+            for s in range(self._second + 1, second + 1):
+                index = s % self.window
+                self.total -= self._buckets[index]
+                self._buckets[index] = 0
+        else:
+            # Out of order; counted in the current second
+            return
+        self._second = second
+
+    def add(self, t):
+        self._advance(int(t))
+        self._buckets[self._second % self.window] += 1
+        self.total += 1
+        if self.total > self.peak:
+            self.peak = self.total
+
+    def count(self, t):
+        """Events in the window ending at ``t``."""
+        self._advance(int(t))
+        return self.total
+
+
+class TopK:
+    """Space-Saving heavy hitters: counts are exact until ``capacity`` names are seen."""
+
+    def __init__(self, capacity=32):
+        self.capacity = capacity
+        # name -> [count, overestimate]
+        self._counters = {}
+
+    def add(self, name):
+        counter = self._counters.get(name)
+        if counter is not None:
+            counter[0] += 1
+        elif len(self._counters) < self.capacity:
+            self._counters[name] = [1, 0]
+        else:
+            # The new name takes over the smallest counter, inheriting its count as error
+            smallest = min(self._counters, key=lambda key: self._counters[key][0])
+            count = self._counters.pop(smallest)[0]
+            self._counters[name] = [count + 1, count]
+
+    def top(self, k):
+        """[(name, count, overestimate), ...] by count, highest first."""
+        ranked = sorted(self._counters.items(), key=lambda item: -item[1][0])
+        return [(name, count, error) for name, (count, error) in ranked[:k]]
+
+
+class SessionAnalytics:
+    """Streaming input statistics for one session."""
+
+    def __init__(self, window=60, top=10, capacity=32):
+        self.top_count = top
+        self.keys_window = SlidingCounter(window)
+        self.shortcuts = TopK(capacity)
+        self.keys = 0
+        self.shortcut_count = 0
+        # button -> [clicks, double clicks]
+        self.clicks = {}
+        self.travel = 0.0
+        self.selections = 0
+        self.selection_area = 0
+        self.selection_max = (0, 0)
+        self.first_time = None
+        self.last_time = None
+        self._position = None
+
+    def _seen(self, t):
+        if self.first_time is None:
+            self.first_time = t
+        if self.last_time is None or t > self.last_time:
+            self.last_time = t
+
+    def key(self, t):
+        self._seen(t)
+        self.keys += 1
+        self.keys_window.add(t)
+
+    def shortcut(self, text):
+        self.shortcut_count += 1
+        self.shortcuts.add(text)
+
+    def click(self, button, double, t):
+        self._seen(t)
+        counts = self.clicks.get(button)
+        if counts is None:
+            counts = self.clicks[button] = [0, 0]
+        counts[0] += 1
+        if double:
+            counts[1] += 1
+
+    def move(self, x, y):
+        position = self._position
+        if position is not None:
+            self.travel += math.hypot(x - position[0], y - position[1])
+        self._position = (x, y)
+
+    def selection(self, width, height):
+        self.selections += 1
+        self.selection_area += width * height
+        self.selection_max = max(self.selection_max, (width, height), key=lambda size: size[0] * size[1])
+
+    @property
+    def duration(self):
+        if self.first_time is None:
+            return 0.0
+        return self.last_time - self.first_time
+
+    def status_text(self, now):
+        """One line for the overlay's analytics row."""
+        # Scaled to a minute whatever the window length
+        per_minute = self.keys_window.count(now) * 60.0 / self.keys_window.window
+        parts = [f"{per_minute:.0f} KPM", f"{self.travel:.0f} px"]
+        top = self.shortcuts.top(1)
+        if top:
+            parts.append(f"{top[0][0]} ×{top[0][1]}")
+        return " | ".join(parts)
+
+    def report(self):
+        """JSON-serialisable summary of the session."""
+        minutes = self.duration / 60.0
+        return {
+            'duration_s': round(self.duration, 3),
+            'keys': {
+                'total': self.keys,
+                'per_minute': round(self.keys / minutes, 1) if minutes else None,
+                'peak_per_minute': round(self.keys_window.peak * 60.0 / self.keys_window.window),
+            },
+            'shortcuts': {
+                'total': self.shortcut_count,
+                'top': [{'keys': name, 'count': count, 'overestimate': error}
+                        for name, count, error in self.shortcuts.top(self.top_count)],
+            },
+            'clicks': {button: {'clicks': clicks, 'double_clicks': doubles}
+                       for button, (clicks, doubles) in sorted(self.clicks.items())},
+            'mouse_travel_px': round(self.travel),
+            'selections': {
+                'count': self.selections,
+                'mean_area_px': round(self.selection_area / self.selections) if self.selections else None,
+                'largest': list(self.selection_max) if self.selections else None,
+            },
+        }
+
+    def rows(self):
+        """The report flattened to (section, name, value) rows for CSV."""
+        report = self.report()
+        rows = [('session', 'duration_s', report['duration_s'])]
+        rows += [('keys', name, value) for name, value in report['keys'].items()]
+        rows.append(('shortcuts', 'total', report['shortcuts']['total']))
+        rows += [('shortcut', entry['keys'], entry['count']) for entry in report['shortcuts']['top']]
+        for button, counts in report['clicks'].items():
+            rows += [(f'clicks.{button}', name, value) for name, value in counts.items()]
+        rows.append(('mouse', 'travel_px', report['mouse_travel_px']))
+        selections = report['selections']
+        rows.append(('selections', 'count', selections['count']))
+        rows.append(('selections', 'mean_area_px', selections['mean_area_px']))
+        if selections['largest']:
+            rows.append(('selections', 'largest', 'x'.join(str(v) for v in selections['largest'])))
+        return rows
+
+    def dump(self, path=None):
+        """Write the report to ``path`` (CSV for ``.csv``, else JSON), or to stderr."""
+        if path and path.lower().endswith('.csv'):
+            out = io.StringIO()
+            writer = csv.writer(out, lineterminator='\n')
+            writer.writerow(('section', 'name', 'value'))
+            writer.writerows(self.rows())
+            text = out.getvalue().rstrip('\n')
+        else:
+            text = json.dumps(self.report(), indent=2, ensure_ascii=False)
+        if path:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text + '\n')
+        else:
+            print(text, file=sys.stderr)
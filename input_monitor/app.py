@@ -11,10 +11,18 @@ import tkinter.font as tkfont
 import os
 import time
 import sys
-from pynput import mouse
-import keyboard as kb
-import threading
 import re
+import threading
+
+from .events import EventQueue, KEY_DOWN, KEY_UP, MOVE, CLICK, SCROLL, SELECT_START, SELECT_END
+from .leds import LockStateMonitor
+from .motion import MotionCoalescer
+from .chord import ChordState, MOD_SHIFT, MOD_WIN
+from .keynames import KeyNormalizer, load_custom_labels
+from .view import ViewModel
+
+# Optional subsystems (canvas renderer, recorder, stats) and the input
+# backends are imported when first used, to keep startup short.
 
 class InputMonitorWidget:
     # UI Configuration
@@ -23,6 +31,11 @@ class InputMonitorWidget:
     WINDOW_INITIAL_X = 100
     WINDOW_INITIAL_Y = 100
     
+    # Renderer: 'frame' (nested Frame/Label tree) or 'canvas' (single Canvas)
+    RENDERER = 'frame'
+    # Canvas renderer layout: 'full', 'compact' or 'ticker'
+    LAYOUT = 'full'
+    
     # Colors
     BG_COLOR = '#2b2b2b'
     BORDER_COLOR = '#555555'
@@ -37,27 +50,161 @@ class InputMonitorWidget:
     DOUBLE_CLICK_THRESHOLD = 0.5
     DOUBLE_CLICK_POSITION_TOLERANCE = 5
     
+    # Keys held longer than this without a repeat are assumed released (only
+    # with backends whose held keys auto-repeat)
+    STUCK_KEY_TIMEOUT = 10.0
+    STUCK_KEY_SWEEP_MS = 1000
+    
+    # Input capture backend: 'auto', 'x11' (XInput2, no root needed), 'hooks' (pynput + keyboard)
+    # or 'helper' (hooks in a separate, possibly privileged, process)
+    INPUT_BACKEND = 'auto'
+    
+    # Event queue between the input hooks and the Tk main loop
+    EVENT_QUEUE_SIZE = 4096
+    EVENT_FRAME_MS = 16
+    # With no events for EVENT_IDLE_AFTER_S the queue is polled less often
+    EVENT_IDLE_MS = 100
+    EVENT_IDLE_AFTER_S = 1.0
+    EVENT_FRAME_BUDGET_MS = 8
+    EVENT_BATCH_SIZE = 64
+    
     # Mouse tracking
-    MOUSE_UPDATE_THRESHOLD = 5
+    MOUSE_REFRESH_HZ = 30
     SELECTION_MIN_SIZE = 5
     
-    # Icon sizes
+    # Wheel steps add up into one burst until the wheel rests this long
+    SCROLL_BURST_TIMEOUT_MS = 500
+    
+    # Side buttons
+    SIDE_BUTTON_NAMES = {'x1': 'Back', 'x2': 'Forward'}
+    
+    # Typing mode: plain characters roll along one line, chords and other
+    # keys are highlighted tokens in it
+    TYPING_MODE = False
+    TYPED_CHARS = 20
+    TYPED_SEGMENTS = 8
+    TYPED_TOKEN_COLOR = '#ffcc00'
+    TYPED_KEYS = {'Space': ' ', 'Enter': '⏎', 'Tab': '⇥'}
+    
+    # Icon sizes, in pixels at 96 DPI
     WIN_ICON_SIZE = 26
     MOUSE_ICON_SIZE = 48
+    ICON_SCALE = None  # None follows the display DPI
+    # How often the Tk thread checks whether the icon-cache thread is done
+    ICON_POLL_MS = 100
+    ICON_FILES = {
+        'win': ('windows-10-logo.png', WIN_ICON_SIZE),
+        'left': ('mouse-left-click.png', MOUSE_ICON_SIZE),
+        'right': ('mouse-right-click.png', MOUSE_ICON_SIZE),
+        'middle': ('mouse-middle-click.png', MOUSE_ICON_SIZE),
+        'x1': ('mouse-x1-click.png', MOUSE_ICON_SIZE),
+        'x2': ('mouse-x2-click.png', MOUSE_ICON_SIZE),
+        'scroll': ('mouse-scroll.png', MOUSE_ICON_SIZE),
+    }
     
     # LED indicators
     LED_SIZE = 10
     LED_COLOR_OFF = '#1a1a1a'
     LED_COLOR_ON = '#00ff00'
     
+    # Lock state polling fallback (used when change events are unavailable)
+    LED_POLL_MIN_MS = 100
+    LED_POLL_MAX_MS = 2000
+    LED_FORCE_POLLING = False
+    
     # Linux scan codes for Win/Meta keys
     WIN_SCAN_CODES = {125, 126}
     
     # Modifier keys
     MODIFIERS = {'Ctrl', 'Alt', 'Shift', 'Win'}
     
-    def __init__(self, root):
+    # Keys whose presses may toggle an LED
+    LOCK_KEYS = {'Caps Lock', 'Num Lock', 'Scroll Lock'}
+    
+    # JSON file with custom key labels (None: the per-user default location)
+    KEY_LABELS_PATH = None
+    
+    # Binary session recording of every handled event (None: not recording)
+    RECORD_PATH = None
+    
+    # WebVTT/SRT caption track of what is displayed (None: off), and seconds
+    # added to its times to line up with a screen recording
+    CAPTIONS_PATH = None
+    CAPTIONS_OFFSET_S = 0.0
+    
+    # Broadcast of display state and events for remote overlays: WebSocket
+    # server and/or UDP multicast (host, port) addresses, None when off
+    BROADCAST_SERVE = None
+    BROADCAST_MULTICAST = None
+    BROADCAST_HOST = '127.0.0.1'
+    BROADCAST_PORT = 8765
+    BROADCAST_MULTICAST_GROUP = '239.255.77.77'
+    
+    # Latency/throughput instrumentation row (--stats)
+    STATS_ENABLED = False
+    STATS_ROW_HEIGHT = 18
+    STATS_REFRESH_MS = 500
+    STATS_COLOR = '#999999'
+    
+    # Session analytics (--analytics): KPM, top shortcuts, clicks, travel, selections
+    ANALYTICS_ENABLED = False
+    ANALYTICS_ROW_HEIGHT = 18
+    ANALYTICS_REFRESH_MS = 1000
+    ANALYTICS_WINDOW_S = 60
+    ANALYTICS_TOP = 10
+    
+    # History ticker row: the last few combos and clicks, each fading out
+    HISTORY_MODE = False
+    HISTORY_SLOTS = 5
+    HISTORY_ROW_HEIGHT = 20
+    HISTORY_FADE_MS = 4000
+    HISTORY_FADE_STEPS = 8
+    HISTORY_FRAME_MS = 50
+    
+    # Mouse-movement heatmap panel (needs NumPy): grid cells, pixels per cell, fading
+    HEATMAP_MODE = False
+    HEATMAP_COLUMNS = 64
+    HEATMAP_ROWS = 36
+    HEATMAP_ZOOM = 4
+    HEATMAP_PADDING = 8
+    HEATMAP_HALF_LIFE_S = 30.0
+    HEATMAP_FRAME_MS = 250
+    # Below this peak (in moves) the heatmap is cleared and its timer stops
+    HEATMAP_FLOOR = 0.05
+    
+    def __init__(self, root, renderer=None, layout=None, record_path=None, listeners=True, stats=None,
+                 stats_path=None, typing=None, history=None, heatmap=None, analytics=None,
+                 analytics_path=None, captions_path=None, captions_offset=None, serve=None, multicast=None):
         self.root = root
+        self.renderer = renderer or self.RENDERER
+        self.stats = None
+        if self.STATS_ENABLED if stats is None else stats:
+            from .stats import EventStats
+            self.stats = EventStats(root)
+        self.stats_path = stats_path
+        self.analytics = None
+        if self.ANALYTICS_ENABLED if analytics is None else analytics:
+            from .analytics import SessionAnalytics
+            self.analytics = SessionAnalytics(self.ANALYTICS_WINDOW_S, self.ANALYTICS_TOP)
+        self.analytics_path = analytics_path
+        self.typed = None
+        if self.TYPING_MODE if typing is None else typing:
+            from .typed import TypedText
+            self.typed = TypedText(self.TYPED_CHARS)
+        self.history = None
+        if self.HISTORY_MODE if history is None else history:
+            from .history import HistoryRing, fade_colors
+            self.history = HistoryRing(self.HISTORY_SLOTS)
+            self.history_colors = fade_colors(self.INPUT_COLOR, self.BG_COLOR, self.HISTORY_FADE_STEPS)
+        self.heatmap = None
+        if self.HEATMAP_MODE if heatmap is None else heatmap:
+            try:
+                from .heatmap import Heatmap
+                self.heatmap = Heatmap(root.winfo_screenwidth(), root.winfo_screenheight(),
+                                       self.HEATMAP_COLUMNS, self.HEATMAP_ROWS, self.HEATMAP_HALF_LIFE_S,
+                                       self.BG_COLOR, self.HEATMAP_ZOOM)
+            except ImportError as e:
+                print(f"Heatmap unavailable: {e}", file=sys.stderr)
         self.root.title("Input Monitor")
         
         # Make window borderless and topmost
@@ -66,7 +213,10 @@ class InputMonitorWidget:
         
         # Set initial position and size
         self.width = self.WINDOW_WIDTH
-        self.height = self.WINDOW_HEIGHT
+        self.height = (self.WINDOW_HEIGHT + (self.STATS_ROW_HEIGHT if self.stats else 0) +
+                       (self.ANALYTICS_ROW_HEIGHT if self.analytics else 0) +
+                       (self.HISTORY_ROW_HEIGHT if self.history else 0) +
+                       (self.heatmap_height() if self.heatmap else 0))
         self.root.geometry(f"{self.width}x{self.height}+{self.WINDOW_INITIAL_X}+{self.WINDOW_INITIAL_Y}")
         
         # Make window draggable
@@ -77,20 +227,72 @@ class InputMonitorWidget:
         # Initialize state variables
         self._init_state_variables()
         
+        record_path = record_path or self.RECORD_PATH
+        self.recorder = None
+        if record_path:
+            from .recorder import SessionRecorder
+            self.recorder = SessionRecorder(record_path)
+        
+        captions_path = captions_path or self.CAPTIONS_PATH
+        self.captions = None
+        if captions_path:
+            from .captions import CaptionWriter
+            # Cue times count from the recording's start, when there is one
+            self.captions = CaptionWriter(
+                captions_path,
+                origin_ns=self.recorder.start_ns if self.recorder is not None else None,
+                offset=self.CAPTIONS_OFFSET_S if captions_offset is None else captions_offset
+            )
+        
         # Create UI elements
-        self.frame = tk.Frame(root, bg=self.BG_COLOR, highlightbackground=self.BORDER_COLOR, highlightthickness=1)
-        self.frame.pack(fill=tk.BOTH, expand=True)
+        self._setup_fonts()
+        if self.heatmap:
+            # One image for the whole panel, replaced in place on every refresh
+            self.heatmap_image = tk.PhotoImage(width=self.HEATMAP_COLUMNS * self.HEATMAP_ZOOM,
+                                               height=self.HEATMAP_ROWS * self.HEATMAP_ZOOM)
+        if self.renderer == 'canvas':
+            from .canvas_view import CanvasRenderer
+            self.canvas_view = CanvasRenderer(self, layout or self.LAYOUT)
+            appliers = self.canvas_view.appliers()
+        else:
+            self._setup_frame_ui()
+            appliers = {
+                'text': self._apply_text,
+                'font': self._apply_font,
+                'icon': self._apply_icon,
+                'inline': self._apply_inline,
+                'typed': self._apply_typed,
+                'history': self._apply_history,
+                'mouse': self._apply_mouse,
+                'selection': self._apply_selection,
+                'num_lock': self._apply_num_lock,
+                'caps_lock': self._apply_caps_lock,
+                'scroll_lock': self._apply_scroll_lock,
+                'stats': self._apply_stats,
+                'analytics': self._apply_analytics,
+            }
         
-        # Setup UI components
-        self._setup_title()
-        self._setup_input_display()
-        self._setup_mouse_display()
-        self._setup_selection_display()
-        self._setup_led_display()
-        self._setup_close_button()
+        serve = serve or self.BROADCAST_SERVE
+        multicast = multicast or self.BROADCAST_MULTICAST
+        self.broadcast = None
+        if serve or multicast:
+            from .broadcast import Broadcaster
+            self.broadcast = Broadcaster(root, self._broadcast_encoders(), serve, multicast)
+            appliers = self._broadcast_appliers(appliers)
+        
+        # What is currently on screen; only changed fields are pushed to Tk
+        self.view = ViewModel(appliers)
+        
+        # Start monitoring LED states
+        self._setup_lock_monitor()
         
-        # Setup event listeners
-        self._setup_listeners()
+        if self.stats:
+            self._stats_job = self.root.after(self.STATS_REFRESH_MS, self._refresh_stats)
+        if self.analytics:
+            self._analytics_job = self.root.after(self.ANALYTICS_REFRESH_MS, self._refresh_analytics)
+        
+        # Setup event listeners (disabled when events are replayed instead)
+        self._setup_listeners(listeners)
         
         # Load icons
         self._load_icons()
@@ -102,27 +304,70 @@ class InputMonitorWidget:
         self._drag_start_y = 0
         
         # Keyboard state
-        self.current_keys = set()
-        self.key_press_order = []
+        self.keys = KeyNormalizer(self.SPECIAL_KEYS, self.WIN_SCAN_CODES, load_custom_labels(self.KEY_LABELS_PATH))
+        self.chord = ChordState()
+        self._sweep_job = None
+        self._typed_pending = False
+        self._history_job = None
+        
+        # Heatmap refresh timer and the time of its last decay
+        self._heatmap_job = None
+        self._heatmap_time = 0.0
         
         # Click tracking
         self.last_click_time = 0
         self.last_click_pos = (0, 0)
         self.last_click_button = None
         self.reset_job = None
+        self._reset_deadline = 0
         
         # Mouse tracking
-        self.last_mouse_x = 0
-        self.last_mouse_y = 0
-        self.mouse_update_counter = 0
+        self.motion = MotionCoalescer(self.MOUSE_REFRESH_HZ)
+        self.motion_sample = None
+        self._motion_job = None
+        
+        # Scroll burst: accumulated (dx, dy) wheel steps
+        self._scroll_burst = [0, 0]
+        self._scroll_deadline = 0
+        self._scroll_job = None
+        self._scroll_pending = False
         
         # Selection tracking
         self.selection_start = None
         self.selection_end = None
         self.is_selecting = False
         
-        # Inline UI children
-        self._inline_children = []
+        # Input events queued by the listener threads
+        self.events = EventQueue(self.EVENT_QUEUE_SIZE)
+        self._last_event_time = time.monotonic()
+        self._drain_job = None
+    
+    def _setup_fonts(self):
+        """Create named fonts for consistent usage across renderers."""
+        self.font_input = tkfont.Font(family='Consolas', size=20)
+        self.font_mouse = tkfont.Font(family='Consolas', size=10)
+        self.font_selection = tkfont.Font(family='Consolas', size=14)
+        self.font_time = tkfont.Font(family='Arial', size=8)
+    
+    def _setup_frame_ui(self):
+        """Build the nested Frame/Label widget tree."""
+        self.frame = tk.Frame(self.root, bg=self.BG_COLOR, highlightbackground=self.BORDER_COLOR, highlightthickness=1)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        
+        self._setup_title()
+        self._setup_input_display()
+        if self.history:
+            self._setup_history_display()
+        self._setup_mouse_display()
+        self._setup_selection_display()
+        if self.heatmap:
+            self._setup_heatmap_display()
+        self._setup_led_display()
+        if self.analytics:
+            self._setup_analytics_display()
+        if self.stats:
+            self._setup_stats_display()
+        self._setup_close_button()
     
     def _setup_title(self):
         """Create the title label."""
@@ -147,12 +392,6 @@ class InputMonitorWidget:
         self.center_frame = tk.Frame(self.display_frame, bg=self.BG_COLOR)
         self.center_frame.grid(row=0, column=1)
 
-        # Named fonts for consistent usage across labels
-        self.font_input = tkfont.Font(family='Consolas', size=20)
-        self.font_mouse = tkfont.Font(family='Consolas', size=10)
-        self.font_selection = tkfont.Font(family='Consolas', size=14)
-        self.font_time = tkfont.Font(family='Arial', size=8)
-
         # Icon label for event/keys
         self.icon_label = tk.Label(self.center_frame, bg=self.BG_COLOR)
         self.icon_label.pack(side=tk.LEFT, padx=(0, 6))
@@ -168,8 +407,52 @@ class InputMonitorWidget:
         )
         self.input_label.pack(side=tk.LEFT, pady=2)
         
-        # Inline composition frame allows placing icons inline with text
+        # Inline composition frame allows placing icons inline with text.
+        # Its labels are built once and only shown/hidden afterwards.
         self.inline_frame = tk.Frame(self.center_frame, bg=self.BG_COLOR)
+        
+        def make_label(column, padx=0):
+            lbl = tk.Label(self.inline_frame, bg=self.BG_COLOR, fg=self.INPUT_COLOR, font=self.font_input)
+            lbl.grid(row=0, column=column, padx=padx)
+            return lbl
+        
+        self.inline_left_label = make_label(0)
+        self.inline_token_label = make_label(1)
+        self.inline_icon_label = make_label(2, padx=(0, 6))
+        self.inline_right_label = make_label(3)
+        self.inline_left_label.grid_remove()
+        self.inline_right_label.grid_remove()
+        
+        # Typing mode line: one label per run of plain text or token
+        self.typed_frame = tk.Frame(self.center_frame, bg=self.BG_COLOR)
+        self.typed_labels = []
+        if self.typed is not None:
+            for column in range(self.TYPED_SEGMENTS):
+                lbl = tk.Label(self.typed_frame, bg=self.BG_COLOR, fg=self.INPUT_COLOR, font=self.font_input,
+                               padx=0, bd=0)
+                lbl.grid(row=0, column=column)
+                lbl.grid_remove()
+                self.typed_labels.append(lbl)
+    
+    def heatmap_height(self):
+        """Height of the heatmap panel, padding included."""
+        return self.HEATMAP_ROWS * self.HEATMAP_ZOOM + self.HEATMAP_PADDING
+    
+    def _setup_heatmap_display(self):
+        """Create the heatmap panel showing the shared heatmap image."""
+        self.heatmap_label = tk.Label(self.frame, image=self.heatmap_image, bg=self.BG_COLOR, bd=0)
+        self.heatmap_label.pack(pady=self.HEATMAP_PADDING // 2)
+    
+    def _setup_history_display(self):
+        """Create the history ticker row; its labels are reused for every entry."""
+        self.history_frame = tk.Frame(self.frame, bg=self.BG_COLOR, height=self.HISTORY_ROW_HEIGHT)
+        self.history_frame.pack(padx=10, fill=tk.X)
+        self.history_labels = []
+        for _ in range(self.HISTORY_SLOTS):
+            lbl = tk.Label(self.history_frame, text="", bg=self.BG_COLOR, fg=self.INPUT_COLOR, font=self.font_mouse)
+            lbl.pack(side=tk.LEFT, padx=(0, 10))
+            self.history_labels.append(lbl)
+        self._history_shown = [None] * self.HISTORY_SLOTS
     
     def _setup_mouse_display(self):
         """Create the mouse position display."""
@@ -245,85 +528,111 @@ class InputMonitorWidget:
                 font=('Arial', 10)
             )
             label.pack()
+    
+    def _setup_stats_display(self):
+        """Create the instrumentation row below the LEDs."""
+        self.stats_label = tk.Label(
+            self.frame,
+            text="",
+            bg=self.BG_COLOR,
+            fg=self.STATS_COLOR,
+            font=self.font_time
+        )
+        self.stats_label.pack(pady=(0, 2))
+    
+    def _refresh_stats(self):
+        """Update the instrumentation row with the latest figures."""
+        self.stats.update_rate()
+        self.view.set('stats', self.stats.status_text(self.events.dropped))
+        self._stats_job = self.root.after(self.STATS_REFRESH_MS, self._refresh_stats)
+    
+    def _setup_analytics_display(self):
+        """Create the analytics row below the LEDs."""
+        self.analytics_label = tk.Label(
+            self.frame,
+            text="",
+            bg=self.BG_COLOR,
+            fg=self.STATS_COLOR,
+            font=self.font_time
+        )
+        self.analytics_label.pack(pady=(0, 2))
+    
+    def _refresh_analytics(self):
+        """Update the analytics row."""
+        self.view.set('analytics', self.analytics.status_text(time.time()))
+        self._analytics_job = self.root.after(self.ANALYTICS_REFRESH_MS, self._refresh_analytics)
+    
+    def _broadcast_encoders(self):
+        """Published view fields and how their values are sent to remote overlays."""
+        def led(color):
+            return color == self.LED_COLOR_ON
+        return {
+            'text': str,
+            'inline': lambda inline: None if inline is None else ' '.join(part for part in inline[:3] if part),
+            'typed': lambda runs: None if runs is None else [[text, bool(mark)] for text, mark in runs],
+            'history': lambda slots: [slot[0] if slot else None for slot in slots],
+            'mouse': str,
+            'selection': str,
+            'num_lock': led,
+            'caps_lock': led,
+            'scroll_lock': led,
+        }
+    
+    def _broadcast_appliers(self, appliers):
+        """Wrap the appliers of published fields so changes also go to the broadcast."""
+        broadcast = self.broadcast
         
-        # Start monitoring LED states
-        self._update_led_states()
+        def publish(field, apply):
+            def applier(value):
+                apply(value)
+                broadcast.state(field, value)
+            return applier
+        
+        return {field: publish(field, apply) if field in broadcast.encoders else apply
+                for field, apply in appliers.items()}
+    
+    def _setup_lock_monitor(self):
+        """Start watching keyboard lock states for the LED indicators."""
+        self.led_monitor = LockStateMonitor(
+            self.root,
+            self._on_lock_states,
+            poll_min_ms=self.LED_POLL_MIN_MS,
+            poll_max_ms=self.LED_POLL_MAX_MS,
+            force_polling=self.LED_FORCE_POLLING
+        )
+        # Opening the display connection or hook can wait until the first frame is up
+        self.root.after_idle(self.led_monitor.start)
     
     def _update_led_states(self):
-        """Update LED indicators based on keyboard lock states."""
-        try:
-            import ctypes
-            import ctypes.util
-            
-            # Windows implementation
-            if sys.platform == 'win32':
-                try:
-                    # Virtual key codes for lock keys
-                    VK_CAPITAL = 0x14  # Caps Lock
-                    VK_NUMLOCK = 0x90  # Num Lock
-                    VK_SCROLL = 0x91   # Scroll Lock
-                    
-                    # GetKeyState returns the status of the specified virtual key
-                    # The low-order bit indicates whether the key is toggled (on/off)
-                    user32 = ctypes.windll.user32
-                    
-                    caps_on = bool(user32.GetKeyState(VK_CAPITAL) & 0x0001)
-                    num_on = bool(user32.GetKeyState(VK_NUMLOCK) & 0x0001)
-                    scroll_on = bool(user32.GetKeyState(VK_SCROLL) & 0x0001)
-                    
-                    # Update LEDs
-                    self._set_led_state('caps_lock', caps_on)
-                    self._set_led_state('num_lock', num_on)
-                    self._set_led_state('scroll_lock', scroll_on)
-                except Exception:
-                    pass
-            
-            # Linux implementation using X11
-            elif sys.platform.startswith('linux'):
-                try:
-                    # Load X11 library
-                    x11 = ctypes.cdll.LoadLibrary(ctypes.util.find_library('X11'))
-                    display = x11.XOpenDisplay(None)
-                    
-                    if display:
-                        # Get keyboard state
-                        keys = (ctypes.c_char * 32)()
-                        x11.XQueryKeymap(display, keys)
-                        
-                        # XkbGetIndicatorState for LED states
-                        xkb = ctypes.cdll.LoadLibrary(ctypes.util.find_library('X11'))
-                        state = ctypes.c_uint()
-                        xkb.XkbGetIndicatorState(display, 0x100, ctypes.byref(state))
-                        
-                        # Extract LED states (bits 0, 1, 2 for Caps, Num, Scroll)
-                        caps_on = bool(state.value & 0x01)
-                        num_on = bool(state.value & 0x02)
-                        scroll_on = bool(state.value & 0x04)
-                        
-                        # Update LEDs
-                        self._set_led_state('num_lock', num_on)
-                        self._set_led_state('caps_lock', caps_on)
-                        self._set_led_state('scroll_lock', scroll_on)
-                        
-                        x11.XCloseDisplay(display)
-                except Exception:
-                    pass
-            
-        except Exception:
-            pass
-        
-        # Schedule next update
-        self.root.after(100, self._update_led_states)
+        """Re-read keyboard lock states and update LEDs if they changed."""
+        self.led_monitor.refresh()
+    
+    def _on_lock_states(self, num_on, caps_on, scroll_on):
+        """Update LED indicators from the lock state monitor."""
+        self._set_led_state('num_lock', num_on)
+        self._set_led_state('caps_lock', caps_on)
+        self._set_led_state('scroll_lock', scroll_on)
     
     def _set_led_state(self, led_id, is_on):
         """Set the visual state of an LED indicator."""
+        self.view.set(led_id, self.LED_COLOR_ON if is_on else self.LED_COLOR_OFF)
+    
+    def _apply_led(self, led_id, color):
         canvas = getattr(self, f'{led_id}_canvas', None)
         circle = getattr(self, f'{led_id}_circle', None)
         
         if canvas and circle:
-            color = self.LED_COLOR_ON if is_on else self.LED_COLOR_OFF
             canvas.itemconfig(circle, fill=color)
     
+    def _apply_num_lock(self, color):
+        self._apply_led('num_lock', color)
+    
+    def _apply_caps_lock(self, color):
+        self._apply_led('caps_lock', color)
+    
+    def _apply_scroll_lock(self, color):
+        self._apply_led('scroll_lock', color)
+    
     def _setup_close_button(self):
         """Create the close button."""
         self.close_button = tk.Button(
@@ -343,55 +652,126 @@ class InputMonitorWidget:
         self.root.bind("<ButtonRelease-1>", self.stop_drag)
         self.root.bind("<B1-Motion>", self.on_drag)
     
-    def _setup_listeners(self):
+    def _setup_listeners(self, listeners=True):
         """Setup keyboard and mouse event listeners."""
-        # Keyboard events using keyboard library
-        self.keyboard_thread = threading.Thread(target=self._keyboard_listener, daemon=True)
-        self.keyboard_thread.start()
-        
-        # Mouse events
-        self.mouse_listener = mouse.Listener(
-            on_move=self.on_mouse_move,
-            on_click=self.on_mouse_click
-        )
-        self.mouse_listener.start()
+        # Listener callbacks only queue events; the Tk main loop drains them
+        self._drain_job = self.root.after(self.EVENT_FRAME_MS, self._drain_events)
+        
+        self.input_backend = None
+        self._backend_lock = threading.Lock()
+        self._closing = False
+        self._backend_thread = None
+        if not listeners:
+            return
+        
+        # Backends (and their imports) initialise off the Tk thread, so the
+        # window is drawn without waiting for the hooks
+        self._backend_thread = threading.Thread(target=self._start_input_backend, name='backend-start', daemon=True)
+        self._backend_thread.start()
+    
+    def _start_input_backend(self):
+        """Start the input backend (runs on a helper thread)."""
+        from .backends import start_backend
+        
+        try:
+            backend = start_backend(
+                self.INPUT_BACKEND,
+                key_down=self._hook_key_down,
+                key_up=self._hook_key_up,
+                move=self._hook_mouse_move,
+                click=self._hook_mouse_click,
+                scroll=self._hook_mouse_scroll
+            )
+        except Exception as e:
+            print(f"Input capture unavailable: {e}", file=sys.stderr)
+            return
+        
+        with self._backend_lock:
+            if self._closing:
+                backend.stop()
+            else:
+                self.input_backend = backend
     
     def _load_icons(self):
-        """Load image icons from the images directory if available."""
+        """Prepare lazy icon loading; scaled variants are cached on disk."""
+        self._icons = {}
+        # Icons shown with Tk's integer scaling until their cached variant exists
+        self._fallback_icons = set()
+        # Set by the icon-cache thread once every variant is on disk
+        self._icons_ready = threading.Event()
+        self.icon_scale = self.ICON_SCALE
+        if self.icon_scale is None:
+            try:
+                self.icon_scale = self.root.winfo_fpixels('1i') / 96.0
+            except Exception:
+                self.icon_scale = 1.0
+        
+        # Make any missing cached variants off the Tk thread once the window is up
+        self.root.after_idle(self._start_icon_cache)
+    
+    def _start_icon_cache(self):
+        threading.Thread(target=self._prepare_icons, name='icon-cache', daemon=True).start()
+        self.root.after(self.ICON_POLL_MS, self._poll_icons)
+    
+    def _icon_source(self, name):
+        """Return (source path, target size in pixels) for an icon."""
+        filename, size = self.ICON_FILES[name]
+        return os.path.join(self._get_icons_directory(), filename), max(1, int(round(size * self.icon_scale)))
+    
+    def _prepare_icons(self):
+        from .icons import scaled_icon
+        
+        for name in self.ICON_FILES:
+            try:
+                source, size = self._icon_source(name)
+                if os.path.isfile(source):
+                    scaled_icon(source, size)
+            except Exception:
+                pass
+        # No Tk calls here; the Tk thread picks this up in _poll_icons
+        self._icons_ready.set()
+    
+    def _poll_icons(self):
+        if self._icons_ready.is_set():
+            self._swap_icons()
+        else:
+            self.root.after(self.ICON_POLL_MS, self._poll_icons)
+    
+    def _swap_icons(self):
+        """Drop icons loaded before their cached variant was made, so the next use loads it."""
+        for name in self._fallback_icons:
+            self._icons.pop(name, None)
+        self._fallback_icons.clear()
+    
+    def _icon(self, name):
+        """Return the PhotoImage for icon ``name``, loading it on first use, or None."""
+        if name in self._icons:
+            return self._icons[name]
+        
+        icon = None
         try:
-            base_dir = self._get_icons_directory()
-            
-            # Load icon files
-            icon_files = {
-                'win': 'windows-10-logo.png',
-                'left': 'mouse-left-click.png',
-                'right': 'mouse-right-click.png',
-                'middle': 'mouse-middle-click.png'
-            }
-            
-            icons = {}
-            for key, filename in icon_files.items():
-                path = os.path.join(base_dir, filename)
-                icons[key] = tk.PhotoImage(file=path) if os.path.isfile(path) else None
-            
-            # Scale icons to target sizes
-            self.win_icon = self._scale_icon(icons['win'], self.WIN_ICON_SIZE)
-            self.left_icon = self._scale_icon(icons['left'], self.MOUSE_ICON_SIZE)
-            self.right_icon = self._scale_icon(icons['right'], self.MOUSE_ICON_SIZE)
-            self.middle_icon = self._scale_icon(icons['middle'], self.MOUSE_ICON_SIZE)
-            self.win_icon_inline = self.win_icon
+            source, size = self._icon_source(name)
+            if os.path.isfile(source):
+                from .icons import cached_icon_path
+                
+                cached = cached_icon_path(source, size)
+                if os.path.isfile(cached):
+                    icon = tk.PhotoImage(file=cached)
+                else:
+                    # Resampling is too slow for the Tk thread; use Tk's integer
+                    # scaling until the icon-cache thread has made the variant
+                    icon = self._scale_icon(tk.PhotoImage(file=source), size)
+                    self._fallback_icons.add(name)
         except Exception:
-            # If any error occurs, simply don't use icons
-            self.win_icon = None
-            self.left_icon = None
-            self.right_icon = None
-            self.middle_icon = None
+            # If any error occurs, simply don't use the icon
+            icon = None
+        self._icons[name] = icon
+        return icon
     
     def _get_icons_directory(self):
         """Get the directory containing icon images."""
-        if getattr(sys, '_MEIPASS', None):
-            return os.path.join(getattr(sys, '_MEIPASS'), 'input_monitor', 'images')
-        return os.path.join(os.path.dirname(__file__), 'images')
+        from .icons import images_dir
+        return images_dir()
     
     def _scale_icon(self, img, target_px):
         """Scale an icon to the target size."""
@@ -415,23 +795,66 @@ class InputMonitorWidget:
         
         return img
     
-    def _keyboard_listener(self):
-        """Listen for keyboard events using keyboard library"""
-        while True:
-            try:
-                event = kb.read_event()
-            except ImportError:
-                # keyboard library cannot be used on this system (e.g., requires root on Linux)
-                return
-            except Exception:
-                # Ignore transient exceptions and try again
-                time.sleep(0.1)
-                continue
-            if event.event_type == kb.KEY_DOWN:
-                # Pass event time and scan_code along so we can order by actual press time and handle Linux meta key
-                self.on_key_press(event.name, getattr(event, 'time', None), getattr(event, 'scan_code', None))
-            elif event.event_type == kb.KEY_UP:
-                self.on_key_release(event.name, getattr(event, 'time', None), getattr(event, 'scan_code', None))
+    # Listener thread hooks: these must not touch Tk, they only queue records.
+    # They return False when the queue was full and the event was dropped.
+    
+    def _hook_key_down(self, key_name, event_time=None, scan_code=None):
+        return self.events.push((KEY_DOWN, event_time or time.time(), key_name, scan_code))
+    
+    def _hook_key_up(self, key_name, event_time=None, scan_code=None):
+        return self.events.push((KEY_UP, event_time or time.time(), key_name, scan_code))
+    
+    def _hook_mouse_move(self, x, y, event_time=None):
+        return self.events.push((MOVE, event_time or time.time(), x, y))
+    
+    def _hook_mouse_click(self, x, y, button, pressed, event_time=None):
+        return self.events.push((CLICK, event_time or time.time(), x, y, getattr(button, 'name', button), pressed))
+    
+    def _hook_mouse_scroll(self, dx, dy, event_time=None):
+        return self.events.push((SCROLL, event_time or time.time(), dx, dy))
+    
+    def _drain_events(self):
+        """Handle queued input events on the Tk main thread, one frame budget at a time."""
+        deadline = time.perf_counter() + self.EVENT_FRAME_BUDGET_MS / 1000.0
+        stats = self.stats
+        handled = 0
+        try:
+            while True:
+                batch = self.events.pop_batch(self.EVENT_BATCH_SIZE)
+                handled += len(batch)
+                if stats is None:
+                    for record in batch:
+                        self._dispatch_event(record)
+                else:
+                    for record in batch:
+                        stats.measure(self._dispatch_event, record)
+                if len(batch) < self.EVENT_BATCH_SIZE or time.perf_counter() >= deadline:
+                    break
+            if stats is not None:
+                stats.frame_done()
+        finally:
+            # Only the Tk thread schedules the drain: once per frame while events
+            # flow, backing off after a second without any
+            now = time.monotonic()
+            if handled:
+                self._last_event_time = now
+            idle = now - self._last_event_time >= self.EVENT_IDLE_AFTER_S
+            self._drain_job = self.root.after(self.EVENT_IDLE_MS if idle else self.EVENT_FRAME_MS,
+                                              self._drain_events)
+    
+    def _dispatch_event(self, record):
+        """Route one queued event record to its handler."""
+        kind = record[0]
+        if kind == MOVE:
+            self.on_mouse_move(record[2], record[3], record[1], record[4] if len(record) > 4 else None)
+        elif kind == KEY_DOWN:
+            self.on_key_press(record[2], record[1], record[3])
+        elif kind == KEY_UP:
+            self.on_key_release(record[2], record[1], record[3])
+        elif kind == CLICK:
+            self.on_mouse_click(record[2], record[3], record[4], record[5], record[1])
+        elif kind == SCROLL:
+            self.on_mouse_scroll(record[2], record[3], record[1])
     
     # Key name mappings
     SPECIAL_KEYS = {
@@ -453,105 +876,177 @@ class InputMonitorWidget:
     
     def format_key_name(self, key_name):
         """Format key name for display."""
-        # Normalize incoming key name
-        key_name = key_name.lower().replace('-', ' ').replace('_', ' ').strip()
-        
-        # Remove left/right prefix for modifiers only
-        parts = key_name.split()
-        if len(parts) > 1 and parts[0] in ('left', 'right'):
-            if parts[1] in ('ctrl', 'control', 'shift', 'alt', 'alt gr', 'windows', 'super', 'cmd'):
-                key_name = ' '.join(parts[1:])
-        
-        # Check special keys mapping
-        if key_name in self.SPECIAL_KEYS:
-            return self.SPECIAL_KEYS[key_name]
-        
-        # Single character keys
-        if len(key_name) == 1 and key_name.isalpha():
-            return key_name.upper()
-        
-        # Default formatting
-        return key_name.title()
-    
-    def _normalize_win_key(self, raw_name, scan_code):
-        """Normalize Linux Win/Meta key that may be misreported as 'alt'."""
-        if scan_code in self.WIN_SCAN_CODES:
-            if isinstance(raw_name, str) and raw_name.lower().replace(' ', '') in ('alt', 'altgr'):
-                return 'windows'
-        return raw_name
+        return self.keys.lookup(key_name)[0]
     
     def on_key_press(self, key_name, event_time=None, scan_code=None):
         """Handle key press events."""
-        # Normalize Linux Win key handling
-        raw_name = self._normalize_win_key(key_name, scan_code)
-        key_name = self.format_key_name(raw_name)
+        if self.recorder is not None:
+            self.recorder.key(KEY_DOWN, key_name, event_time, scan_code)
+        
+        key_name, modifier_bit = self.keys.lookup(key_name, scan_code)
         
         if not key_name:
             return
+        if self.broadcast is not None:
+            self.broadcast.event('k', key_name, 1)
         
         # Track key press
-        if key_name not in self.current_keys:
-            self.current_keys.add(key_name)
-            self.key_press_order.append((key_name, event_time or time.time()))
+        t = event_time or time.time()
+        changed = self.chord.press(key_name, t, modifier_bit)
+        if changed and self.analytics is not None:
+            self.analytics.key(t)
+            if not modifier_bit and self.chord.mask & ~MOD_SHIFT:
+                self.analytics.shortcut(self.chord.text)
+        if changed and self._sweep_job is None:
+            self._sweep_job = self.root.after(self.STUCK_KEY_SWEEP_MS, self._sweep_stuck_keys)
+        if changed and self.history is not None and self.chord.has_keys:
+            self._remember(self.chord.text)
+        
+        if key_name in self.LOCK_KEYS:
+            self.led_monitor.poke()
+        
+        if self.typed is not None:
+            self._type_key(key_name, modifier_bit)
+            return
         
         # Build and display key combination
         self._display_key_combination()
     
+    def _type_key(self, key_name, modifier_bit):
+        """Add a key press to the typed line (typing mode)."""
+        if modifier_bit:
+            # Modifiers only show up as part of a chord
+            return
+        if self.chord.mask & ~MOD_SHIFT:
+            self._display_key_combination()
+            return
+        
+        char = self.TYPED_KEYS.get(key_name)
+        if char is None and len(key_name) == 1:
+            # Display names of letters are upper case
+            upper = bool(self.chord.mask & MOD_SHIFT) != (self.view.get('caps_lock') == self.LED_COLOR_ON)
+            char = key_name if upper else key_name.lower()
+        
+        if char is not None:
+            self.typed.append(char)
+        elif key_name == self.SPECIAL_KEYS['backspace']:
+            self.typed.backspace()
+        else:
+            self.typed.token(key_name)
+        self._request_typed_render()
+    
+    def _request_typed_render(self):
+        # Bursts of keys in one frame are drawn once
+        if not self._typed_pending:
+            self._typed_pending = True
+            self.root.after_idle(self._render_typed)
+    
+    def _render_typed(self):
+        """Show the typed line."""
+        self._typed_pending = False
+        runs = self.typed.runs()[-self.TYPED_SEGMENTS:]
+        self.view.update(inline=None, text='', icon=None, typed=runs or None)
+        if self.captions is not None:
+            self.captions.show(''.join(text for text, _ in runs))
+        self._extend_reset()
+    
     def _display_key_combination(self):
         """Display the current key combination."""
-        ordered_keys = [k for k, t in sorted(self.key_press_order, key=lambda x: x[1])]
-        modifiers = [k for k in ordered_keys if k in self.MODIFIERS]
-        non_modifiers = [k for k in ordered_keys if k not in self.MODIFIERS]
+        chord = self.chord
+        if not chord.display:
+            return
+        
+        if self.typed is not None:
+            # Chords are tokens in the typed line
+            self.typed.token(chord.text)
+            self._request_typed_render()
+            return
         
         icon = None
-        has_win = 'Win' in modifiers or 'Win' in non_modifiers
-        
-        if non_modifiers:
-            keys = modifiers + non_modifiers
-            key_text = " + ".join(keys)
-            if has_win:
-                icon = getattr(self, 'win_icon', None)
-            self.show_input(key_text, icon=icon)
-        elif modifiers:
-            modifiers_text = " + ".join(modifiers)
-            if len(modifiers) == 1 and has_win:
-                icon = getattr(self, 'win_icon', None)
-            self.show_input(f"{modifiers_text} + ...", icon=icon)
+        if chord.mask & MOD_WIN:
+            # A lone Win modifier, or Win with other keys
+            if chord.has_keys or chord.mask == MOD_WIN:
+                icon = self._icon('win')
+        self.show_input(chord.display, icon=icon)
     
     def on_key_release(self, key_name, event_time=None, scan_code=None):
         """Handle key release events."""
-        raw_name = self._normalize_win_key(key_name, scan_code)
-        key_name = self.format_key_name(raw_name)
-        
-        if key_name in self.current_keys:
-            self.current_keys.remove(key_name)
-            self.key_press_order = [(k, t) for (k, t) in self.key_press_order if k != key_name]
-    
-    def on_mouse_move(self, x, y):
-        # Calculate delta
-        delta_x = x - self.last_mouse_x
-        delta_y = y - self.last_mouse_y
-        
-        # Update last position
-        self.last_mouse_x = x
-        self.last_mouse_y = y
-        
-        # Update counter
-        self.mouse_update_counter += 1
-        
-        # Update display every few events to avoid too frequent updates
-        if self.mouse_update_counter >= self.MOUSE_UPDATE_THRESHOLD:
-            self.mouse_update_counter = 0
-            self.mouse_label.config(
-                text=f"X: {x}, Y: {y} | ΔX: {delta_x}, ΔY: {delta_y}"
-            )
+        if self.recorder is not None:
+            self.recorder.key(KEY_UP, key_name, event_time, scan_code)
+        
+        key_name, modifier_bit = self.keys.lookup(key_name, scan_code)
+        if key_name and self.broadcast is not None:
+            self.broadcast.event('k', key_name, 0)
+        self.chord.release(key_name, modifier_bit)
+    
+    def _sweep_stuck_keys(self):
+        """Forget keys whose release event was lost."""
+        backend = self.input_backend
+        if backend is not None and not backend.key_repeat:
+            # A key held without repeats is not stuck, however long it is quiet
+            self._sweep_job = None
+            return
+        self.chord.sweep(time.time(), self.STUCK_KEY_TIMEOUT)
+        if len(self.chord):
+            self._sweep_job = self.root.after(self.STUCK_KEY_SWEEP_MS, self._sweep_stuck_keys)
+        else:
+            self._sweep_job = None
+    
+    def on_mouse_move(self, x, y, event_time=None, trail=None):
+        """Handle mouse move events; ``trail`` holds earlier (t, x, y) samples merged into this one."""
+        if trail:
+            # Every sample is recorded and measured, though only the latest is displayed
+            recorder = self.recorder
+            analytics = self.analytics
+            heatmap = self.heatmap
+            for t, tx, ty in trail:
+                if recorder is not None:
+                    recorder.move(tx, ty, t)
+                self.motion.add(tx, ty, t)
+                if analytics is not None:
+                    analytics.move(tx, ty)
+                if heatmap is not None:
+                    heatmap.add(tx, ty)
+        if self.recorder is not None:
+            self.recorder.move(x, y, event_time)
+        
+        self.motion.add(x, y, event_time or time.time())
+        if self.analytics is not None:
+            self.analytics.move(x, y)
+        
+        if self.heatmap is not None:
+            self.heatmap.add(x, y)
+            if self._heatmap_job is None:
+                self._heatmap_time = time.monotonic()
+                self._heatmap_job = self.root.after(self.HEATMAP_FRAME_MS, self._heatmap_tick)
         
         # Update selection if we're in the middle of selecting
         if self.is_selecting and self.selection_start:
             self.selection_end = (x, y)
+        
+        # Readouts are refreshed at MOUSE_REFRESH_HZ, however fast the mouse polls
+        if self._motion_job is None:
+            self._motion_job = self.root.after(int(1000 / self.MOUSE_REFRESH_HZ), self._render_motion)
+    
+    def _render_motion(self):
+        """Show the motion accumulated since the previous refresh."""
+        sample = self.motion.flush()
+        if sample is None:
+            self._motion_job = None
+            return
+        
+        self.motion_sample = sample
+        self.view.set(
+            'mouse',
+            f"X: {sample.x}, Y: {sample.y} | ΔX: {sample.dx}, ΔY: {sample.dy} | {sample.velocity:.0f} px/s (peak {sample.peak_speed:.0f})"
+        )
+        
+        if self.is_selecting and self.selection_start and self.selection_end:
             width = abs(self.selection_end[0] - self.selection_start[0])
             height = abs(self.selection_end[1] - self.selection_start[1])
-            self.selection_label.config(text=f"Selection: {width} x {height}")
+            self.view.set('selection', f"Selection: {width} x {height}")
+        
+        self._motion_job = self.root.after(int(1000 / self.MOUSE_REFRESH_HZ), self._render_motion)
     
     def _is_double_click(self, x, y, button, current_time):
         """Check if this is a double click."""
@@ -560,151 +1055,284 @@ class InputMonitorWidget:
                 abs(y - self.last_click_pos[1]) < self.DOUBLE_CLICK_POSITION_TOLERANCE and
                 self.last_click_button == button)
     
-    def on_mouse_click(self, x, y, button, pressed):
+    def on_mouse_click(self, x, y, button, pressed, event_time=None):
         """Handle mouse click events."""
+        # Accept either a pynput Button or its name
+        button = getattr(button, 'name', button)
+        if self.recorder is not None:
+            self.recorder.click(x, y, button, pressed, event_time)
+        if self.broadcast is not None:
+            self.broadcast.event('c', button, 1 if pressed else 0, x, y)
+        
         if pressed:
-            current_time = time.time()
+            current_time = event_time or time.time()
             
-            if button == mouse.Button.left:
+            if button == 'left':
                 self._handle_left_click(x, y, current_time)
-            elif button == mouse.Button.right:
-                self.show_input("Right Click", icon=getattr(self, 'right_icon', None))
-            elif button == mouse.Button.middle:
+            elif button == 'right':
+                self.show_input("Right Click", icon=self._icon('right'))
+                self._remember("Right Click")
+                if self.analytics is not None:
+                    self.analytics.click('right', False, current_time)
+            elif button == 'middle':
                 self._handle_middle_click(x, y, current_time)
+            elif button in self.SIDE_BUTTON_NAMES:
+                text = f"{self.SIDE_BUTTON_NAMES[button]} Click"
+                self.show_input(text, icon=self._icon(button))
+                self._remember(text)
+                if self.analytics is not None:
+                    self.analytics.click(button, False, current_time)
         else:
-            if button == mouse.Button.left and self.is_selecting:
-                self._end_selection()
+            if button == 'left' and self.is_selecting:
+                self._end_selection(event_time)
+    
+    def on_mouse_scroll(self, dx, dy, event_time=None):
+        """Handle wheel steps; they add up into a burst shown once per frame."""
+        if self.recorder is not None:
+            self.recorder.scroll(dx, dy, event_time)
+        if self.broadcast is not None:
+            self.broadcast.event('w', dx, dy)
+        
+        burst = self._scroll_burst
+        for axis, delta in ((0, dx), (1, dy)):
+            if delta:
+                if burst[axis] * delta < 0:
+                    # Changing direction starts a new burst on that axis
+                    burst[axis] = 0
+                burst[axis] += delta
+        
+        self._scroll_deadline = time.monotonic() + self.SCROLL_BURST_TIMEOUT_MS / 1000.0
+        if self._scroll_job is None:
+            self._scroll_job = self.root.after(self.SCROLL_BURST_TIMEOUT_MS, self._on_scroll_timer)
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after_idle(self._render_scroll)
+    
+    def _scroll_text(self):
+        dx, dy = self._scroll_burst
+        parts = []
+        if dy:
+            parts.append(f"{'↑' if dy > 0 else '↓'} ×{abs(dy)}")
+        if dx:
+            parts.append(f"{'→' if dx > 0 else '←'} ×{abs(dx)}")
+        return "Scroll " + "  ".join(parts) if parts else ""
+    
+    def _render_scroll(self):
+        self._scroll_pending = False
+        text = self._scroll_text()
+        if text:
+            self.show_input(text, icon=self._icon('scroll'))
+    
+    def _on_scroll_timer(self):
+        """End the burst once the wheel has been idle long enough."""
+        remaining_ms = int((self._scroll_deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            self._scroll_job = self.root.after(remaining_ms, self._on_scroll_timer)
+            return
+        self._scroll_job = None
+        text = self._scroll_text()
+        if text:
+            self._remember(text)
+        self._scroll_burst = [0, 0]
     
     def _handle_left_click(self, x, y, current_time):
         """Handle left mouse button click."""
         # Start selection
         self.selection_start = (x, y)
         self.is_selecting = True
-        self.selection_label.config(text="Selection: 0 x 0")
+        if self.recorder is not None:
+            self.recorder.selection(SELECT_START, x, y, current_time)
+        self.view.set('selection', "Selection: 0 x 0")
         
         # Check for double click
-        if self._is_double_click(x, y, mouse.Button.left, current_time):
-            self.show_input("Left Double Click", icon=getattr(self, 'left_icon', None))
-        else:
-            self.show_input("Left Click", icon=getattr(self, 'left_icon', None))
+        double = self._is_double_click(x, y, 'left', current_time)
+        text = "Left Double Click" if double else "Left Click"
+        self.show_input(text, icon=self._icon('left'))
+        self._remember(text)
+        if self.analytics is not None:
+            self.analytics.click('left', double, current_time)
         
         self.last_click_time = current_time
         self.last_click_pos = (x, y)
-        self.last_click_button = mouse.Button.left
+        self.last_click_button = 'left'
     
     def _handle_middle_click(self, x, y, current_time):
         """Handle middle mouse button click."""
-        if self._is_double_click(x, y, mouse.Button.middle, current_time):
-            self.show_input("Middle Double Click", icon=getattr(self, 'middle_icon', None))
-        else:
-            self.show_input("Middle Click", icon=getattr(self, 'middle_icon', None))
+        double = self._is_double_click(x, y, 'middle', current_time)
+        text = "Middle Double Click" if double else "Middle Click"
+        self.show_input(text, icon=self._icon('middle'))
+        self._remember(text)
+        if self.analytics is not None:
+            self.analytics.click('middle', double, current_time)
         
         self.last_click_time = current_time
         self.last_click_pos = (x, y)
-        self.last_click_button = mouse.Button.middle
+        self.last_click_button = 'middle'
     
-    def _end_selection(self):
+    def _end_selection(self, event_time=None):
         """End the current selection."""
         self.is_selecting = False
+        if self.recorder is not None and self.selection_end:
+            self.recorder.selection(SELECT_END, self.selection_end[0], self.selection_end[1], event_time)
         if self.selection_start and self.selection_end:
             width = abs(self.selection_end[0] - self.selection_start[0])
             height = abs(self.selection_end[1] - self.selection_start[1])
             
             if width > self.SELECTION_MIN_SIZE or height > self.SELECTION_MIN_SIZE:
                 self.show_input(f"Selected Area: {width} x {height}")
+                if self.analytics is not None:
+                    self.analytics.selection(width, height)
     
     def show_input(self, input_text, icon=None):
         """Display input text and optional icon."""
-        # Cancel any pending reset
-        if self.reset_job:
-            self.root.after_cancel(self.reset_job)
-        
-        self._clear_inline_children()
-        
         # Check if we should display inline (Win key with icon)
-        if icon and 'Win' in input_text:
-            self._display_inline_icon(input_text, icon)
-        else:
-            self._display_standard(input_text, icon)
+        inline = self._split_inline(input_text) if icon and 'Win' in input_text else None
         
-        self.reset_job = self.root.after(self.RESET_DELAY_MS, self.reset_display)
+        if inline:
+            self.view.update(typed=None, text='', font=self.font_input, icon=None, inline=inline + (icon,))
+        else:
+            # Use selection font for 'Selected Area' messages
+            font = self.font_selection if input_text.startswith('Selected Area') else self.font_input
+            self.view.update(typed=None, inline=None, text=input_text, font=font, icon=icon)
+        if self.captions is not None:
+            self.captions.show(input_text)
+        self._extend_reset()
     
-    def _clear_inline_children(self):
-        """Clear all inline child widgets."""
-        for child in self._inline_children:
-            try:
-                child.destroy()
-            except Exception:
-                pass
-        self._inline_children = []
+    def _extend_reset(self):
+        """Clear the display RESET_DELAY_MS after the latest input."""
+        # Unchanged input (e.g. key auto-repeat) only extends the reset timer
+        self._reset_deadline = time.monotonic() + self.RESET_DELAY_MS / 1000.0
+        if self.reset_job is None:
+            self.reset_job = self.root.after(self.RESET_DELAY_MS, self._on_reset_timer)
+    
+    def _on_reset_timer(self):
+        """Reset the display once the latest input has been shown long enough."""
+        remaining_ms = int((self._reset_deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            self.reset_job = self.root.after(remaining_ms, self._on_reset_timer)
+        else:
+            self.reset_display()
     
-    def _display_inline_icon(self, input_text, icon):
-        """Display text with inline Win icon."""
+    def _remember(self, text):
+        """Add an entry to the history ticker (history mode)."""
+        if self.history is None:
+            return
+        self.history.push(text, time.monotonic())
+        # One shared timer animates every slot; it stops once all have faded
+        if self._history_job is None:
+            self._history_job = self.root.after_idle(self._history_tick)
+    
+    def _history_tick(self):
+        """Redraw the history slots with their current fade step."""
+        lifetime = self.HISTORY_FADE_MS / 1000.0
+        steps = self.HISTORY_FADE_STEPS
+        entries = self.history.entries(time.monotonic(), lifetime)
+        slots = [None] * self.HISTORY_SLOTS
+        for index, (text, age) in enumerate(entries):
+            slots[index] = (text, self.history_colors[min(int(age / lifetime * steps), steps - 1)])
+        self.view.set('history', tuple(slots))
+        self._history_job = self.root.after(self.HISTORY_FRAME_MS, self._history_tick) if entries else None
+    
+    def _heatmap_tick(self):
+        """Fade the heatmap and redraw it; the timer stops once it has faded out."""
+        now = time.monotonic()
+        self.heatmap.decay(now - self._heatmap_time)
+        self._heatmap_time = now
+        if self.heatmap.peak() < self.HEATMAP_FLOOR:
+            self.heatmap.clear()
+            self._heatmap_job = None
+        else:
+            self._heatmap_job = self.root.after(self.HEATMAP_FRAME_MS, self._heatmap_tick)
+        self.heatmap_image.put(self.heatmap.ppm())
+    
+    def _split_inline(self, input_text):
+        """Split text around the 'Win' token as (left, token, right), or None."""
         match = re.search(r'\bWin\b', input_text)
         if not match:
-            self._display_standard(input_text, icon)
-            return
-        
-        self.icon_label.config(image='')
-        self.icon_label.image = None
-        self.input_label.config(text='')
-        self.inline_frame.pack(side=tk.LEFT, pady=2)
-        
+            return None
         start, end = match.span()
-        left_text = input_text[:start].rstrip()
-        token_text = input_text[start:end]
-        right_text = input_text[end:].lstrip()
+        return (input_text[:start].rstrip(), input_text[start:end], input_text[end:].lstrip())
+    
+    def _apply_text(self, text):
+        self.input_label.config(text=text)
+    
+    def _apply_font(self, font):
+        self.input_label.config(font=font)
+    
+    def _apply_icon(self, icon):
+        self.icon_label.config(image=icon or '')
+        self.icon_label.image = icon
+    
+    def _apply_mouse(self, text):
+        self.mouse_label.config(text=text)
+    
+    def _apply_selection(self, text):
+        self.selection_label.config(text=text)
+    
+    def _apply_stats(self, text):
+        self.stats_label.config(text=text)
+    
+    def _apply_analytics(self, text):
+        self.analytics_label.config(text=text)
+    
+    def _apply_inline(self, inline):
+        """Display text with inline Win icon, or hide the inline layout."""
+        if inline is None:
+            self.inline_frame.pack_forget()
+            return
         
-        def make_label(text):
-            lbl = tk.Label(self.inline_frame, text=text, bg=self.BG_COLOR, fg=self.INPUT_COLOR, 
-                         font=self.input_label.cget('font'))
-            lbl.pack(side=tk.LEFT)
-            self._inline_children.append(lbl)
+        left_text, token_text, right_text, icon = inline
         
         if left_text:
-            make_label(left_text + ' ')
-        make_label(token_text + ' ')
+            self.inline_left_label.config(text=left_text + ' ')
+            self.inline_left_label.grid()
+        else:
+            self.inline_left_label.grid_remove()
         
-        # Icon inline
-        icon_lbl = tk.Label(self.inline_frame, bg=self.BG_COLOR, image=icon)
-        icon_lbl.image = icon
-        icon_lbl.pack(side=tk.LEFT, padx=(0, 6))
-        self._inline_children.append(icon_lbl)
+        self.inline_token_label.config(text=token_text + ' ')
+        self.inline_icon_label.config(image=icon)
+        self.inline_icon_label.image = icon
         
         if right_text:
-            make_label(' ' + right_text)
-    
-    def _display_standard(self, input_text, icon):
-        """Display text in standard format."""
-        try:
-            self.inline_frame.pack_forget()
-        except Exception:
-            pass
+            self.inline_right_label.config(text=' ' + right_text)
+            self.inline_right_label.grid()
+        else:
+            self.inline_right_label.grid_remove()
         
-        # Use selection font for 'Selected Area' messages
-        font = self.font_selection if input_text.startswith('Selected Area') else self.font_input
-        self.input_label.config(font=font, text=input_text)
+        self.inline_frame.pack(side=tk.LEFT, pady=2)
+    
+    def _apply_history(self, slots):
+        for index, slot in enumerate(slots):
+            # Only slots whose text or fade step changed are touched
+            if slot == self._history_shown[index]:
+                continue
+            self._history_shown[index] = slot
+            text, color = slot or ('', self.BG_COLOR)
+            self.history_labels[index].config(text=text, fg=color)
+    
+    def _apply_typed(self, runs):
+        """Show the typed line's runs, or hide it."""
+        if runs is None:
+            self.typed_frame.pack_forget()
+            return
         
-        # Update icon
-        if icon:
-            self.icon_label.config(image=icon)
-            self.icon_label.image = icon
-        else:
-            self.icon_label.config(image='')
-            self.icon_label.image = None
+        for index, lbl in enumerate(self.typed_labels):
+            if index < len(runs):
+                text, is_token = runs[index]
+                lbl.config(text=text, fg=self.TYPED_TOKEN_COLOR if is_token else self.INPUT_COLOR)
+                lbl.grid()
+            else:
+                lbl.grid_remove()
+        self.typed_frame.pack(side=tk.LEFT, pady=2)
     
     def reset_display(self):
         """Reset the display to empty state."""
-        self.input_label.config(text="", font=self.font_input)
-        self.icon_label.config(image='')
-        self.icon_label.image = None
         self.reset_job = None
-        
-        self._clear_inline_children()
-        try:
-            self.inline_frame.pack_forget()
-        except Exception:
-            pass
+        if self.typed is not None:
+            self.typed.clear()
+        self.view.update(typed=None, inline=None, text="", font=self.font_input, icon=None)
+        if self.captions is not None:
+            self.captions.clear()
     
     def start_drag(self, event):
         self._drag_start_x = event.x
@@ -720,17 +1348,142 @@ class InputMonitorWidget:
         self.root.geometry(f"+{x}+{y}")
     
     def close_app(self):
-        self.mouse_listener.stop()
+        with self._backend_lock:
+            self._closing = True
+            backend = self.input_backend
+        if backend is not None:
+            backend.stop()
+        self.led_monitor.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.captions is not None:
+            self.captions.close()
+        if self.broadcast is not None:
+            self.broadcast.close()
+        if self.analytics is not None:
+            try:
+                self.analytics.dump(self.analytics_path)
+            except Exception:
+                pass
         self.root.destroy()
 
 
-def main():
+def main(argv=None):
     """Entry point for CLI or Python module execution. Starts the GUI loop."""
+    import argparse
+    import signal
+    
+    parser = argparse.ArgumentParser(prog='input-monitor', description='On-screen keyboard and mouse input monitor.')
+    parser.add_argument('--stats', nargs='?', const='', default=None, metavar='PATH',
+                        help='show latency/throughput figures and dump them on exit (to PATH, or stderr)')
+    parser.add_argument('--analytics', nargs='?', const='', default=None, metavar='PATH',
+                        help='show keys per minute and the top shortcut, and write session analytics on exit '
+                             '(JSON, or CSV for a .csv PATH; stderr without PATH)')
+    parser.add_argument('--captions', metavar='PATH',
+                        help='write what is displayed as a subtitle track (WebVTT, or SRT for a .srt PATH)')
+    parser.add_argument('--captions-offset', type=float, default=None, metavar='SECONDS',
+                        help='add this to the caption times, e.g. how long the screen recording ran before')
+    parser.add_argument('--serve', nargs='?', const='', default=None, metavar='[HOST:]PORT',
+                        help='serve events and display state over WebSocket, with an overlay page at / '
+                             f'(default: {InputMonitorWidget.BROADCAST_HOST}:{InputMonitorWidget.BROADCAST_PORT})')
+    parser.add_argument('--multicast', nargs='?', const='', default=None, metavar='[GROUP:]PORT',
+                        help='send events and display state as UDP multicast (default: '
+                             f'{InputMonitorWidget.BROADCAST_MULTICAST_GROUP}:{InputMonitorWidget.BROADCAST_PORT})')
+    parser.add_argument('--typing', action='store_true',
+                        help='show typed text as a rolling line, with chords highlighted in it')
+    parser.add_argument('--history', action='store_true',
+                        help='show a ticker of the last few combos and clicks')
+    parser.add_argument('--heatmap', action='store_true',
+                        help='show a fading heatmap of where the mouse moves (needs NumPy)')
+    parser.add_argument('--profile', choices=('cpu', 'alloc', 'both'),
+                        help='sample thread stacks and/or track allocations; written on exit and on SIGUSR1')
+    parser.add_argument('--profile-out', default='input-monitor-profile', metavar='DIR',
+                        help='directory for profile output (default: %(default)s)')
+    parser.add_argument('--profile-interval', type=float, default=5.0, metavar='MS',
+                        help='stack sampling interval (default: %(default)s ms)')
+    parser.add_argument('--alloc-every', type=float, default=10.0, metavar='MINUTES',
+                        help='allocation snapshot interval (default: %(default)s minutes)')
+    parser.add_argument('--startup-report', nargs='?', const='text', choices=('text', 'json'),
+                        help='print startup phase times and the slowest imports, then exit')
+    args = parser.parse_args(argv)
+    
+    serve = multicast = None
+    if args.serve is not None or args.multicast is not None:
+        from .broadcast import parse_address
+        if args.serve is not None:
+            serve = parse_address(args.serve, InputMonitorWidget.BROADCAST_HOST, InputMonitorWidget.BROADCAST_PORT)
+        if args.multicast is not None:
+            multicast = parse_address(args.multicast, InputMonitorWidget.BROADCAST_MULTICAST_GROUP,
+                                      InputMonitorWidget.BROADCAST_PORT)
+    
+    timer = None
+    if args.startup_report:
+        from .startup import StartupTimer
+        timer = StartupTimer()
+        timer.mark('main')
+    
+    profiler = None
+    if args.profile:
+        from .profiler import Profiler
+        profiler = Profiler(args.profile, args.profile_out, args.profile_interval / 1000.0, args.alloc_every)
+        profiler.start()
+    
     root = tk.Tk()
     # Keep a persistent reference to the widget on the root to avoid
     # being garbage-collected and to allow access from external code.
-    root._app = InputMonitorWidget(root)
-    root.mainloop()
+    root._app = InputMonitorWidget(
+        root,
+        stats=args.stats is not None or None,
+        stats_path=args.stats or None,
+        analytics=args.analytics is not None or None,
+        analytics_path=args.analytics or None,
+        captions_path=args.captions,
+        captions_offset=args.captions_offset,
+        serve=serve,
+        multicast=multicast,
+        typing=args.typing or None,
+        history=args.history or None,
+        heatmap=args.heatmap or None
+    )
+    if timer is not None:
+        _schedule_startup_report(root, timer, args.startup_report)
+    if hasattr(signal, 'SIGTERM'):
+        # Leave mainloop through the finally below, as Ctrl+C does
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    try:
+        root.mainloop()
+    finally:
+        # Here rather than in close_app, so counters survive signals and a
+        # destroyed root window
+        app = root._app
+        if app.stats is not None:
+            try:
+                app.stats.dump(app.stats_path, app.events)
+            except Exception:
+                pass
+        if profiler is not None:
+            for path in profiler.stop():
+                print(f"Profile written to {path}", file=sys.stderr)
+
+
+def _schedule_startup_report(root, timer, output):
+    """Time the first frame and the listeners, print the report and quit."""
+    timer.mark('widget')
+    root.update()
+    timer.mark('first_frame')
+    
+    def wait_for_listeners():
+        thread = root._app._backend_thread
+        if thread is not None and thread.is_alive():
+            root.after(10, wait_for_listeners)
+            return
+        timer.mark('listeners')
+        report = timer.report()
+        import json
+        print(json.dumps(report, indent=2) if output == 'json' else timer.format(report))
+        root._app.close_app()
+    
+    root.after(0, wait_for_listeners)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Input capture backends.
+
+A backend captures keyboard and mouse events and reports them through four
+hook callables, which may be called from any thread:
+
+    key_down(name, event_time, scan_code)
+    key_up(name, event_time, scan_code)
+    move(x, y, event_time)
+    click(x, y, button, pressed, event_time)
+    scroll(dx, dy, event_time)
+
+``button`` is a name ('left', 'right', 'middle', 'x1', 'x2'); scroll deltas
+are wheel steps, positive up and to the right. Backends are
+imported only when started, so their dependencies are only needed if used.
+"""
+import os
+import sys
+
+BACKEND_NAMES = ('auto', 'x11', 'hooks', 'helper')
+
+
+class InputBackend:
+    """Base class for input capture backends."""
+
+    name = ''
+    # Held keys report auto-repeat presses, so a key that stays quiet for long
+    # had its release lost
+    key_repeat = True
+
+    def __init__(self, key_down, key_up, move, click, scroll=None):
+        self.key_down = key_down
+        self.key_up = key_up
+        self.move = move
+        self.click = click
+        self.scroll = scroll or (lambda dx, dy, event_time=None: None)
+
+    def start(self):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+def _backend_class(name):
+    if name == 'x11':
+        from .x11 import X11Backend
+        return X11Backend
+    if name == 'hooks':
+        from .hooks import HookBackend
+        return HookBackend
+    if name == 'helper':
+        from .helper import HelperBackend
+        return HelperBackend
+    raise ValueError(f'unknown input backend: {name}')
+
+
+def start_backend(name, **hooks):
+    """Create and start the backend ``name`` ('auto' picks the best available)."""
+    if name != 'auto':
+        backend = _backend_class(name)(**hooks)
+        backend.start()
+        return backend
+
+    candidates = []
+    if sys.platform.startswith('linux') and os.environ.get('DISPLAY'):
+        candidates.append('x11')
+    candidates.append('hooks')
+
+    for candidate in candidates[:-1]:
+        try:
+            backend = _backend_class(candidate)(**hooks)
+            backend.start()
+            return backend
+        except Exception:
+            continue
+    backend = _backend_class(candidates[-1])(**hooks)
+    backend.start()
+    return backend
@@ -0,0 +1,154 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Backend that receives events from the out-of-process capture helper.
+
+By default the helper is launched as a child process (through pkexec or
+sudo when not already root) and streams over its stdout. Setting
+``INPUT_MONITOR_HELPER_SOCKET`` to a path makes the GUI listen on that Unix
+socket instead and wait for a helper started separately with
+``python -m input_monitor.helper --connect PATH``. The launcher can be
+overridden with ``INPUT_MONITOR_HELPER_LAUNCHER`` (e.g. "sudo -n"); set it
+to an empty string to run the helper unprivileged.
+
+A privileged helper runs ``python -I``, so it imports nothing from the
+user's environment, and is only launched when the interpreter and the
+installed package are root-owned and writable by no one else.
+"""
+import glob
+import os
+import shlex
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import sysconfig
+import threading
+
+from . import InputBackend
+from ..helper import HelperReader
+
+
+def _default_launcher():
+    if sys.platform == 'win32' or os.geteuid() == 0:
+        return []
+    if shutil.which('pkexec'):
+        return ['pkexec']
+    return ['sudo']
+
+
+def _root_owned(path):
+    """True if ``path`` and the directories above it are owned by root and writable only by root."""
+    path = os.path.realpath(path)
+    while True:
+        st = os.stat(path)
+        if st.st_uid != 0 or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+        parent = os.path.dirname(path)
+        if parent == path:
+            return True
+        path = parent
+
+
+def _check_privileged_install():
+    """Raise unless root would only run root-owned code for the helper."""
+    package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    site_dirs = {os.path.realpath(sysconfig.get_path(name)) for name in ('purelib', 'platlib')}
+    paths = [sys.executable, package, os.path.join(package, 'backends')]
+    paths += glob.glob(os.path.join(package, '*.py')) + glob.glob(os.path.join(package, 'backends', '*.py'))
+    if os.path.realpath(os.path.dirname(package)) not in site_dirs or not all(_root_owned(path) for path in paths):
+        raise RuntimeError('the privileged helper needs input-monitor installed system-wide by root; '
+                           'or run "python -m input_monitor.helper --connect PATH" yourself')
+
+
+class HelperBackend(InputBackend):
+    """Receive input events from ``input_monitor.helper``."""
+
+    name = 'helper'
+
+    def __init__(self, key_down, key_up, move, click, scroll=None):
+        super().__init__(key_down, key_up, move, click, scroll)
+        self.socket_path = os.environ.get('INPUT_MONITOR_HELPER_SOCKET') or None
+        launcher = os.environ.get('INPUT_MONITOR_HELPER_LAUNCHER')
+        self.launcher = _default_launcher() if launcher is None else shlex.split(launcher)
+        self.process = None
+        self._server = None
+        self._conn = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            # Created owner-only, so no other user can connect and inject events
+            umask = os.umask(0o177)
+            try:
+                self._server.bind(self.socket_path)
+            finally:
+                os.umask(umask)
+            self._server.listen(1)
+            target = self._serve_socket
+        else:
+            self.process = subprocess.Popen(self._helper_command(), stdout=subprocess.PIPE, bufsize=0)
+            target = self._serve_pipe
+        self._thread = threading.Thread(target=target, name='helper-reader', daemon=True)
+        self._thread.start()
+
+    def _helper_command(self):
+        command = [sys.executable, '-m', 'input_monitor.helper']
+        if self.launcher and sys.platform != 'win32':
+            # Isolated mode: no PYTHONPATH, user site-packages or working directory
+            _check_privileged_install()
+            command.insert(1, '-I')
+            # pkexec/sudo scrub the environment; pass on what the hooks need
+            env = []
+            for name in ('DISPLAY', 'XAUTHORITY', 'WAYLAND_DISPLAY'):
+                if os.environ.get(name):
+                    env.append(f'{name}={os.environ[name]}')
+            command = ['env'] + env + command
+        return self.launcher + command
+
+    def _reader(self, read):
+        return HelperReader(read, self.key_down, self.key_up, self.move, self.click, self.scroll,
+                            stopped=self._stopped.is_set)
+
+    def _serve_pipe(self):
+        try:
+            self._reader(self.process.stdout.read).run()
+        except Exception:
+            pass
+
+    def _serve_socket(self):
+        try:
+            self._conn, _ = self._server.accept()
+            self._reader(self._conn.recv).run()
+        except Exception:
+            pass
+
+    def stop(self):
+        self._stopped.set()
+        # Closing our end makes the helper's next write (or heartbeat) fail, so
+        # it exits on its own even when it runs as root
+        for closeable in (self._conn, self._server):
+            if closeable is not None:
+                try:
+                    closeable.close()
+                except Exception:
+                    pass
+        if self.process is not None:
+            try:
+                self.process.stdout.close()
+            except Exception:
+                pass
+        if self.socket_path and os.path.exists(self.socket_path):
+            try:
+                os.unlink(self.socket_path)
+            except Exception:
+                pass
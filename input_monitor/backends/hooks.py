@@ -0,0 +1,88 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+pynput + keyboard library backend.
+
+Mouse events come from a ``pynput.mouse.Listener``; keyboard events from
+the ``keyboard`` library's blocking ``read_event()`` loop on its own thread.
+On Linux the ``keyboard`` library needs root; without it only the mouse is
+captured.
+"""
+import threading
+import time
+
+from . import InputBackend
+
+# pynput's names for the side buttons on X11
+BUTTON_ALIASES = {'button8': 'x1', 'button9': 'x2'}
+
+
+class HookBackend(InputBackend):
+    """Capture input with pynput (mouse) and the keyboard library (keys)."""
+
+    name = 'hooks'
+
+    def __init__(self, key_down, key_up, move, click, scroll=None):
+        super().__init__(key_down, key_up, move, click, scroll)
+        self.keyboard_thread = None
+        self.mouse_listener = None
+        self.keyboard_available = None
+
+    def start(self):
+        from pynput import mouse
+
+        # Keyboard events using keyboard library
+        self.keyboard_thread = threading.Thread(target=self._keyboard_listener, daemon=True)
+        self.keyboard_thread.start()
+
+        # Mouse events
+        self.mouse_listener = mouse.Listener(
+            on_move=self._on_move,
+            on_click=self._on_click,
+            on_scroll=self._on_scroll
+        )
+        self.mouse_listener.start()
+
+    def stop(self):
+        if self.mouse_listener is not None:
+            self.mouse_listener.stop()
+
+    def _on_move(self, x, y):
+        self.move(x, y, time.time())
+
+    def _on_click(self, x, y, button, pressed):
+        name = getattr(button, 'name', button)
+        self.click(x, y, BUTTON_ALIASES.get(name, name), pressed, time.time())
+
+    def _on_scroll(self, x, y, dx, dy):
+        self.scroll(dx, dy, time.time())
+
+    def _keyboard_listener(self):
+        """Listen for keyboard events using keyboard library"""
+        try:
+            import keyboard as kb
+        except ImportError:
+            self.keyboard_available = False
+            return
+
+        while True:
+            try:
+                event = kb.read_event()
+            except ImportError:
+                # keyboard library cannot be used on this system (e.g., requires root on Linux)
+                self.keyboard_available = False
+                return
+            except Exception:
+                # Ignore transient exceptions and try again
+                time.sleep(0.1)
+                continue
+            self.keyboard_available = True
+            if event.event_type == kb.KEY_DOWN:
+                # Pass event time and scan_code along so we can order by actual press time and handle Linux meta key
+                self.key_down(event.name, getattr(event, 'time', None), getattr(event, 'scan_code', None))
+            elif event.event_type == kb.KEY_UP:
+                self.key_up(event.name, getattr(event, 'time', None), getattr(event, 'scan_code', None))
@@ -0,0 +1,202 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Unified X11 backend using XInput2 raw events.
+
+Keyboard and mouse are captured from one X connection on one thread, with no
+root privileges. Raw events are selected on the root window, so they arrive
+whichever client has focus. Key names come from the keymap, scan codes are
+the X keycode minus 8 (the evdev code, as reported by the keyboard library)
+and timestamps are taken from the server.
+"""
+import ctypes
+import os
+import select
+import threading
+import time
+
+from .. import xlib
+from . import InputBackend
+
+# X keysym names that differ from the keyboard library's key names
+KEYSYM_NAMES = {
+    'Control_L': 'ctrl', 'Control_R': 'right ctrl',
+    'Shift_L': 'shift', 'Shift_R': 'right shift',
+    'Alt_L': 'alt', 'Alt_R': 'right alt', 'ISO_Level3_Shift': 'alt gr', 'Mode_switch': 'alt gr',
+    'Super_L': 'windows', 'Super_R': 'right windows',
+    'Meta_L': 'windows', 'Meta_R': 'right windows',
+    'Return': 'enter', 'KP_Enter': 'enter', 'Escape': 'esc', 'BackSpace': 'backspace',
+    'ISO_Left_Tab': 'tab', 'Prior': 'page up', 'Next': 'page down', 'Print': 'print screen',
+    'Caps_Lock': 'caps lock', 'Num_Lock': 'num lock', 'Scroll_Lock': 'scroll lock',
+    'comma': ',', 'period': '.', 'slash': '/', 'backslash': '\\', 'semicolon': ';',
+    'apostrophe': "'", 'grave': '`', 'minus': '-', 'equal': '=',
+    'bracketleft': '[', 'bracketright': ']',
+}
+
+# X button numbers -> button names
+BUTTON_NAMES = {1: 'left', 2: 'middle', 3: 'right', 8: 'x1', 9: 'x2'}
+
+# Wheel steps arrive as presses of buttons 4-7 -> (dx, dy)
+SCROLL_BUTTONS = {4: (0, 1), 5: (0, -1), 6: (-1, 0), 7: (1, 0)}
+
+# X keycodes are evdev scan codes offset by 8
+KEYCODE_OFFSET = 8
+
+
+class X11Backend(InputBackend):
+    """Capture keyboard and mouse through XInput2 raw events."""
+
+    name = 'x11'
+    # Raw key events are not repeated while a key is held
+    key_repeat = False
+
+    def __init__(self, key_down, key_up, move, click, scroll=None):
+        super().__init__(key_down, key_up, move, click, scroll)
+        self._x11 = None
+        self._display = None
+        self._root = None
+        self._opcode = None
+        self._thread = None
+        self._wake_r = self._wake_w = None
+        self._key_names = {}
+        self._time_offset = None
+
+    def start(self):
+        x11 = xlib.load_x11()
+        xi = xlib.load_xi()
+
+        display = x11.XOpenDisplay(None)
+        if not display:
+            raise OSError('cannot open X display')
+        try:
+            opcode, event, error = ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+            if not x11.XQueryExtension(display, b'XInputExtension',
+                                       ctypes.byref(opcode), ctypes.byref(event), ctypes.byref(error)):
+                raise OSError('XInput extension not available')
+
+            # Raw events on the root window need XI 2.1 or later
+            major, minor = ctypes.c_int(2), ctypes.c_int(2)
+            if xi.XIQueryVersion(display, ctypes.byref(major), ctypes.byref(minor)) != 0 or \
+                    (major.value, minor.value) < (2, 1):
+                raise OSError('XInput 2.1 not available')
+
+            root = x11.XDefaultRootWindow(display)
+            mask_bytes = (ctypes.c_ubyte * ((xlib.XI_LASTEVENT >> 3) + 1))()
+            for evtype in (xlib.XI_RawKeyPress, xlib.XI_RawKeyRelease, xlib.XI_RawButtonPress,
+                           xlib.XI_RawButtonRelease, xlib.XI_RawMotion):
+                mask_bytes[evtype >> 3] |= 1 << (evtype & 7)
+            mask = xlib.XIEventMask(xlib.XIAllMasterDevices, len(mask_bytes), mask_bytes)
+            xi.XISelectEvents(display, root, ctypes.byref(mask), 1)
+            x11.XFlush(display)
+        except Exception:
+            x11.XCloseDisplay(display)
+            raise
+
+        self._x11 = x11
+        self._display = display
+        self._root = root
+        self._opcode = opcode.value
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, name='x11-input', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        os.write(self._wake_w, b'x')
+        self._thread.join(1.0)
+        self._thread = None
+
+    def _run(self):
+        """Read X events on the backend thread until stopped."""
+        x11 = self._x11
+        display = self._display
+        fd = x11.XConnectionNumber(display)
+        event = xlib.XEvent()
+        cookie = ctypes.byref(event.xcookie)
+
+        try:
+            while True:
+                if not x11.XPending(display):
+                    readable, _, _ = select.select([fd, self._wake_r], [], [])
+                    if self._wake_r in readable:
+                        return
+                    continue
+
+                motion_time = None
+                while x11.XPending(display):
+                    x11.XNextEvent(display, ctypes.byref(event))
+                    if event.type != xlib.GenericEvent or event.xcookie.extension != self._opcode:
+                        continue
+                    if not x11.XGetEventData(display, cookie):
+                        continue
+                    try:
+                        raw = ctypes.cast(event.xcookie.data, ctypes.POINTER(xlib.XIRawEvent)).contents
+                        evtype = event.xcookie.evtype
+                        if evtype == xlib.XI_RawMotion:
+                            # Position is queried once per batch of motion events
+                            motion_time = raw.time
+                        elif evtype == xlib.XI_RawKeyPress or evtype == xlib.XI_RawKeyRelease:
+                            keycode = raw.detail
+                            hook = self.key_down if evtype == xlib.XI_RawKeyPress else self.key_up
+                            hook(self._key_name(keycode), self._event_time(raw.time), keycode - KEYCODE_OFFSET)
+                        elif raw.detail in SCROLL_BUTTONS:
+                            if evtype == xlib.XI_RawButtonPress:
+                                dx, dy = SCROLL_BUTTONS[raw.detail]
+                                self.scroll(dx, dy, self._event_time(raw.time))
+                        else:
+                            button = BUTTON_NAMES.get(raw.detail)
+                            if button is not None:
+                                if motion_time is not None:
+                                    self._emit_motion(motion_time)
+                                    motion_time = None
+                                x, y = self._pointer()
+                                self.click(x, y, button, evtype == xlib.XI_RawButtonPress,
+                                           self._event_time(raw.time))
+                    finally:
+                        x11.XFreeEventData(display, cookie)
+
+                if motion_time is not None:
+                    self._emit_motion(motion_time)
+        finally:
+            x11.XCloseDisplay(display)
+            self._display = None
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def _emit_motion(self, server_time):
+        x, y = self._pointer()
+        self.move(x, y, self._event_time(server_time))
+
+    def _pointer(self):
+        """Query the pointer position on the root window."""
+        root_ret, child_ret = ctypes.c_ulong(), ctypes.c_ulong()
+        root_x, root_y, win_x, win_y = ctypes.c_int(), ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+        mask = ctypes.c_uint()
+        self._x11.XQueryPointer(self._display, self._root, ctypes.byref(root_ret), ctypes.byref(child_ret),
+                                ctypes.byref(root_x), ctypes.byref(root_y),
+                                ctypes.byref(win_x), ctypes.byref(win_y), ctypes.byref(mask))
+        return root_x.value, root_y.value
+
+    def _key_name(self, keycode):
+        """Return the keyboard-library style name for an X keycode."""
+        name = self._key_names.get(keycode)
+        if name is None:
+            keysym = self._x11.XkbKeycodeToKeysym(self._display, keycode, 0, 0)
+            text = self._x11.XKeysymToString(keysym) if keysym else None
+            text = text.decode('ascii', 'replace') if text else ''
+            name = KEYSYM_NAMES.get(text, text)
+            self._key_names[keycode] = name
+        return name
+
+    def _event_time(self, server_ms):
+        """Convert a server timestamp (ms, wraps every ~49 days) to epoch seconds."""
+        now = time.time()
+        offset = self._time_offset
+        if offset is None or abs(server_ms / 1000.0 + offset - now) > 5.0:
+            offset = self._time_offset = now - server_ms / 1000.0
+        return server_ms / 1000.0 + offset
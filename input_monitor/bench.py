@@ -0,0 +1,392 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Benchmarks for the event -> paint pipeline.
+
+Each scenario builds a fresh widget with its input listeners disabled and
+feeds synthetic events through the input hooks from a separate thread, at
+the scenario's rate, while the Tk main loop drains and renders them, as
+with real hardware. Tk is real when a display is available (a private Xvfb
+server is started when ``Xvfb`` is installed and there is no display),
+otherwise the in-process stub from ``tkstub`` is used.
+
+Per scenario the report has:
+
+    events_per_s        events handled per second of Tk-thread CPU time
+    cpu_us_per_event    Tk-thread CPU time per event
+    tk_calls_per_event  Tcl round trips per event
+    latency_ms          p50/p99/max from the event timestamp to the end of
+                        the widget update that shows it
+
+    python -m input_monitor.bench --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from .events import MOVE
+from .version import VERSION
+
+# Time each scenario runs for, in seconds
+DEFAULT_DURATION = 2.0
+
+MOUSE_RATES = (125, 500, 1000, 8000)
+
+
+def _chords(rate):
+    """Ctrl + Shift + <letter> chords, ``rate`` chords per second."""
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    index = 0
+    while True:
+        key = letters[index % len(letters)]
+        index += 1
+        yield 0.0, ('key_down', 'ctrl', 29)
+        yield 0.0, ('key_down', 'shift', 42)
+        yield 0.0, ('key_down', key, None)
+        yield 0.5 / rate, ('key_up', key, None)
+        yield 0.0, ('key_up', 'shift', 42)
+        yield 0.5 / rate, ('key_up', 'ctrl', 29)
+
+
+def _auto_repeat(rate):
+    """A held key auto-repeating ``rate`` times per second."""
+    while True:
+        yield 1.0 / rate, ('key_down', 'a', 30)
+
+
+def _mouse(rate):
+    """Mouse moves at ``rate`` Hz, tracing a square."""
+    x = y = 0
+    while True:
+        for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1)):
+            for _ in range(200):
+                x += dx
+                y += dy
+                yield 1.0 / rate, ('move', x, y)
+
+
+def _wheel(rate):
+    """A free-spinning wheel: ``rate`` steps per second, alternating direction every 2 s."""
+    while True:
+        for dy in (-1, 1):
+            for _ in range(rate * 2):
+                yield 1.0 / rate, ('scroll', 0, dy)
+
+
+def _drag(rate):
+    """Left-button selection drags with 1000 Hz moves."""
+    while True:
+        x, y = 100, 100
+        yield 0.0, ('click', x, y, 'left', True)
+        for _ in range(rate // 2):
+            x += 2
+            y += 1
+            yield 1.0 / rate, ('move', x, y)
+        yield 0.0, ('click', x, y, 'left', False)
+        yield 0.2, ('move', x, y)
+
+
+SCENARIOS = {
+    'key_chords': lambda: _chords(20),
+    'key_auto_repeat': lambda: _auto_repeat(30),
+    'selection_drag': lambda: _drag(1000),
+    'scroll_burst': lambda: _wheel(500),
+}
+for _rate in MOUSE_RATES:
+    SCENARIOS[f'mouse_{_rate}hz'] = (lambda rate: lambda: _mouse(rate))(_rate)
+SCENARIOS['history_burst'] = lambda: _chords(50)
+SCENARIOS['heatmap_1000hz'] = lambda: _mouse(1000)
+SCENARIOS['led_states'] = None
+
+# Widget options per scenario
+SCENARIO_OPTIONS = {
+    'history_burst': {'history': True},
+    'heatmap_1000hz': {'heatmap': True},
+}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def _latency_summary(latencies):
+    latencies.sort()
+    if not latencies:
+        return {'p50': None, 'p99': None, 'max': None}
+    return {
+        'p50': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99': round(percentile(latencies, 0.99) * 1000, 3),
+        'max': round(latencies[-1] * 1000, 3),
+    }
+
+
+class _Probe:
+    """Wrap a widget's dispatch and motion refresh to timestamp completions."""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.latencies = []
+        self.handled = 0
+        self._pending_moves = []
+        dispatch = widget._dispatch_event
+        render_motion = widget._render_motion
+
+        def probed_dispatch(record):
+            dispatch(record)
+            self.handled += 1
+            if record[0] == MOVE:
+                # Shown by the next motion refresh
+                self._pending_moves.append(record[1])
+            else:
+                self.latencies.append(time.time() - record[1])
+
+        def probed_render_motion():
+            render_motion()
+            if self._pending_moves:
+                now = time.time()
+                self.latencies.extend(now - t for t in self._pending_moves)
+                self._pending_moves = []
+
+        widget._dispatch_event = probed_dispatch
+        widget._render_motion = probed_render_motion
+
+
+def _inject(widget, events, duration, stop):
+    """Call the widget's input hooks on schedule (listener thread stand-in)."""
+    hooks = {
+        'key_down': widget._hook_key_down,
+        'key_up': widget._hook_key_up,
+        'move': widget._hook_mouse_move,
+        'click': widget._hook_mouse_click,
+        'scroll': widget._hook_mouse_scroll,
+    }
+    start = time.perf_counter()
+    due = 0.0
+    for delay, (name, *args) in events:
+        due += delay
+        if due >= duration or stop.is_set():
+            break
+        wait = due - (time.perf_counter() - start)
+        # Sleeps shorter than a millisecond are not worth it; send the batch
+        if wait > 0.001:
+            time.sleep(wait)
+        if name == 'key_down' or name == 'key_up':
+            hooks[name](args[0], None, args[1])
+        else:
+            hooks[name](*args)
+
+
+def _run_led_scenario(widget, duration):
+    """Toggle the lock LEDs and re-read the lock states on the Tk thread."""
+    root = widget.root
+    calls_before = root.tk.calls
+    latencies = []
+    count = 0
+    cpu_start = time.thread_time()
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        t = time.perf_counter()
+        widget._on_lock_states(count & 1 == 0, count & 2 == 0, count & 4 == 0)
+        widget._update_led_states()
+        root.update_idletasks()
+        latencies.append(time.perf_counter() - t)
+        count += 1
+        # The states change on key presses, not continuously
+        time.sleep(0.002)
+    cpu = time.thread_time() - cpu_start
+    return count, cpu, root.tk.calls - calls_before, latencies, {}
+
+
+def _run_event_scenario(widget, events, duration):
+    root = widget.root
+    probe = _Probe(widget)
+    stop = threading.Event()
+
+    def injector():
+        _inject(widget, events, duration, stop)
+
+    def wait_for_injector():
+        # Polled from the Tk thread; Tk is not touched from the injector
+        if thread.is_alive():
+            root.after(50, wait_for_injector)
+        else:
+            # Leave time for the last frame and motion refresh
+            root.after(200, root.quit)
+
+    calls_before = root.tk.calls
+    cpu_start = time.thread_time()
+    thread = threading.Thread(target=injector, name='bench-injector', daemon=True)
+    thread.start()
+    root.after(50, wait_for_injector)
+    try:
+        root.mainloop()
+    finally:
+        stop.set()
+        thread.join()
+    cpu = time.thread_time() - cpu_start
+    queue = widget.events
+    # Costs are per input event, including those coalesced on the way
+    extra = {'handled': probe.handled, 'coalesced': queue.coalesced, 'dropped': queue.dropped}
+    return queue.received, cpu, root.tk.calls - calls_before, probe.latencies, extra
+
+
+def run_scenario(name, tk_module, duration=DEFAULT_DURATION, renderer=None):
+    """Run one scenario and return its result dict."""
+    from .app import InputMonitorWidget
+
+    root = tk_module.Tk()
+    _count_tk_calls(root)
+    try:
+        widget = InputMonitorWidget(root, renderer=renderer, listeners=False, **SCENARIO_OPTIONS.get(name, {}))
+        root.update()
+        if name == 'led_states':
+            count, cpu, calls, latencies, extra = _run_led_scenario(widget, duration)
+        else:
+            count, cpu, calls, latencies, extra = _run_event_scenario(widget, SCENARIOS[name](), duration)
+        widget.close_app()
+    except Exception:
+        try:
+            root.destroy()
+        except Exception:
+            pass
+        raise
+
+    result = {
+        'events': count,
+        'events_per_s': round(count / cpu, 1) if cpu > 0 else None,
+        'cpu_us_per_event': round(cpu / count * 1e6, 3) if count else None,
+        'tk_calls_per_event': round(calls / count, 3) if count else None,
+        'latency_ms': _latency_summary(latencies),
+    }
+    result.update(extra)
+    return result
+
+
+class _CountingInterpreter:
+    """Proxy for a real ``tkapp`` that counts Tcl calls."""
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+def _count_tk_calls(root):
+    # Widgets and fonts pick up the interpreter from the root when created
+    if not hasattr(root.tk, 'calls'):
+        root.tk = _CountingInterpreter(root.tk)
+
+
+def _start_xvfb():
+    """Start a private Xvfb server and point DISPLAY at it, or return None."""
+    xvfb = shutil.which('Xvfb')
+    if not xvfb:
+        return None
+    for number in range(99, 120):
+        if os.path.exists(f'/tmp/.X11-unix/X{number}') or os.path.exists(f'/tmp/.X{number}-lock'):
+            continue
+        process = subprocess.Popen([xvfb, f':{number}', '-screen', '0', '1920x1080x24', '-nolisten', 'tcp'],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if os.path.exists(f'/tmp/.X11-unix/X{number}'):
+                os.environ['DISPLAY'] = f':{number}'
+                return process
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
+        process.kill()
+    return None
+
+
+def select_tk(force_stub=False):
+    """Return (tk module, description, cleanup) for the benchmark run."""
+    from . import tkstub
+
+    if not force_stub:
+        server = None
+        if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+            server = _start_xvfb()
+        try:
+            import tkinter
+
+            tkinter.Tk().destroy()
+            kind = 'xvfb' if server else 'display'
+            return tkinter, kind, (server.terminate if server else lambda: None)
+        except Exception:
+            if server:
+                server.terminate()
+
+    tkstub.install()
+    return tkstub, 'stub', lambda: None
+
+
+def run(scenarios=None, duration=DEFAULT_DURATION, renderer=None, force_stub=False):
+    """Run the scenarios and return the JSON-serialisable report."""
+    tk_module, tk_kind, cleanup = select_tk(force_stub)
+    try:
+        results = {}
+        for name in scenarios or SCENARIOS:
+            results[name] = run_scenario(name, tk_module, duration, renderer)
+    finally:
+        cleanup()
+    return {
+        'version': VERSION,
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'tk': tk_kind,
+        'renderer': renderer or 'frame',
+        'duration_s': duration,
+        'scenarios': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-bench',
+        description='Benchmark the input monitor event -> paint pipeline.'
+    )
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO',
+                        help='scenarios to run (default: all of ' + ', '.join(SCENARIOS) + ')')
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION,
+                        help=f'seconds per scenario (default: {DEFAULT_DURATION})')
+    parser.add_argument('--renderer', choices=('frame', 'canvas'))
+    parser.add_argument('--stub-tk', action='store_true', help='use the stub Tk layer even with a display')
+    parser.add_argument('--output', metavar='PATH', help='write the JSON report here (default: stdout)')
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error('unknown scenario: ' + ', '.join(unknown))
+
+    report = run(args.scenarios, args.duration, args.renderer, args.stub_tk)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
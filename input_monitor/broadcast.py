@@ -0,0 +1,370 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Event and display-state broadcast for remote overlays (``--serve``,
+``--multicast``).
+
+An asyncio loop on its own thread serves WebSocket clients (and, at ``/``,
+a minimal overlay page for an OBS browser source) and/or sends UDP
+multicast datagrams. The Tk thread only records changed display fields and
+normalised events; once per frame they are encoded and handed to the loop
+as one compact JSON message:
+
+    {"q": 12, "t": 5230, "s": {"text": "Ctrl + C", "caps_lock": true}, "e": [["k", "C", 1]]}
+
+``q`` is a sequence number, ``t`` milliseconds since start, ``s`` the
+display fields that changed (a delta) and ``e`` the events of the frame:
+``["k", key, down]``, ``["c", button, pressed, x, y]``, ``["w", dx, dy]``.
+A message with ``"k": 1`` is a keyframe carrying the full state; clients get
+one on connect, UDP receivers about once a second.
+
+Each WebSocket client has a bounded queue and its own writer task. A client
+that falls behind has its backlog discarded and is sent a keyframe when it
+catches up, so a slow client costs only itself.
+"""
+import asyncio
+import base64
+import collections
+import hashlib
+import json
+import socket
+import struct
+import sys
+import threading
+import time
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OVERLAY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Input Monitor</title>
+<style>
+body { margin: 0; background: transparent; font-family: Consolas, monospace; color: #00ff00; }
+#text { font-size: 32px; min-height: 40px; text-shadow: 0 0 4px #000; }
+#mouse { font-size: 14px; color: #00ccff; }
+.led { display: inline-block; margin-right: 12px; font-size: 12px; color: #888; }
+.led.on { color: #00ff00; }
+</style></head>
+<body><div id="text"></div><div id="mouse"></div>
+<span class="led" id="num_lock">NUM</span><span class="led" id="caps_lock">CAPS</span><span class="led" id="scroll_lock">SCROLL</span>
+<script>
+let state = {};
+function render() {
+  const typed = state.typed ? state.typed.map(run => run[0]).join('') : null;
+  document.getElementById('text').textContent = state.inline || typed || state.text || '';
+  document.getElementById('mouse').textContent = state.mouse || '';
+  for (const led of ['num_lock', 'caps_lock', 'scroll_lock'])
+    document.getElementById(led).className = state[led] ? 'led on' : 'led';
+}
+function connect() {
+  const ws = new WebSocket('ws://' + location.host + '/ws');
+  ws.onmessage = (message) => {
+    const frame = JSON.parse(message.data);
+    if (frame.s) state = frame.k ? frame.s : Object.assign(state, frame.s);
+    render();
+  };
+  ws.onclose = () => setTimeout(connect, 1000);
+}
+connect();
+</script></body></html>
+"""
+
+
+def parse_address(value, default_host, default_port):
+    """'host:port', 'port' or 'host' as (host, port)."""
+    if not value:
+        return default_host, default_port
+    host, _, port = value.rpartition(':')
+    if not host and not port.isdigit():
+        return port, default_port
+    return host or default_host, int(port)
+
+
+def _ws_frame(payload, opcode=0x1):
+    """One unmasked, final server frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+class _Client:
+    """A WebSocket client's outgoing queue; filled by the loop, drained by its writer task."""
+
+    def __init__(self, writer, size):
+        self.writer = writer
+        self.size = size
+        self.messages = collections.deque()
+        self.wake = asyncio.Event()
+        # Deltas were discarded; the next write must be a keyframe (the first one too)
+        self.resync = True
+        self.resyncs = 0
+        self.wake.set()
+
+    def send(self, frame):
+        if self.resync:
+            self.wake.set()
+            return
+        if len(self.messages) >= self.size:
+            self.messages.clear()
+            self.resync = True
+            self.resyncs += 1
+        else:
+            self.messages.append(frame)
+        self.wake.set()
+
+
+class Broadcaster:
+    """Publish display state and events to WebSocket and/or UDP multicast clients."""
+
+    FRAME_MS = 16
+    # Frames a client may fall behind before its backlog is replaced by a keyframe
+    CLIENT_QUEUE = 64
+    MAX_EVENTS_PER_FRAME = 512
+    KEYFRAME_INTERVAL = 1.0
+    MAX_CLIENT_FRAME = 65536
+
+    def __init__(self, root, encoders, serve=None, multicast=None):
+        """``encoders`` maps published fields to functions turning their values into JSON types;
+        ``serve`` and ``multicast`` are (host, port) addresses or None."""
+        self.root = root
+        self.encoders = encoders
+        self.serve = serve
+        self.multicast = multicast
+        self.address = None
+        self.dropped_events = 0
+
+        # Tk thread side: what changed since the last frame
+        self._pending = {}
+        self._events = []
+        self._job = None
+        self._started = time.monotonic()
+
+        # Loop side
+        self._state = {}
+        self._seq = 0
+        self._clients = set()
+        self._server = None
+        self._udp = None
+
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='broadcast', daemon=True)
+        self._thread.start()
+
+    # Tk thread
+
+    def state(self, field, value):
+        """A published display field changed."""
+        self._pending[field] = value
+        if self._job is None:
+            self._job = self.root.after(self.FRAME_MS, self._flush)
+
+    def event(self, *fields):
+        """Queue a normalised input event for this frame."""
+        if len(self._events) < self.MAX_EVENTS_PER_FRAME:
+            self._events.append(fields)
+        else:
+            self.dropped_events += 1
+        if self._job is None:
+            self._job = self.root.after(self.FRAME_MS, self._flush)
+
+    def _flush(self):
+        self._job = None
+        encoders = self.encoders
+        state = {field: encoders[field](value) for field, value in self._pending.items()}
+        events = self._events
+        self._pending = {}
+        self._events = []
+        t = int((time.monotonic() - self._started) * 1000)
+        try:
+            self.loop.call_soon_threadsafe(self._publish, t, state, events)
+        except RuntimeError:
+            # The loop has been closed
+            pass
+
+    # Loop thread
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._start())
+        except Exception as e:
+            print(f"Broadcast unavailable: {e}", file=sys.stderr)
+            self._ready.set()
+            self.loop.close()
+            return
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self._shutdown())
+            self.loop.close()
+
+    async def _start(self):
+        if self.serve:
+            self._server = await asyncio.start_server(self._handle_client, self.serve[0], self.serve[1])
+            self.address = self._server.sockets[0].getsockname()[:2]
+        if self.multicast:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+            sock.setblocking(False)
+            self._udp, _ = await self.loop.create_datagram_endpoint(asyncio.DatagramProtocol, sock=sock)
+            self.loop.create_task(self._keyframes())
+
+    async def _shutdown(self):
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._clients):
+            client.writer.close()
+        tasks = [task for task in asyncio.all_tasks(self.loop) if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._udp is not None:
+            self._udp.close()
+
+    def _message(self, t, state, events, keyframe=False):
+        message = {'q': self._seq, 't': t}
+        if keyframe:
+            message['k'] = 1
+        if state or keyframe:
+            message['s'] = state
+        if events:
+            message['e'] = events
+        return json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def _publish(self, t, state, events):
+        self._seq += 1
+        self._state.update(state)
+        payload = self._message(t, state, events)
+        if self._clients:
+            frame = _ws_frame(payload)
+            for client in self._clients:
+                client.send(frame)
+        if self._udp is not None:
+            self._udp.sendto(payload, self.multicast)
+
+    def _keyframe(self):
+        t = int((time.monotonic() - self._started) * 1000)
+        return self._message(t, self._state, None, keyframe=True)
+
+    async def _keyframes(self):
+        while True:
+            await asyncio.sleep(self.KEYFRAME_INTERVAL)
+            self._udp.sendto(self._keyframe(), self.multicast)
+
+    async def _handle_client(self, reader, writer):
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode('latin-1').split('\r\n')
+        path = lines[0].split(' ')[1] if len(lines[0].split(' ')) > 1 else '/'
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        key = headers.get('sec-websocket-key')
+        if headers.get('upgrade', '').lower() != 'websocket' or not key:
+            if path == '/':
+                body = OVERLAY_PAGE.encode('utf-8')
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n'
+                             b'Content-Length: %d\r\nConnection: close\r\n\r\n' % len(body) + body)
+            else:
+                writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+            return
+
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        writer.write(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                      f'Sec-WebSocket-Accept: {accept}\r\n\r\n').encode('ascii'))
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        client = _Client(writer, self.CLIENT_QUEUE)
+        self._clients.add(client)
+        sender = self.loop.create_task(self._send_loop(client))
+        try:
+            await self._receive_loop(reader, writer)
+        except asyncio.CancelledError:
+            # Shutting down
+            pass
+        finally:
+            self._clients.discard(client)
+            sender.cancel()
+            writer.close()
+
+    async def _send_loop(self, client):
+        writer = client.writer
+        try:
+            while True:
+                await client.wake.wait()
+                client.wake.clear()
+                if client.resync:
+                    client.resync = False
+                    client.messages.clear()
+                    writer.write(_ws_frame(self._keyframe()))
+                while client.messages:
+                    writer.write(client.messages.popleft())
+                # Waits on this client's socket only
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    async def _receive_loop(self, reader, writer):
+        """Read client frames, answering pings, until the client closes."""
+        while True:
+            try:
+                head = await reader.readexactly(2)
+                opcode, length = head[0] & 0x0F, head[1] & 0x7F
+                if length == 126:
+                    length = struct.unpack('!H', await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack('!Q', await reader.readexactly(8))[0]
+                if length > self.MAX_CLIENT_FRAME:
+                    return
+                mask = await reader.readexactly(4) if head[1] & 0x80 else b'\0\0\0\0'
+                data = await reader.readexactly(length)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+            if opcode == 0x8:
+                writer.write(_ws_frame(payload[:2], 0x8))
+                return
+            if opcode == 0x9:
+                writer.write(_ws_frame(payload, 0xA))
+
+    def wait_ready(self, timeout=None):
+        """Wait until the endpoints are up (or failed to start)."""
+        return self._ready.wait(timeout)
+
+    def close(self):
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+        if not self.loop.is_closed():
+            try:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+            except RuntimeError:
+                pass
+        self._thread.join(1.0)
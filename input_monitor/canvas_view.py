@@ -0,0 +1,340 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Single-Canvas renderer.
+
+Draws the whole overlay on one ``tk.Canvas`` (text items, image items and
+oval LEDs) and updates it with ``itemconfig``/``coords`` only, so no geometry
+manager runs on the hot path. Layouts (full, compact, ticker) only move and
+hide items, they never rebuild them.
+"""
+import tkinter as tk
+
+
+class CanvasRenderer:
+    """Render the widget's view fields onto a single canvas."""
+
+    # Layout name -> window size
+    LAYOUTS = {
+        'full': (360, 200),
+        'compact': (300, 90),
+        'ticker': (720, 40),
+    }
+    LAYOUT_ORDER = ('full', 'compact', 'ticker')
+
+    ICON_GAP = 6
+    LED_SPACING = 56
+    LED_IDS = (('num_lock', 'Num'), ('caps_lock', 'Caps'), ('scroll_lock', 'Scroll'))
+
+    def __init__(self, widget, layout='full'):
+        self.widget = widget
+        self.root = widget.root
+        self.layout = None
+        self.width, self.height = self.LAYOUTS[layout]
+
+        self._text = ''
+        self._font = widget.font_input
+        self._icon = None
+        self._inline = None
+        self._typed = None
+        self._row_pending = False
+
+        w = widget
+        self.canvas = tk.Canvas(
+            self.root, bg=w.BG_COLOR, highlightbackground=w.BORDER_COLOR, highlightthickness=1, bd=0
+        )
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        c = self.canvas
+        self.title_item = c.create_text(0, 0, text="Input Monitor", fill=w.TEXT_COLOR,
+                                        font=('Arial', 10, 'bold'), tags=('title',))
+        self.close_item = c.create_text(0, 0, text="×", fill=w.TEXT_COLOR,
+                                        font=('Arial', 12, 'bold'), tags=('close',))
+        c.tag_bind('close', '<ButtonRelease-1>', lambda event: w.close_app())
+
+        # Input row: icon + text, or the inline Win strip
+        self.icon_item = c.create_image(0, 0, anchor=tk.W, tags=('input',))
+        self.text_item = c.create_text(0, 0, anchor=tk.W, text='', fill=w.INPUT_COLOR,
+                                       font=w.font_input, tags=('input',))
+        self.inline_items = [
+            c.create_text(0, 0, anchor=tk.W, fill=w.INPUT_COLOR, font=w.font_input,
+                          state=tk.HIDDEN, tags=('input', 'inline')),
+            c.create_text(0, 0, anchor=tk.W, fill=w.INPUT_COLOR, font=w.font_input,
+                          state=tk.HIDDEN, tags=('input', 'inline')),
+            c.create_image(0, 0, anchor=tk.W, state=tk.HIDDEN, tags=('input', 'inline')),
+            c.create_text(0, 0, anchor=tk.W, fill=w.INPUT_COLOR, font=w.font_input,
+                          state=tk.HIDDEN, tags=('input', 'inline')),
+        ]
+
+        # Typing mode line: one item per run of plain text or token
+        self.typed_items = [
+            c.create_text(0, 0, anchor=tk.W, fill=w.INPUT_COLOR, font=w.font_input,
+                          state=tk.HIDDEN, tags=('input', 'typed'))
+            for _ in range(w.TYPED_SEGMENTS if w.typed is not None else 0)
+        ]
+
+        self.mouse_item = c.create_text(0, 0, anchor=tk.W, text="X: 0, Y: 0 | ΔX: 0, ΔY: 0",
+                                        fill=w.MOUSE_COLOR, font=w.font_mouse, tags=('mouse',))
+        self.selection_item = c.create_text(0, 0, anchor=tk.W, text="Selection: 0 x 0",
+                                            fill=w.SELECTION_COLOR, font=w.font_mouse, tags=('selection',))
+
+        # Heatmap panel (heatmap mode), below the layout
+        self.heatmap_item = None
+        if w.heatmap is not None:
+            self.heatmap_item = c.create_image(0, 0, anchor=tk.N, image=w.heatmap_image, tags=('heatmap',))
+
+        # History ticker row (history mode), below the heatmap
+        self.history_items = [
+            c.create_text(0, 0, anchor=tk.W, text='', fill=w.INPUT_COLOR, font=w.font_mouse, tags=('history',))
+            for _ in range(w.HISTORY_SLOTS if w.history is not None else 0)
+        ]
+        self._history_shown = [None] * len(self.history_items)
+        self._history_y = 0
+
+        # Analytics row (--analytics), above the stats row
+        self.analytics_item = c.create_text(0, 0, anchor=tk.W, text='', fill=w.STATS_COLOR, font=w.font_time,
+                                            state=tk.NORMAL if w.analytics else tk.HIDDEN, tags=('analytics',))
+
+        # Instrumentation row along the bottom edge (--stats)
+        self.stats_item = c.create_text(0, 0, anchor=tk.W, text='', fill=w.STATS_COLOR, font=w.font_time,
+                                        state=tk.NORMAL if w.stats else tk.HIDDEN, tags=('stats',))
+
+        self.led_items = {}
+        for led_id, label_text in self.LED_IDS:
+            oval = c.create_oval(0, 0, w.LED_SIZE, w.LED_SIZE, fill=w.LED_COLOR_OFF, outline='', tags=('leds',))
+            label = c.create_text(0, 0, text=label_text, fill=w.TEXT_COLOR, font=('Arial', 10), tags=('leds',))
+            self.led_items[led_id] = (oval, label)
+
+        # Right click cycles through the layouts
+        c.bind('<Button-3>', self.next_layout)
+
+        self.set_layout(layout)
+
+    def appliers(self):
+        """Return the view field appliers for ``ViewModel``."""
+        return {
+            'text': self._apply_text,
+            'font': self._apply_font,
+            'icon': self._apply_icon,
+            'inline': self._apply_inline,
+            'typed': self._apply_typed,
+            'history': self._apply_history,
+            'mouse': self._apply_mouse,
+            'selection': self._apply_selection,
+            'num_lock': lambda color: self._apply_led('num_lock', color),
+            'caps_lock': lambda color: self._apply_led('caps_lock', color),
+            'scroll_lock': lambda color: self._apply_led('scroll_lock', color),
+            'stats': self._apply_stats,
+            'analytics': self._apply_analytics,
+        }
+
+    # Field appliers
+
+    def _apply_text(self, text):
+        self._text = text
+        self.canvas.itemconfig(self.text_item, text=text)
+        self._request_row_layout()
+
+    def _apply_font(self, font):
+        self._font = font
+        self.canvas.itemconfig(self.text_item, font=font)
+        self._request_row_layout()
+
+    def _apply_icon(self, icon):
+        self._icon = icon
+        self.canvas.itemconfig(self.icon_item, image=icon or '')
+        self._request_row_layout()
+
+    def _apply_inline(self, inline):
+        self._inline = inline
+        c = self.canvas
+        if inline is None:
+            c.itemconfig('inline', state=tk.HIDDEN)
+        else:
+            left_text, token_text, right_text, icon = inline
+            left, token, icon_item, right = self.inline_items
+            c.itemconfig(left, text=left_text + ' ' if left_text else '')
+            c.itemconfig(token, text=token_text + ' ')
+            c.itemconfig(icon_item, image=icon)
+            c.itemconfig(right, text=' ' + right_text if right_text else '')
+            c.itemconfig('inline', state=tk.NORMAL)
+        self._request_row_layout()
+
+    def _apply_mouse(self, text):
+        self.canvas.itemconfig(self.mouse_item, text=text)
+
+    def _apply_selection(self, text):
+        self.canvas.itemconfig(self.selection_item, text=text)
+
+    def _apply_led(self, led_id, color):
+        self.canvas.itemconfig(self.led_items[led_id][0], fill=color)
+
+    def _apply_stats(self, text):
+        self.canvas.itemconfig(self.stats_item, text=text)
+
+    def _apply_analytics(self, text):
+        self.canvas.itemconfig(self.analytics_item, text=text)
+
+    def _apply_history(self, slots):
+        c = self.canvas
+        moved = False
+        for index, slot in enumerate(slots):
+            shown = self._history_shown[index]
+            if slot == shown:
+                continue
+            if slot is None or shown is None or slot[0] != shown[0]:
+                moved = True
+            self._history_shown[index] = slot
+            text, color = slot or ('', self.widget.BG_COLOR)
+            c.itemconfig(self.history_items[index], text=text, fill=color)
+        if moved:
+            # Texts shifted along; fade steps alone keep the positions
+            self._layout_history()
+
+    def _layout_history(self):
+        c = self.canvas
+        font = self.widget.font_mouse
+        x = 10
+        for item, slot in zip(self.history_items, self._history_shown):
+            c.coords(item, x, self._history_y)
+            if slot:
+                x += font.measure(slot[0]) + 14
+
+    def _apply_typed(self, runs):
+        self._typed = runs
+        c = self.canvas
+        runs = runs or ()
+        for index, item in enumerate(self.typed_items):
+            if index < len(runs):
+                text, is_token = runs[index]
+                c.itemconfig(item, text=text, state=tk.NORMAL,
+                             fill=self.widget.TYPED_TOKEN_COLOR if is_token else self.widget.INPUT_COLOR)
+            else:
+                c.itemconfig(item, text='', state=tk.HIDDEN)
+        self._request_row_layout()
+
+    # Layout
+
+    def _request_row_layout(self):
+        # Several fields usually change together; lay the row out once
+        if not self._row_pending:
+            self._row_pending = True
+            self.root.after_idle(self._layout_input_row)
+
+    def _layout_input_row(self):
+        """Centre the input row's items horizontally with coords() only."""
+        self._row_pending = False
+        c = self.canvas
+        w = self.widget
+        y = self._row_y
+        max_width = self.width - 20
+
+        if self._inline is not None:
+            left_text, token_text, right_text, icon = self._inline
+            font = w.font_input
+            widths = [
+                font.measure(left_text + ' ') if left_text else 0,
+                font.measure(token_text + ' '),
+                (icon.width() + self.ICON_GAP) if icon else 0,
+                font.measure(' ' + right_text) if right_text else 0,
+            ]
+            x = (self.width - min(sum(widths), max_width)) // 2
+            for item, width in zip(self.inline_items, widths):
+                c.coords(item, x, y)
+                x += width
+            return
+
+        if self._typed is not None:
+            font = w.font_input
+            widths = [font.measure(text) for text, _ in self._typed]
+            x = (self.width - min(sum(widths), max_width)) // 2
+            for item, width in zip(self.typed_items, widths):
+                c.coords(item, x, y)
+                x += width
+            return
+
+        text_width = min(self._font.measure(self._text), max_width) if self._text else 0
+        icon_width = (self._icon.width() + self.ICON_GAP) if self._icon else 0
+        x = (self.width - icon_width - text_width) // 2
+        c.coords(self.icon_item, x, y)
+        c.coords(self.text_item, x + icon_width, y)
+        c.itemconfig(self.text_item, width=max_width - icon_width)
+
+    def next_layout(self, event=None):
+        """Switch to the next layout in LAYOUT_ORDER."""
+        index = self.LAYOUT_ORDER.index(self.layout)
+        self.set_layout(self.LAYOUT_ORDER[(index + 1) % len(self.LAYOUT_ORDER)])
+
+    def set_layout(self, layout):
+        """Move and show/hide items for ``layout`` without rebuilding anything."""
+        c = self.canvas
+        self.layout = layout
+        self.width, self.height = self.LAYOUTS[layout]
+        self.widget.width, self.widget.height = self.width, self.height
+        if self.heatmap_item is not None:
+            c.coords(self.heatmap_item, self.width // 2, self.widget.height + self.widget.HEATMAP_PADDING // 2)
+            self.widget.height += self.widget.heatmap_height()
+        if self.widget.history:
+            # The history row sits below the layout proper and heatmap, the stats row below that
+            self._history_y = self.widget.height + self.widget.HISTORY_ROW_HEIGHT // 2
+            self.widget.height += self.widget.HISTORY_ROW_HEIGHT
+            self._layout_history()
+        if self.widget.analytics:
+            c.coords(self.analytics_item, 10, self.widget.height + self.widget.ANALYTICS_ROW_HEIGHT // 2)
+            self.widget.height += self.widget.ANALYTICS_ROW_HEIGHT
+        if self.widget.stats:
+            c.coords(self.stats_item, 10, self.widget.height + self.widget.STATS_ROW_HEIGHT // 2)
+            self.widget.height += self.widget.STATS_ROW_HEIGHT
+        self.root.geometry(f"{self.widget.width}x{self.widget.height}")
+
+        c.coords(self.close_item, self.width - 12, 12)
+        inline_state = tk.HIDDEN if self._inline is None else tk.NORMAL
+
+        if layout == 'full':
+            self._row_y = 62
+            c.coords(self.title_item, self.width // 2, 14)
+            c.coords(self.mouse_item, 10, 112)
+            c.coords(self.selection_item, 10, 134)
+            c.itemconfig(self.mouse_item, anchor=tk.W)
+            self._show(('title', 'mouse', 'selection', 'leds'), True)
+            self._place_leds(self.width // 2 - self.LED_SPACING, 162, below=True)
+        elif layout == 'compact':
+            self._row_y = 34
+            self._show(('title', 'mouse', 'selection'), False)
+            self._show(('leds',), True)
+            self._place_leds(self.width // 2 - self.LED_SPACING - 12, 74, below=False)
+        elif layout == 'ticker':
+            self._row_y = self.height // 2
+            c.coords(self.mouse_item, self.width - 28, self.height // 2)
+            c.itemconfig(self.mouse_item, anchor=tk.E)
+            self._show(('title', 'selection'), False)
+            self._show(('mouse', 'leds'), True)
+            self._place_leds(12, self.height // 2, below=False, spacing=50)
+
+        c.itemconfig('input', state=tk.NORMAL)
+        c.itemconfig('inline', state=inline_state)
+        self._layout_input_row()
+
+    def _show(self, tags, visible):
+        for tag in tags:
+            self.canvas.itemconfig(tag, state=tk.NORMAL if visible else tk.HIDDEN)
+
+    def _place_leds(self, x, y, below, spacing=None):
+        """Place the LEDs from ``x``, labels below or to the right of each oval."""
+        c = self.canvas
+        size = self.widget.LED_SIZE
+        spacing = spacing or self.LED_SPACING
+        for index, (led_id, _) in enumerate(self.LED_IDS):
+            oval, label = self.led_items[led_id]
+            cx = x + index * spacing
+            c.coords(oval, cx - size // 2, y - size // 2, cx + size // 2, y + size // 2)
+            if below:
+                c.coords(label, cx, y + size + 6)
+                c.itemconfig(label, anchor=tk.CENTER)
+            else:
+                c.coords(label, cx + size, y)
+                c.itemconfig(label, anchor=tk.W)
@@ -0,0 +1,131 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Caption track export (``--captions``).
+
+What the overlay shows is also written as a WebVTT (``.vtt``) or SRT
+(``.srt``) subtitle track, to lay over a screen recording instead of
+burning the overlay into it. A cue starts when its text is shown and ends
+when the display is reset or shows something else.
+
+The Tk thread only reads the monotonic clock and hands finished cues to a
+bounded queue; a background thread formats them and writes in batches,
+flushing about once a second. Times count from ``origin_ns`` (the session
+recorder's start when recording, otherwise when the writer was created),
+shifted by ``offset`` seconds to line up with the video.
+"""
+import queue
+import threading
+import time
+
+
+def format_time(seconds, separator='.'):
+    """HH:MM:SS.mmm (SRT uses a comma before the milliseconds)."""
+    ms = max(0, int(round(seconds * 1000)))
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    return f'{hours:02d}:{minutes:02d}:{secs:02d}{separator}{ms:03d}'
+
+
+def _vtt_text(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+class CaptionWriter:
+    """Write displayed texts as subtitle cues from a background thread."""
+
+    QUEUE_SIZE = 4096
+    BATCH_SIZE = 256
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, path, origin_ns=None, offset=0.0, format=None):
+        self.path = path
+        self.format = format or ('srt' if path.lower().endswith('.srt') else 'vtt')
+        self.origin_ns = time.monotonic_ns() if origin_ns is None else origin_ns
+        self.offset = offset
+        self.cues = 0
+        self.dropped = 0
+
+        # The cue on screen: (text, start ns)
+        self._text = None
+        self._start = 0
+
+        self._file = open(path, 'w', encoding='utf-8', newline='\n')
+        if self.format == 'vtt':
+            self._file.write('WEBVTT\n\n')
+        self._queue = queue.Queue(self.QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._write_loop, name='caption-writer', daemon=True)
+        self._thread.start()
+
+    def show(self, text):
+        """``text`` is now displayed; ends the previous cue unless it is the same text."""
+        if text == self._text:
+            return
+        now = time.monotonic_ns()
+        if self._text:
+            self._put(self._text, self._start, now)
+        self._text = text
+        self._start = now
+
+    def clear(self):
+        """The display was reset; ends the current cue."""
+        if self._text:
+            self._put(self._text, self._start, time.monotonic_ns())
+        self._text = None
+
+    def _put(self, text, start, end):
+        try:
+            self._queue.put_nowait((text, start, end))
+        except queue.Full:
+            self.dropped += 1
+
+    def _format(self, text, start, end):
+        origin = self.origin_ns
+        start_s = max(0.0, (start - origin) / 1e9 + self.offset)
+        end_s = (end - origin) / 1e9 + self.offset
+        if end_s - start_s < 0.001:
+            # Replaced within a millisecond, or before the video started
+            return ''
+        self.cues += 1
+        if self.format == 'srt':
+            return (f'{self.cues}\n{format_time(start_s, ",")} --> {format_time(end_s, ",")}\n'
+                    f'{text}\n\n')
+        return f'{format_time(start_s)} --> {format_time(end_s)}\n{_vtt_text(text)}\n\n'
+
+    def _write_loop(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                batch = []
+            # None, queued by close(), is always the last item
+            while batch and batch[-1] is not None and len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = bool(batch) and batch[-1] is None
+            if stop:
+                batch.pop()
+            if batch:
+                self._file.write(''.join(self._format(*cue) for cue in batch))
+            if stop or time.monotonic() - last_flush >= self.FLUSH_INTERVAL:
+                self._file.flush()
+                last_flush = time.monotonic()
+            if stop:
+                return
+
+    def close(self):
+        """End the current cue, write everything queued and close the file."""
+        if self._file.closed:
+            return
+        self.clear()
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
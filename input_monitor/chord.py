@@ -0,0 +1,130 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Held-key (chord) state.
+
+Keys are kept in insertion-ordered dicts, which gives press order for free,
+with a modifier bitmask alongside. Auto-repeat of a held key only refreshes
+its timestamp; the rendered combination text is rebuilt only when the set of
+held keys changes.
+"""
+
+# Modifier bits
+MOD_CTRL = 1
+MOD_ALT = 2
+MOD_SHIFT = 4
+MOD_WIN = 8
+
+MODIFIER_BITS = {'Ctrl': MOD_CTRL, 'Alt': MOD_ALT, 'Shift': MOD_SHIFT, 'Win': MOD_WIN}
+
+
+class ChordState:
+    """Keys currently held, modifiers first, each in press order.
+
+    ``text`` is the combination ("Ctrl + Shift + S") and ``display`` the text
+    to show, which ends in " + ..." while only modifiers are held.
+    """
+
+    def __init__(self):
+        # name -> time the key was last seen down (press or auto-repeat)
+        self._modifiers = {}
+        self._keys = {}
+        # modifier name -> its bit, as passed to press()
+        self._modifier_bits = {}
+        self.mask = 0
+        self._modifier_text = ''
+        self._key_text = ''
+        self.text = ''
+        self.display = ''
+
+    def __len__(self):
+        return len(self._modifiers) + len(self._keys)
+
+    def __contains__(self, name):
+        return name in self._modifiers or name in self._keys
+
+    @property
+    def has_keys(self):
+        """True if a non-modifier key is held."""
+        return bool(self._keys)
+
+    def press(self, name, t, bit=None):
+        """Record a key press at time ``t``. Returns True if the chord changed."""
+        if bit is None:
+            bit = MODIFIER_BITS.get(name, 0)
+        if bit:
+            held = self._modifiers
+        else:
+            held = self._keys
+        if name in held:
+            # Auto-repeat
+            held[name] = t
+            return False
+
+        held[name] = t
+        if bit:
+            self._modifier_bits[name] = bit
+            self.mask |= bit
+            self._modifier_text = f"{self._modifier_text} + {name}" if self._modifier_text else name
+        else:
+            self._key_text = f"{self._key_text} + {name}" if self._key_text else name
+        self._update_text()
+        return True
+
+    def release(self, name, bit=None):
+        """Record a key release. Returns True if the chord changed."""
+        if bit is None:
+            bit = MODIFIER_BITS.get(name, 0)
+        if bit:
+            if self._modifiers.pop(name, None) is None:
+                return False
+            del self._modifier_bits[name]
+            # Another held modifier may share the bit (left and right Ctrl)
+            mask = 0
+            for held_bit in self._modifier_bits.values():
+                mask |= held_bit
+            self.mask = mask
+            self._modifier_text = " + ".join(self._modifiers)
+        else:
+            if self._keys.pop(name, None) is None:
+                return False
+            self._key_text = " + ".join(self._keys)
+        self._update_text()
+        return True
+
+    def sweep(self, now, timeout):
+        """Drop keys not seen for ``timeout`` seconds (their release was lost).
+
+        Returns the list of dropped key names.
+        """
+        cutoff = now - timeout
+        modifiers = [name for name, t in self._modifiers.items() if t < cutoff]
+        keys = [name for name, t in self._keys.items() if t < cutoff]
+        # Released with the bit they were pressed with, whatever their label
+        for name in modifiers:
+            self.release(name, self._modifier_bits[name])
+        for name in keys:
+            self.release(name, 0)
+        return modifiers + keys
+
+    def clear(self):
+        self._modifiers.clear()
+        self._keys.clear()
+        self._modifier_bits.clear()
+        self.mask = 0
+        self._modifier_text = self._key_text = ''
+        self._update_text()
+
+    def _update_text(self):
+        if self._modifier_text and self._key_text:
+            self.text = f"{self._modifier_text} + {self._key_text}"
+            self.display = self.text
+        elif self._key_text:
+            self.text = self.display = self._key_text
+        else:
+            self.text = self._modifier_text
+            self.display = f"{self.text} + ..." if self.text else ''
@@ -0,0 +1,110 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Input event records and the queue that carries them from the listener
+threads to the Tk main loop.
+
+Records are plain tuples whose first two fields are the kind and the event
+time (seconds since the epoch, as reported by the hook):
+
+    (KEY_DOWN, t, name, scan_code)
+    (KEY_UP,   t, name, scan_code)
+    (MOVE,     t, x, y)
+    (MOVE,     t, x, y, trail)
+    (CLICK,    t, x, y, button, pressed)
+    (SCROLL,   t, dx, dy)
+
+``button`` is a plain name ('left', 'right', 'middle', ...). Scroll deltas
+are wheel steps, positive up and to the right. ``trail`` lists the (t, x, y)
+samples of earlier moves merged into the record, oldest first.
+"""
+import collections
+import threading
+
+# Event record kinds
+KEY_DOWN = 0
+KEY_UP = 1
+MOVE = 2
+CLICK = 3
+
+# Selection start/end; only recorded, never queued
+SELECT_START = 4
+SELECT_END = 5
+
+SCROLL = 6
+
+EVENT_NAMES = ('key_down', 'key_up', 'move', 'click', 'select_start', 'select_end', 'scroll')
+
+
+class EventQueue:
+    """Bounded multi-producer, single-consumer queue of event records.
+
+    Producers hold the lock only for a couple of deque operations. A move
+    pushed directly after another queued move replaces it, so the display
+    handles one move per drain, but the samples it replaces are kept in its
+    trail (up to MAX_TRAIL) for recording and motion statistics. Consecutive
+    scrolls are summed into one record; when the queue is full new records
+    are dropped.
+    """
+
+    # Merged move samples kept per record; at 8 kHz this covers over 100 ms
+    MAX_TRAIL = 1024
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        # Set while records are queued, for consumers that block in wait()
+        self._ready = threading.Event()
+
+        # Counters
+        self.received = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def push(self, record):
+        """Queue a record from any thread. Returns False if it was dropped."""
+        with self._lock:
+            self.received += 1
+            items = self._items
+            if record[0] == MOVE and items and items[-1][0] == MOVE:
+                last = items[-1]
+                trail = last[4] if len(last) > 4 else []
+                if len(trail) < self.MAX_TRAIL:
+                    trail.append(last[1:4])
+                items[-1] = record + (trail,)
+                self.coalesced += 1
+                return True
+            if record[0] == SCROLL and items and items[-1][0] == SCROLL:
+                last = items[-1]
+                items[-1] = (SCROLL, record[1], last[2] + record[2], last[3] + record[3])
+                self.coalesced += 1
+                return True
+            if len(items) >= self.maxsize:
+                self.dropped += 1
+                return False
+            items.append(record)
+            if len(items) == 1:
+                self._ready.set()
+            return True
+
+    def pop_batch(self, limit):
+        """Remove and return up to ``limit`` records in arrival order."""
+        with self._lock:
+            items = self._items
+            count = min(limit, len(items))
+            batch = [items.popleft() for _ in range(count)]
+            if not items:
+                self._ready.clear()
+            return batch
+
+    def wait(self, timeout=None):
+        """Block until records are queued or ``timeout`` seconds pass; True if any are."""
+        return self._ready.wait(timeout)
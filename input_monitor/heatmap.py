@@ -0,0 +1,166 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Mouse-movement heatmap (``--heatmap``, needs NumPy).
+
+Cursor positions are binned into a fixed grid covering the screen, so a move
+costs one array increment and memory stays the size of the grid however long
+the session runs. At a low fixed rate the whole grid is decayed with one
+vectorised multiply, mapped through a precomputed 256 colour palette and
+handed to Tk as a single PPM buffer for one ``PhotoImage.put``.
+
+A recorded session can be rendered to a PNG for review:
+
+    python -m input_monitor.heatmap session.imrec --screen 1920x1080 --output heat.png
+"""
+import argparse
+import math
+import sys
+
+# Palette stops from cold to hot, after the background colour
+HEAT_COLORS = ('#1d3b8f', '#2fb8c9', '#f2d230', '#f2512e', '#ffffff')
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('the heatmap needs NumPy (pip install input-monitor[heatmap])') from None
+    return numpy
+
+
+def heat_palette(background, colors=HEAT_COLORS, size=256):
+    """Return a (size, 3) uint8 array fading from ``background`` through ``colors``."""
+    np = _numpy()
+    stops = [[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in (background,) + tuple(colors)]
+    positions = np.linspace(0.0, 1.0, len(stops))
+    levels = np.linspace(0.0, 1.0, size)
+    channels = [np.interp(levels, positions, [stop[c] for stop in stops]) for c in range(3)]
+    return np.rint(np.stack(channels, axis=1)).astype(np.uint8)
+
+
+class Heatmap:
+    """Decaying histogram of cursor positions over a ``columns`` x ``rows`` grid."""
+
+    def __init__(self, screen_width, screen_height, columns=64, rows=36, half_life=30.0,
+                 background='#000000', zoom=1):
+        np = _numpy()
+        self.np = np
+        self.columns, self.rows = columns, rows
+        self.zoom = zoom
+        self.half_life = half_life
+        self._x_scale = columns / max(1, screen_width)
+        self._y_scale = rows / max(1, screen_height)
+        self.grid = np.zeros((rows, columns), dtype=np.float32)
+        self._scaled = np.empty_like(self.grid)
+        self.palette = heat_palette(background)
+        self._header = f'P6 {columns * zoom} {rows * zoom} 255\n'.encode('ascii')
+
+    def add(self, x, y, weight=1.0):
+        """Count a cursor position; positions off the grid are ignored."""
+        column = int(x * self._x_scale)
+        row = int(y * self._y_scale)
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            self.grid[row, column] += weight
+
+    def decay(self, elapsed):
+        """Fade every bin by ``elapsed`` seconds of the half life."""
+        if self.half_life:
+            self.grid *= 0.5 ** (elapsed / self.half_life)
+
+    def peak(self):
+        return float(self.grid.max())
+
+    def clear(self):
+        self.grid.fill(0.0)
+
+    def levels(self):
+        """Palette index per bin, log-scaled against the hottest bin."""
+        np = self.np
+        peak = self.peak()
+        if peak <= 0.0:
+            return np.zeros(self.grid.shape, dtype=np.uint8)
+        # log1p keeps a briefly crossed bin visible next to one the cursor sat on
+        np.log1p(self.grid, out=self._scaled)
+        self._scaled *= (len(self.palette) - 1) / math.log1p(peak)
+        return self._scaled.astype(np.uint8)
+
+    def rgb(self, zoom=1):
+        """The heatmap as a (rows * zoom, columns * zoom, 3) uint8 array."""
+        pixels = self.palette[self.levels()]
+        if zoom > 1:
+            pixels = pixels.repeat(zoom, axis=0).repeat(zoom, axis=1)
+        return pixels
+
+    def ppm(self):
+        """The heatmap at ``zoom`` as binary PPM data for ``PhotoImage.put``."""
+        return self._header + self.rgb(self.zoom).tobytes()
+
+    def save(self, path, zoom=1):
+        """Write the heatmap as a PNG file."""
+        from .icons import write_png
+
+        np = self.np
+        pixels = self.rgb(zoom)
+        height, width = pixels.shape[:2]
+        alpha = np.full((height, width, 1), 255, dtype=np.uint8)
+        write_png(path, width, height, np.concatenate((pixels, alpha), axis=2).tobytes())
+
+
+def session_heatmap(records, screen_width, screen_height, columns=64, rows=36, background='#000000'):
+    """Bin the moves of a recorded or synthetic session, without decay."""
+    from .events import MOVE
+
+    heatmap = Heatmap(screen_width, screen_height, columns, rows, half_life=0, background=background)
+    for record in records:
+        if record[0] == MOVE:
+            heatmap.add(record[2], record[3])
+    return heatmap
+
+
+def main(argv=None):
+    from .app import InputMonitorWidget
+    from .replay import read_session, synthetic_session
+
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-heatmap',
+        description='Render the mouse-movement heatmap of a recorded session to a PNG file.'
+    )
+    parser.add_argument('session', nargs='?', help='session file written by the recorder')
+    parser.add_argument('--synthetic', type=float, metavar='SECONDS',
+                        help='use a generated session of this length instead')
+    parser.add_argument('--screen', default='1920x1080', metavar='WxH',
+                        help='screen size the session was recorded on (default: %(default)s)')
+    parser.add_argument('--grid', default=None, metavar='COLSxROWS',
+                        help='heatmap resolution (default: 1/10 of the screen size)')
+    parser.add_argument('--zoom', type=int, default=4, help='pixels per grid cell (default: %(default)s)')
+    parser.add_argument('--output', default='heatmap.png', metavar='PATH',
+                        help='PNG file to write (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    try:
+        width, height = (int(value) for value in args.screen.lower().split('x'))
+        columns, rows = ((int(value) for value in args.grid.lower().split('x')) if args.grid
+                         else (max(1, width // 10), max(1, height // 10)))
+    except ValueError:
+        parser.error('sizes are given as WIDTHxHEIGHT')
+
+    if args.synthetic:
+        records = synthetic_session(args.synthetic)
+    elif args.session:
+        records = read_session(args.session)
+    else:
+        parser.error('a session file or --synthetic is required')
+
+    heatmap = session_heatmap(records, width, height, columns, rows, InputMonitorWidget.BG_COLOR)
+    heatmap.save(args.output, args.zoom)
+    print(f"{columns}x{rows} heatmap written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
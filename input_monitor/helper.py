@@ -0,0 +1,216 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Out-of-process input capture helper.
+
+Runs the pynput mouse listener and the ``keyboard`` library loop (the
+'hooks' backend) in a separate, possibly privileged, process. Events are
+sent to the GUI as fixed-size binary records, in batches, over stdout or a
+Unix domain socket the GUI is listening on:
+
+    python -m input_monitor.helper                      # stream to stdout
+    sudo python -m input_monitor.helper --connect PATH  # attach to a GUI
+
+When the GUI falls behind, writes block and events pile up in a bounded
+queue where moves are coalesced and excess records dropped, so the capture
+hooks never wait on the GUI.
+"""
+import argparse
+import socket
+import struct
+import sys
+import time
+
+from .events import EventQueue, KEY_DOWN, KEY_UP, MOVE, CLICK, SCROLL
+
+# Stream header: magic + record size
+MAGIC = b'IMH1'
+HEADER = struct.Struct('<4sH')
+
+# time, kind, flags, scan code, x, y, key name (scrolls: dx, dy in x, y)
+RECORD = struct.Struct('<dBBHii16s')
+
+# Sent when idle so a closed GUI end is noticed
+HEARTBEAT = 255
+
+NO_SCAN_CODE = 0xFFFF
+BUTTONS = ('left', 'right', 'middle', 'x1', 'x2')
+BUTTON_CODES = {name: code for code, name in enumerate(BUTTONS)}
+PRESSED_FLAG = 0x80
+
+
+def pack_record(buffer, offset, record):
+    """Pack an event record tuple into ``buffer`` at ``offset``."""
+    kind, t = record[0], record[1]
+    if kind == MOVE or kind == SCROLL:
+        RECORD.pack_into(buffer, offset, t, kind, 0, 0, record[2], record[3], b'')
+    elif kind == CLICK:
+        flags = BUTTON_CODES.get(record[4], 0x7F) | (PRESSED_FLAG if record[5] else 0)
+        RECORD.pack_into(buffer, offset, t, kind, flags, 0, record[2], record[3], b'')
+    else:
+        scan_code = NO_SCAN_CODE if record[3] is None else record[3] & 0xFFFF
+        name = (record[2] or '').encode('utf-8')[:16]
+        RECORD.pack_into(buffer, offset, t, kind, 0, scan_code, 0, 0, name)
+
+
+class CaptureStream:
+    """Capture input with the hooks backend and stream it through ``write``."""
+
+    QUEUE_SIZE = 8192
+    BATCH_RECORDS = 256
+    HEARTBEAT_INTERVAL = 1.0
+
+    def __init__(self, write):
+        self.write = write
+        self.events = EventQueue(self.QUEUE_SIZE)
+        self._buffer = bytearray(RECORD.size * self.BATCH_RECORDS)
+
+    def _key_down(self, name, event_time=None, scan_code=None):
+        self.events.push((KEY_DOWN, event_time or time.time(), name, scan_code))
+
+    def _key_up(self, name, event_time=None, scan_code=None):
+        self.events.push((KEY_UP, event_time or time.time(), name, scan_code))
+
+    def _move(self, x, y, event_time=None):
+        self.events.push((MOVE, event_time or time.time(), x, y))
+
+    def _click(self, x, y, button, pressed, event_time=None):
+        self.events.push((CLICK, event_time or time.time(), x, y, button, pressed))
+
+    def _scroll(self, dx, dy, event_time=None):
+        self.events.push((SCROLL, event_time or time.time(), dx, dy))
+
+    def run(self):
+        """Stream events until the receiving end goes away."""
+        from .backends.hooks import HookBackend
+
+        backend = HookBackend(key_down=self._key_down, key_up=self._key_up, move=self._move, click=self._click,
+                              scroll=self._scroll)
+        backend.start()
+        try:
+            self.write(HEADER.pack(MAGIC, RECORD.size))
+            idle_since = time.monotonic()
+            while True:
+                # Sleeps until the hooks queue something or a heartbeat is due
+                if not self.events.wait(max(0.0, idle_since + self.HEARTBEAT_INTERVAL - time.monotonic())):
+                    RECORD.pack_into(self._buffer, 0, time.time(), HEARTBEAT, 0, 0, 0, 0, b'')
+                    self.write(bytes(self._buffer[:RECORD.size]))
+                    idle_since = time.monotonic()
+                    continue
+                batch = self.events.pop_batch(self.BATCH_RECORDS)
+                records = []
+                for record in batch:
+                    if record[0] == MOVE and len(record) > 4:
+                        # The samples merged into the move are sent too, for the recorder
+                        records.extend((MOVE, t, x, y) for t, x, y in record[4])
+                    records.append(record)
+                if len(records) * RECORD.size > len(self._buffer):
+                    self._buffer = bytearray(len(records) * RECORD.size)
+                for index, record in enumerate(records):
+                    pack_record(self._buffer, index * RECORD.size, record)
+                # Blocks while the GUI is behind
+                self.write(bytes(self._buffer[:len(records) * RECORD.size]))
+                idle_since = time.monotonic()
+        except (BrokenPipeError, ConnectionError, OSError):
+            pass
+        finally:
+            backend.stop()
+
+
+class HelperReader:
+    """Decode a helper stream and call the backend hooks (GUI side)."""
+
+    READ_RECORDS = 256
+
+    # A record the GUI queue has no room for is retried after this pause;
+    # meanwhile the pipe fills up and the helper coalesces instead
+    BACKPRESSURE_SLEEP = 0.002
+
+    def __init__(self, read, key_down, key_up, move, click, scroll=None, stopped=None):
+        self.read = read
+        self.key_down = key_down
+        self.key_up = key_up
+        self.move = move
+        self.click = click
+        self.scroll = scroll
+        # Returns True once the GUI is shutting down, ending any retries
+        self.stopped = stopped or (lambda: False)
+
+    def run(self):
+        header = self._read_exact(HEADER.size)
+        if header is None:
+            return
+        magic, size = HEADER.unpack(header)
+        if magic != MAGIC or size != RECORD.size:
+            raise ValueError('unexpected helper stream format')
+
+        pending = b''
+        while True:
+            data = self.read(RECORD.size * self.READ_RECORDS)
+            if not data:
+                return
+            if pending:
+                data = pending + data
+            usable = len(data) - len(data) % RECORD.size
+            pending = data[usable:]
+
+            for record in RECORD.iter_unpack(memoryview(data)[:usable]):
+                while self._deliver(*record) is False:
+                    if self.stopped():
+                        return
+                    time.sleep(self.BACKPRESSURE_SLEEP)
+
+    def _deliver(self, t, kind, flags, scan_code, x, y, name):
+        """Call the hook for one record; False if the GUI queue was full."""
+        if kind == MOVE:
+            return self.move(x, y, t)
+        if kind == CLICK:
+            button = BUTTONS[flags & 0x7F] if (flags & 0x7F) < len(BUTTONS) else 'unknown'
+            return self.click(x, y, button, bool(flags & PRESSED_FLAG), t)
+        if kind == SCROLL and self.scroll is not None:
+            return self.scroll(x, y, t)
+        if kind == KEY_DOWN or kind == KEY_UP:
+            hook = self.key_down if kind == KEY_DOWN else self.key_up
+            key_name = name.rstrip(b'\0').decode('utf-8', 'ignore')
+            return hook(key_name, t, None if scan_code == NO_SCAN_CODE else scan_code)
+        return None
+
+    def _read_exact(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.read(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-helper',
+        description='Capture keyboard and mouse input and stream it to input-monitor.'
+    )
+    parser.add_argument('--connect', metavar='PATH',
+                        help='Unix socket the GUI is listening on (default: write to stdout)')
+    args = parser.parse_args(argv)
+
+    if args.connect:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(args.connect)
+        write = sock.sendall
+    else:
+        out = sys.stdout.buffer
+
+        def write(data):
+            out.write(data)
+            out.flush()
+
+    CaptureStream(write).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Keystroke history for the ticker row.
+
+Entries go into a fixed number of preallocated slots, overwriting the
+oldest, and are faded out in a few colour steps by one shared timer, so a
+burst of shortcuts costs neither new widgets nor extra timers.
+"""
+
+
+def fade_colors(color, background, steps):
+    """Return ``steps + 1`` '#rrggbb' colours from ``color`` to ``background``."""
+    def rgb(value):
+        return [int(value[i:i + 2], 16) for i in (1, 3, 5)]
+
+    start, end = rgb(color), rgb(background)
+    colors = []
+    for step in range(steps + 1):
+        f = step / steps
+        colors.append('#' + ''.join(f'{round(a + (b - a) * f):02x}' for a, b in zip(start, end)))
+    return colors
+
+
+class HistoryRing:
+    """The last ``size`` entries as (text, time), newest first."""
+
+    def __init__(self, size):
+        self.size = size
+        self._texts = [None] * size
+        self._times = [0.0] * size
+        self._next = 0
+
+    def push(self, text, t):
+        index = self._next
+        self._texts[index] = text
+        self._times[index] = t
+        self._next = (index + 1) % self.size
+
+    def entries(self, now, lifetime):
+        """Return [(text, age), ...] newest first, for entries younger than ``lifetime``."""
+        entries = []
+        for offset in range(1, self.size + 1):
+            index = (self._next - offset) % self.size
+            text = self._texts[index]
+            if text is None:
+                break
+            age = now - self._times[index]
+            if age >= lifetime:
+                break
+            entries.append((text, age))
+        return entries
+
+    def clear(self):
+        self._texts = [None] * self.size
+        self._next = 0
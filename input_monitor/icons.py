@@ -0,0 +1,295 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Scaled icon variants, cached per user.
+
+Tk can only scale a PhotoImage by whole factors (``subsample``/``zoom``),
+which is blocky and rarely hits the wanted size. Here the source PNG is
+decoded once, resampled to the exact size with a bicubic filter (widened
+when shrinking, so every source pixel contributes, in premultiplied alpha so
+transparent edges do not darken), and written to
+``<cache dir>/icons/<name>-<source hash>-<size>.png``. Later runs
+load that small file directly. The variants for the configured sizes and
+scales can be made ahead of time:
+
+    python -m input_monitor.icons --scales 1 1.25 1.5 2
+"""
+import argparse
+import hashlib
+import math
+import os
+import struct
+import sys
+import threading
+import zlib
+
+from .paths import cache_dir
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Channels per pixel for each PNG colour type
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _unfilter(data, width, height, bpp, row_bytes):
+    """Undo the per-row PNG filters; returns the raw scanlines."""
+    rows = []
+    previous = bytearray(row_bytes)
+    pos = 0
+    for _ in range(height):
+        kind = data[pos]
+        row = bytearray(data[pos + 1:pos + 1 + row_bytes])
+        pos += 1 + row_bytes
+        if kind == 1:
+            for i in range(bpp, row_bytes):
+                row[i] = (row[i] + row[i - bpp]) & 0xFF
+        elif kind == 2:
+            for i in range(row_bytes):
+                row[i] = (row[i] + previous[i]) & 0xFF
+        elif kind == 3:
+            for i in range(row_bytes):
+                left = row[i - bpp] if i >= bpp else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(row_bytes):
+                a = row[i - bpp] if i >= bpp else 0
+                b = previous[i]
+                c = previous[i - bpp] if i >= bpp else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                if pa <= pb and pa <= pc:
+                    predictor = a
+                elif pb <= pc:
+                    predictor = b
+                else:
+                    predictor = c
+                row[i] = (row[i] + predictor) & 0xFF
+        elif kind != 0:
+            raise ValueError(f'bad PNG filter type {kind}')
+        rows.append(row)
+        previous = row
+    return rows
+
+
+def read_png(path):
+    """Decode a non-interlaced PNG into (width, height, RGBA bytearray)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError(f'not a PNG file: {path}')
+
+    pos = 8
+    idat = []
+    palette = transparency = None
+    while pos < len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b'IHDR':
+            width, height, depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', body)
+        elif kind == b'PLTE':
+            palette = body
+        elif kind == b'tRNS':
+            transparency = body
+        elif kind == b'IDAT':
+            idat.append(body)
+        elif kind == b'IEND':
+            break
+
+    if interlace or color_type not in _CHANNELS or depth != 8 and not (color_type == 3 and depth < 8):
+        raise ValueError(f'unsupported PNG format: {path}')
+    channels = _CHANNELS[color_type]
+    bits = depth * channels
+    row_bytes = (width * bits + 7) // 8
+    rows = _unfilter(zlib.decompress(b''.join(idat)), width, height, max(1, bits // 8), row_bytes)
+
+    rgba = bytearray(width * height * 4)
+    out = 0
+    for row in rows:
+        if color_type == 6:
+            rgba[out:out + width * 4] = row
+            out += width * 4
+            continue
+        for x in range(width):
+            if color_type == 3:
+                if depth < 8:
+                    per_byte = 8 // depth
+                    shift = (per_byte - 1 - x % per_byte) * depth
+                    index = (row[x // per_byte] >> shift) & ((1 << depth) - 1)
+                else:
+                    index = row[x]
+                r, g, b = palette[index * 3:index * 3 + 3]
+                a = transparency[index] if transparency and index < len(transparency) else 255
+            elif color_type == 2:
+                r, g, b = row[x * 3:x * 3 + 3]
+                a = 255
+            elif color_type == 4:
+                r = g = b = row[x * 2]
+                a = row[x * 2 + 1]
+            else:
+                r = g = b = row[x]
+                a = 255
+            rgba[out:out + 4] = bytes((r, g, b, a))
+            out += 4
+    return width, height, rgba
+
+
+def write_png(path, width, height, rgba):
+    """Write RGBA pixels as a PNG file."""
+    stride = width * 4
+    raw = b''.join(b'\x00' + bytes(rgba[y * stride:(y + 1) * stride]) for y in range(height))
+
+    def chunk(kind, body):
+        return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+    with open(path, 'wb') as f:
+        f.write(PNG_SIGNATURE)
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw, 9)))
+        f.write(chunk(b'IEND', b''))
+
+
+def _cubic(x):
+    # Catmull-Rom (a = -0.5)
+    x = abs(x)
+    if x < 1.0:
+        return (1.5 * x - 2.5) * x * x + 1.0
+    if x < 2.0:
+        return ((-0.5 * x + 2.5) * x - 4.0) * x + 2.0
+    return 0.0
+
+
+def _weights(source_size, target_size):
+    """Per output pixel: (first source index, normalised weights)."""
+    scale = source_size / target_size
+    # Widen the filter when shrinking so it averages over the source pixels
+    filter_scale = max(scale, 1.0)
+    support = 2.0 * filter_scale
+    table = []
+    for i in range(target_size):
+        center = (i + 0.5) * scale
+        first = max(0, int(math.floor(center - support)))
+        last = min(source_size, int(math.ceil(center + support)))
+        weights = [_cubic((j + 0.5 - center) / filter_scale) for j in range(first, last)]
+        total = sum(weights)
+        table.append((first, [w / total for w in weights]))
+    return table
+
+
+def resample(width, height, rgba, target_width, target_height):
+    """Resize RGBA pixels; returns a bytearray of target_width x target_height."""
+    # Premultiply so colour from transparent pixels does not bleed into edges
+    pixels = []
+    for i in range(0, len(rgba), 4):
+        alpha = rgba[i + 3] / 255.0
+        pixels.append((rgba[i] * alpha, rgba[i + 1] * alpha, rgba[i + 2] * alpha, float(rgba[i + 3])))
+
+    columns = _weights(width, target_width)
+    rows = _weights(height, target_height)
+
+    # Horizontal pass
+    horizontal = []
+    for y in range(height):
+        line = pixels[y * width:(y + 1) * width]
+        for first, weights in columns:
+            r = g = b = a = 0.0
+            for offset, w in enumerate(weights):
+                pr, pg, pb, pa = line[first + offset]
+                r += pr * w
+                g += pg * w
+                b += pb * w
+                a += pa * w
+            horizontal.append((r, g, b, a))
+
+    # Vertical pass, then back to straight alpha
+    out = bytearray(target_width * target_height * 4)
+    pos = 0
+    for first, weights in rows:
+        for x in range(target_width):
+            r = g = b = a = 0.0
+            for offset, w in enumerate(weights):
+                pr, pg, pb, pa = horizontal[(first + offset) * target_width + x]
+                r += pr * w
+                g += pg * w
+                b += pb * w
+                a += pa * w
+            a = min(max(a, 0.0), 255.0)
+            if a < 0.5:
+                out[pos:pos + 4] = b'\x00\x00\x00\x00'
+            else:
+                factor = 255.0 / a
+                out[pos] = min(max(int(r * factor + 0.5), 0), 255)
+                out[pos + 1] = min(max(int(g * factor + 0.5), 0), 255)
+                out[pos + 2] = min(max(int(b * factor + 0.5), 0), 255)
+                out[pos + 3] = int(a + 0.5)
+            pos += 4
+    return out
+
+
+def target_size(width, height, size):
+    """Fit (width, height) into a ``size`` pixel square, keeping the aspect."""
+    factor = size / max(width, height)
+    return max(1, int(round(width * factor))), max(1, int(round(height * factor)))
+
+
+def images_dir():
+    """Directory of the bundled source images."""
+    if getattr(sys, '_MEIPASS', None):
+        return os.path.join(getattr(sys, '_MEIPASS'), 'input_monitor', 'images')
+    return os.path.join(os.path.dirname(__file__), 'images')
+
+
+def cached_icon_path(source, size, directory=None):
+    """Return where the variant of ``source`` for ``size`` pixels is cached, made or not."""
+    with open(source, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:12]
+    directory = directory or os.path.join(cache_dir(), 'icons')
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(directory, f'{name}-{digest}-{size}.png')
+
+
+def scaled_icon(source, size, directory=None):
+    """Return the path of ``source`` scaled to fit ``size`` pixels, making it if needed."""
+    path = cached_icon_path(source, size, directory)
+    if os.path.isfile(path):
+        return path
+    directory = os.path.dirname(path)
+
+    width, height, rgba = read_png(source)
+    target_width, target_height = target_size(width, height, size)
+    if (target_width, target_height) == (width, height):
+        return source
+    pixels = resample(width, height, rgba, target_width, target_height)
+
+    os.makedirs(directory, exist_ok=True)
+    temp = f'{path}.{os.getpid()}-{threading.get_ident()}.tmp'
+    write_png(temp, target_width, target_height, pixels)
+    os.replace(temp, path)
+    return path
+
+
+def main(argv=None):
+    from .app import InputMonitorWidget
+
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-icons',
+        description='Create the scaled icon variants in the per-user cache.'
+    )
+    parser.add_argument('--scales', type=float, nargs='+', default=[1.0], metavar='SCALE',
+                        help='display scale factors to prepare (default: 1)')
+    args = parser.parse_args(argv)
+
+    for filename, size in InputMonitorWidget.ICON_FILES.values():
+        source = os.path.join(images_dir(), filename)
+        if not os.path.isfile(source):
+            continue
+        for scale in args.scales:
+            print(scaled_icon(source, int(round(size * scale))))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Key name normalisation.
+
+Raw names from the hooks ('left ctrl', 'Control_L', 'alt' with a Win scan
+code, ...) are mapped to display names plus a modifier bit. The string work
+is done once per distinct ``(raw name, scan code)`` pair and memoised in a
+bounded cache, so the keyboard hot path is a single dict lookup.
+
+Custom labels can be supplied in a JSON file mapping normalised key names,
+or ``"scan:<code>"`` for a specific scan code, to display labels::
+
+    {"page up": "PgUp", "print screen": "PrtSc", "scan:248": "Mic Mute"}
+"""
+import os
+
+from .chord import MODIFIER_BITS
+from .paths import config_dir
+
+# Modifier names that may carry a left/right prefix
+SIDED_MODIFIERS = ('ctrl', 'control', 'shift', 'alt', 'alt gr', 'windows', 'super', 'cmd')
+
+
+def default_labels_path():
+    """Return the default location of the custom key labels file."""
+    return os.environ.get('INPUT_MONITOR_KEYS') or os.path.join(config_dir(), 'keys.json')
+
+
+def load_custom_labels(path=None):
+    """Load custom key labels from ``path``; missing or invalid files give {}."""
+    path = path or default_labels_path()
+    if not os.path.isfile(path):
+        return {}
+    import json
+    try:
+        with open(path, encoding='utf-8') as f:
+            labels = json.load(f)
+    except Exception:
+        return {}
+    if not isinstance(labels, dict):
+        return {}
+    return {str(k).lower(): str(v) for k, v in labels.items()}
+
+
+class KeyNormalizer:
+    """Map ``(raw name, scan code)`` to ``(display name, modifier bit)``."""
+
+    CACHE_SIZE = 1024
+
+    def __init__(self, special_keys, win_scan_codes, custom_labels=None):
+        self.win_scan_codes = frozenset(win_scan_codes)
+        custom_labels = custom_labels or {}
+
+        # Normalised name -> (display name, modifier bit). The modifier bit
+        # comes from the built-in name so relabelled modifiers still count.
+        self._table = {}
+        for name, label in special_keys.items():
+            self._table[name] = (label, MODIFIER_BITS.get(label, 0))
+        for name, label in custom_labels.items():
+            if not name.startswith('scan:'):
+                bit = self._table.get(name, (None, 0))[1]
+                self._table[name] = (label, bit)
+
+        self._scan_labels = {}
+        for name, label in custom_labels.items():
+            if name.startswith('scan:'):
+                try:
+                    self._scan_labels[int(name[5:])] = label
+                except ValueError:
+                    pass
+
+        self._cache = {}
+        # Warm the cache with the names the hooks report most often
+        for name in special_keys:
+            self.lookup(name)
+        for scan_code in self.win_scan_codes:
+            for name in ('alt', 'alt gr', 'windows'):
+                self.lookup(name, scan_code)
+
+    def lookup(self, raw_name, scan_code=None):
+        """Return ``(display name, modifier bit)`` for a raw hook key."""
+        key = (raw_name, scan_code)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        result = self._normalize(raw_name, scan_code)
+        cache = self._cache
+        if len(cache) >= self.CACHE_SIZE:
+            # Evict the oldest entry
+            del cache[next(iter(cache))]
+        cache[key] = result
+        return result
+
+    def _normalize(self, raw_name, scan_code):
+        """Do the string work for a name not seen before."""
+        if scan_code in self._scan_labels:
+            label = self._scan_labels[scan_code]
+            return (label, MODIFIER_BITS.get(label, 0))
+
+        if not isinstance(raw_name, str):
+            return ('', 0)
+
+        # Linux Win/Meta key may be misreported as 'alt'
+        if scan_code in self.win_scan_codes and raw_name.lower().replace(' ', '') in ('alt', 'altgr'):
+            raw_name = 'windows'
+
+        key_name = raw_name.lower().replace('-', ' ').replace('_', ' ').strip()
+
+        # Remove left/right prefix for modifiers only
+        parts = key_name.split()
+        if len(parts) > 1 and parts[0] in ('left', 'right') and parts[1] in SIDED_MODIFIERS:
+            key_name = ' '.join(parts[1:])
+
+        # Check special keys mapping
+        if key_name in self._table:
+            return self._table[key_name]
+
+        # Single character keys
+        if len(key_name) == 1 and key_name.isalpha():
+            return (key_name.upper(), 0)
+
+        # Default formatting
+        return (key_name.title(), 0)
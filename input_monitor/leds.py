@@ -0,0 +1,272 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Keyboard lock (Num/Caps/Scroll) state monitoring.
+
+The platform library and display connection are resolved once. Updates are
+event driven where the platform allows it (XKB indicator notifications on
+X11, a low-level keyboard hook on Windows); otherwise the state is polled
+with an interval that backs off while nothing changes.
+"""
+import ctypes
+import sys
+import tkinter as tk
+
+from . import xlib
+
+
+class _X11LockState:
+    """Read lock indicators over a single persistent X11 connection."""
+
+    def __init__(self):
+        self._x11 = xlib.load_x11()
+        self._display = self._x11.XOpenDisplay(None)
+        if not self._display:
+            raise OSError('cannot open X display')
+        self._state = ctypes.c_uint()
+        self._event = xlib.XEvent()
+
+    def subscribe(self):
+        """Ask the server for indicator change notifications."""
+        opcode, event_base, error_base = ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+        major, minor = ctypes.c_int(1), ctypes.c_int(0)
+        if not self._x11.XkbQueryExtension(self._display, ctypes.byref(opcode), ctypes.byref(event_base),
+                                           ctypes.byref(error_base), ctypes.byref(major), ctypes.byref(minor)):
+            return False
+        mask = xlib.XkbIndicatorStateNotifyMask
+        return bool(self._x11.XkbSelectEvents(self._display, xlib.XkbUseCoreKbd, mask, mask))
+
+    def fileno(self):
+        return self._x11.XConnectionNumber(self._display)
+
+    def drain(self):
+        """Discard queued events; the state itself is re-read afterwards."""
+        count = 0
+        while self._x11.XPending(self._display):
+            self._x11.XNextEvent(self._display, ctypes.byref(self._event))
+            count += 1
+        return count
+
+    def read(self):
+        """Return (num, caps, scroll) lock states."""
+        self._x11.XkbGetIndicatorState(self._display, xlib.XkbUseCoreKbd, ctypes.byref(self._state))
+        value = self._state.value
+        # Bits 0, 1, 2 for Caps, Num, Scroll
+        return (bool(value & 0x02), bool(value & 0x01), bool(value & 0x04))
+
+    def close(self):
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+class _Win32LockState:
+    """Read lock key toggle states and watch lock keys with a keyboard hook."""
+
+    VK_CAPITAL = 0x14  # Caps Lock
+    VK_NUMLOCK = 0x90  # Num Lock
+    VK_SCROLL = 0x91   # Scroll Lock
+    LOCK_KEYS = {VK_CAPITAL, VK_NUMLOCK, VK_SCROLL}
+
+    WH_KEYBOARD_LL = 13
+
+    def __init__(self):
+        from ctypes import wintypes
+
+        self._user32 = ctypes.windll.user32
+        self._kernel32 = ctypes.windll.kernel32
+        self._hook = None
+        self._hook_proc = None
+        self._on_lock_key = None
+
+        class KBDLLHOOKSTRUCT(ctypes.Structure):
+            _fields_ = [
+                ('vkCode', wintypes.DWORD),
+                ('scanCode', wintypes.DWORD),
+                ('flags', wintypes.DWORD),
+                ('time', wintypes.DWORD),
+                ('dwExtraInfo', ctypes.c_size_t),
+            ]
+
+        self._hook_struct = ctypes.POINTER(KBDLLHOOKSTRUCT)
+        self._proc_type = ctypes.WINFUNCTYPE(ctypes.c_ssize_t, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+        self._user32.SetWindowsHookExW.restype = ctypes.c_void_p
+        self._user32.SetWindowsHookExW.argtypes = [ctypes.c_int, self._proc_type, ctypes.c_void_p, wintypes.DWORD]
+        self._user32.CallNextHookEx.restype = ctypes.c_ssize_t
+        self._user32.CallNextHookEx.argtypes = [ctypes.c_void_p, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+        self._user32.UnhookWindowsHookEx.argtypes = [ctypes.c_void_p]
+        self._kernel32.GetModuleHandleW.restype = ctypes.c_void_p
+
+    def subscribe(self, on_lock_key):
+        """Install a low-level keyboard hook on the calling (Tk) thread.
+
+        Tk pumps the thread's message queue, so the hook runs on the Tk
+        thread and ``on_lock_key`` may touch widgets directly.
+        """
+        def hook_proc(n_code, w_param, l_param):
+            if n_code >= 0:
+                vk = ctypes.cast(l_param, self._hook_struct).contents.vkCode
+                if vk in self.LOCK_KEYS:
+                    try:
+                        self._on_lock_key()
+                    except Exception:
+                        pass
+            return self._user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+        self._on_lock_key = on_lock_key
+        self._hook_proc = self._proc_type(hook_proc)
+        self._hook = self._user32.SetWindowsHookExW(
+            self.WH_KEYBOARD_LL, self._hook_proc, self._kernel32.GetModuleHandleW(None), 0
+        )
+        return bool(self._hook)
+
+    def read(self):
+        """Return (num, caps, scroll) lock states."""
+        # The low-order bit of GetKeyState indicates whether the key is toggled
+        return (
+            bool(self._user32.GetKeyState(self.VK_NUMLOCK) & 0x0001),
+            bool(self._user32.GetKeyState(self.VK_CAPITAL) & 0x0001),
+            bool(self._user32.GetKeyState(self.VK_SCROLL) & 0x0001),
+        )
+
+    def close(self):
+        if self._hook:
+            self._user32.UnhookWindowsHookEx(self._hook)
+            self._hook = None
+        self._hook_proc = None
+
+
+class LockStateMonitor:
+    """Report Num/Caps/Scroll Lock changes to ``callback(num, caps, scroll)``.
+
+    All callbacks run on the Tk main thread.
+    """
+
+    # Delay before re-reading after a lock key event, so the toggle has landed
+    LOCK_KEY_SETTLE_MS = 20
+
+    def __init__(self, root, callback, poll_min_ms=100, poll_max_ms=2000, force_polling=False):
+        self.root = root
+        self.callback = callback
+        self.poll_min_ms = poll_min_ms
+        self.poll_max_ms = poll_max_ms
+        self.force_polling = force_polling
+
+        self.state = None
+        self.mode = None
+        self._backend = None
+        self._fd = None
+        self._poll_ms = poll_min_ms
+        self._poll_job = None
+        self._settle_job = None
+
+    def start(self):
+        """Open the platform backend and begin watching for changes."""
+        try:
+            if sys.platform == 'win32':
+                self._backend = _Win32LockState()
+            elif sys.platform.startswith('linux'):
+                self._backend = _X11LockState()
+        except Exception:
+            self._backend = None
+
+        if self._backend is None:
+            self.mode = 'unavailable'
+            return
+
+        self.refresh()
+
+        if not self.force_polling:
+            try:
+                if self._subscribe():
+                    self.mode = 'events'
+                    return
+            except Exception:
+                pass
+
+        self.mode = 'polling'
+        self._schedule_poll()
+
+    def _subscribe(self):
+        if isinstance(self._backend, _X11LockState):
+            if not self._backend.subscribe():
+                return False
+            # Tk only supports file handlers on Unix; this raises elsewhere
+            self._fd = self._backend.fileno()
+            self.root.tk.createfilehandler(self._fd, tk.READABLE, self._on_readable)
+            # Events may already sit in Xlib's queue where select() won't see them
+            self._backend.drain()
+            return True
+        return self._backend.subscribe(self.poke)
+
+    def _on_readable(self, fd, mask):
+        try:
+            if self._backend.drain():
+                self.refresh()
+                # Anything queued while reading is already reflected in the state
+                self._backend.drain()
+        except Exception:
+            pass
+
+    def refresh(self):
+        """Read the lock states now. Returns True if anything changed."""
+        if self._backend is None:
+            return False
+        try:
+            state = self._backend.read()
+        except Exception:
+            return False
+        if state == self.state:
+            return False
+        self.state = state
+        self.callback(*state)
+        return True
+
+    def poke(self):
+        """A lock key was seen: re-read shortly and reset any poll back-off."""
+        if self._settle_job is None:
+            self._settle_job = self.root.after(self.LOCK_KEY_SETTLE_MS, self._on_settled)
+
+    def _on_settled(self):
+        self._settle_job = None
+        self.refresh()
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_ms = self.poll_min_ms
+            self._schedule_poll()
+
+    def _schedule_poll(self):
+        self._poll_job = self.root.after(self._poll_ms, self._poll)
+
+    def _poll(self):
+        if self.refresh():
+            self._poll_ms = self.poll_min_ms
+        else:
+            self._poll_ms = min(self._poll_ms * 2, self.poll_max_ms)
+        self._schedule_poll()
+
+    def stop(self):
+        """Stop watching and release the display connection or hook."""
+        for job in (self._poll_job, self._settle_job):
+            if job is not None:
+                try:
+                    self.root.after_cancel(job)
+                except Exception:
+                    pass
+        self._poll_job = self._settle_job = None
+        if self._fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self._fd)
+            except Exception:
+                pass
+            self._fd = None
+        if self._backend is not None:
+            try:
+                self._backend.close()
+            except Exception:
+                pass
+            self._backend = None
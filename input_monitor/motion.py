@@ -0,0 +1,94 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Pointer motion coalescing.
+
+Samples arrive at the mouse's polling rate (125 Hz to 8 kHz); the display
+only needs one summary per refresh. ``MotionCoalescer`` accumulates samples
+and hands out one ``MotionSample`` per interval, so the Tk work done per
+second does not depend on how fast the mouse polls.
+"""
+import collections
+import math
+
+# Summary of the pointer motion over one display interval
+MotionSample = collections.namedtuple(
+    'MotionSample',
+    ['x', 'y', 'dx', 'dy', 'distance', 'velocity', 'peak_speed', 'count']
+)
+
+
+class MotionCoalescer:
+    """Accumulate pointer samples and summarise them once per interval.
+
+    ``dx``/``dy`` are the net displacement over the interval, ``distance`` the
+    path length, ``velocity`` the mean speed and ``peak_speed`` the fastest
+    sample-to-sample speed, both in pixels per second.
+    """
+
+    def __init__(self, refresh_hz=30):
+        self.interval = 1.0 / refresh_hz
+        self.x = 0
+        self.y = 0
+        self._origin_x = 0
+        self._origin_y = 0
+        self._last_t = None
+        self._start_t = None
+        self._distance = 0.0
+        self._peak = 0.0
+        self._count = 0
+        self._moving = False
+
+    def add(self, x, y, t):
+        """Add one pointer sample taken at time ``t`` (seconds)."""
+        last_t = self._last_t
+        if self._count == 0:
+            # Measure the interval from the previous sample, but never reach
+            # back further than one refresh (the pointer may have been idle)
+            self._start_t = t if last_t is None else max(last_t, t - self.interval)
+        if last_t is not None:
+            step = math.hypot(x - self.x, y - self.y)
+            self._distance += step
+            dt = t - last_t
+            if dt > 0:
+                speed = step / dt
+                if speed > self._peak:
+                    self._peak = speed
+        self.x = x
+        self.y = y
+        self._last_t = t
+        self._count += 1
+
+    def flush(self):
+        """Return the summary since the previous flush, or None if nothing changed.
+
+        After motion stops a single zero-velocity sample is returned so that
+        readouts settle.
+        """
+        if self._count == 0:
+            if not self._moving:
+                return None
+            self._moving = False
+            return MotionSample(self.x, self.y, 0, 0, 0.0, 0.0, 0.0, 0)
+
+        span = self._last_t - self._start_t
+        sample = MotionSample(
+            self.x, self.y,
+            self.x - self._origin_x, self.y - self._origin_y,
+            self._distance,
+            self._distance / span if span > 0 else 0.0,
+            self._peak,
+            self._count
+        )
+
+        self._origin_x = self.x
+        self._origin_y = self.y
+        self._distance = 0.0
+        self._peak = 0.0
+        self._count = 0
+        self._moving = True
+        return sample
@@ -0,0 +1,31 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Per-user file locations.
+"""
+import os
+import sys
+
+APP_DIR_NAME = 'input-monitor'
+
+
+def config_dir():
+    """Return the per-user configuration directory (it may not exist yet)."""
+    if sys.platform == 'win32':
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def cache_dir():
+    """Return the per-user cache directory (it may not exist yet)."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.environ.get('APPDATA') or os.path.expanduser('~')
+        return os.path.join(base, APP_DIR_NAME, 'cache')
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, APP_DIR_NAME)
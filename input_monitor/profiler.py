@@ -0,0 +1,189 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Production profiling (``--profile=cpu|alloc|both --profile-out=DIR``).
+
+``cpu`` samples the stacks of every thread (Tk and input listeners) from a
+background thread and writes them in collapsed-stack format, one
+``thread;frame;frame... count`` line per stack, for flamegraph.pl or
+speedscope. ``alloc`` takes tracemalloc snapshots periodically and writes
+the top allocation growth since the previous snapshot and since start.
+Output is written on exit and whenever SIGUSR1 is received.
+"""
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+
+PROFILE_MODES = ('cpu', 'alloc', 'both')
+
+
+class StackSampler:
+    """Count the stacks of all other threads every ``interval`` seconds."""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = 0
+        self.stacks = {}
+        self._labels = {}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            label = self._labels[code] = f"{module}:{code.co_name}"
+        return label
+
+    def _run(self):
+        own_id = threading.get_ident()
+        stacks = self.stacks
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, str(thread_id)))
+                key = ';'.join(reversed(labels))
+                stacks[key] = stacks.get(key, 0) + 1
+            self.samples += 1
+
+    def write(self, path):
+        """Write the collapsed stacks, hottest first."""
+        stacks = dict(self.stacks)
+        with open(path, 'w') as f:
+            for stack, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                f.write(f"{stack} {count}\n")
+
+
+class AllocationTracker:
+    """Periodic tracemalloc snapshots and top-allocation diffs."""
+
+    FRAMES = 8
+    TOP = 30
+
+    def __init__(self, interval_minutes=10.0):
+        self.interval = interval_minutes * 60.0
+        self.baseline = None
+        self.previous = None
+        self.current = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.FRAMES)
+        self.baseline = self.previous = self.current = self._snapshot()
+        self._thread = threading.Thread(target=self._run, name='alloc-snapshots', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _snapshot(self):
+        # Leave out tracemalloc's own bookkeeping
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.snapshot()
+
+    def snapshot(self):
+        self.previous, self.current = self.current, self._snapshot()
+
+    def write(self, path):
+        """Write the top growth since the previous snapshot and since start."""
+        current, previous, baseline = self.current, self.previous, self.baseline
+        traced, peak = tracemalloc.get_traced_memory()
+        with open(path, 'w') as f:
+            f.write(f"traced {traced / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB\n")
+            for title, older in (('since previous snapshot', previous), ('since start', baseline)):
+                f.write(f"\nTop {self.TOP} allocation growth {title}:\n")
+                for stat in current.compare_to(older, 'traceback')[:self.TOP]:
+                    f.write(f"{stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  "
+                            f"(now {stat.size / 1024:.1f} KiB)\n")
+                    for line in stat.traceback.format(limit=self.FRAMES):
+                        f.write(f"    {line}\n")
+
+
+class Profiler:
+    """Run the samplers for ``mode`` and write their output into ``out_dir``."""
+
+    def __init__(self, mode, out_dir, sample_interval=0.005, alloc_interval_minutes=10.0):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f'unknown profile mode: {mode}')
+        self.out_dir = out_dir
+        self.sampler = StackSampler(sample_interval) if mode in ('cpu', 'both') else None
+        self.allocations = AllocationTracker(alloc_interval_minutes) if mode in ('alloc', 'both') else None
+        self._dump_lock = threading.Lock()
+
+    def start(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        if self.sampler:
+            self.sampler.start()
+        if self.allocations:
+            self.allocations.start()
+        if hasattr(signal, 'SIGUSR1'):
+            try:
+                signal.signal(signal.SIGUSR1, lambda signum, frame: self._dump_async())
+            except ValueError:
+                # Not on the main thread
+                pass
+
+    def _dump_async(self):
+        # Snapshots can take a while; keep the signal handler (and Tk) responsive
+        threading.Thread(target=self.dump, name='profile-dump', daemon=True).start()
+
+    def dump(self, final=False):
+        """Write the current profiles; returns the paths written."""
+        with self._dump_lock:
+            suffix = 'final' if final else time.strftime('%Y%m%d-%H%M%S')
+            paths = []
+            if self.sampler:
+                path = os.path.join(self.out_dir, f'cpu-{suffix}.collapsed')
+                self.sampler.write(path)
+                paths.append(path)
+            if self.allocations:
+                self.allocations.snapshot()
+                path = os.path.join(self.out_dir, f'alloc-{suffix}.txt')
+                self.allocations.write(path)
+                paths.append(path)
+            return paths
+
+    def stop(self):
+        """Stop sampling and write the final profiles."""
+        if self.sampler:
+            self.sampler.stop()
+        if self.allocations:
+            self.allocations.stop()
+        paths = self.dump(final=True)
+        if self.allocations:
+            tracemalloc.stop()
+        return paths
@@ -0,0 +1,233 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Binary session recorder.
+
+Every input event the widget handles is appended as a fixed-width record to
+a memory-mapped file that grows in chunks:
+
+    header   64 bytes: magic, version, record size, start times, record count
+    records  20 bytes: monotonic ns, type, flags, code, x, y
+
+``code`` is an id into the session's name table, which holds key and button
+names and is kept in a ``<file>.names`` sidecar (one JSON string per line,
+in id order). For key events ``x`` is the scan code (-1 if unknown); for
+clicks ``flags`` is 1 on press; for scrolls ``x`` and ``y`` are the wheel
+steps. A background thread flushes the mapping and the record count, so the
+recording side only packs bytes into memory.
+"""
+import json
+import mmap
+import struct
+import threading
+import time
+
+from .events import KEY_DOWN, KEY_UP, MOVE, CLICK, SELECT_START, SELECT_END, SCROLL
+
+RECORD_TYPES = {KEY_DOWN: 'key_down', KEY_UP: 'key_up', MOVE: 'move', CLICK: 'click',
+                SELECT_START: 'select_start', SELECT_END: 'select_end', SCROLL: 'scroll'}
+
+MAGIC = b'IMREC\0\0\1'
+VERSION = 1
+
+# magic, version, record size, start wall time, start monotonic ns, record count
+HEADER = struct.Struct('<8sHHdQQ')
+HEADER_SIZE = 64
+COUNT_OFFSET = HEADER.size - 8
+
+# monotonic ns, type, flags, code, x, y
+RECORD = struct.Struct('<QBBHii')
+
+NO_SCAN_CODE = -1
+
+
+def names_path(path):
+    """Return the name-table sidecar path for a recording."""
+    return path + '.names'
+
+
+class SessionRecorder:
+    """Append input events to a memory-mapped session file.
+
+    Recording methods must be called from a single thread (the Tk thread).
+    """
+
+    CHUNK_SIZE = 1 << 20
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, path):
+        self.path = path
+        self._wall_base = time.time()
+        self._mono_base = time.monotonic_ns()
+
+        self._file = open(path, 'w+b')
+        self._file.truncate(HEADER_SIZE + self.CHUNK_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), HEADER_SIZE + self.CHUNK_SIZE)
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, RECORD.size, self._wall_base, self._mono_base, 0)
+        self._capacity = len(self._map)
+        self._offset = HEADER_SIZE
+        self._pack = RECORD.pack_into
+
+        self._names = {}
+        self._new_names = []
+        self._names_file = open(names_path(path), 'w', encoding='utf-8')
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name='session-flusher', daemon=True)
+        self._flusher.start()
+
+    @property
+    def start_ns(self):
+        """Monotonic ns the recording's timestamps count from."""
+        return self._mono_base
+
+    @property
+    def count(self):
+        return (self._offset - HEADER_SIZE) // RECORD.size
+
+    def _timestamp(self, event_time):
+        # Event times are epoch seconds; map them onto the monotonic clock
+        if event_time is None:
+            return time.monotonic_ns()
+        return max(0, self._mono_base + int((event_time - self._wall_base) * 1e9))
+
+    def _name_id(self, name):
+        name_id = self._names.get(name)
+        if name_id is None:
+            name_id = self._names[name] = len(self._names)
+            with self._lock:
+                self._new_names.append(name)
+        return name_id
+
+    def record(self, kind, event_time=None, code=0, x=0, y=0, flags=0):
+        """Append one record."""
+        offset = self._offset
+        if offset + RECORD.size > self._capacity:
+            self._grow()
+        self._pack(self._map, offset, self._timestamp(event_time), kind, flags, code, x, y)
+        self._offset = offset + RECORD.size
+
+    def key(self, kind, name, event_time=None, scan_code=None):
+        self.record(kind, event_time, self._name_id(name),
+                    NO_SCAN_CODE if scan_code is None else scan_code)
+
+    def move(self, x, y, event_time=None):
+        # The hot path at high polling rates, so record() is inlined
+        offset = self._offset
+        if offset + RECORD.size > self._capacity:
+            self._grow()
+        self._pack(self._map, offset, self._timestamp(event_time), MOVE, 0, 0, x, y)
+        self._offset = offset + RECORD.size
+
+    def click(self, x, y, button, pressed, event_time=None):
+        self.record(CLICK, event_time, self._name_id(button), x, y, 1 if pressed else 0)
+
+    def scroll(self, dx, dy, event_time=None):
+        self.record(SCROLL, event_time, 0, dx, dy)
+
+    def selection(self, kind, x, y, event_time=None):
+        self.record(kind, event_time, 0, x, y)
+
+    def _grow(self):
+        with self._lock:
+            self._capacity += self.CHUNK_SIZE
+            self._map.resize(self._capacity)
+
+    def _flush_loop(self):
+        while not self._stopped.wait(self.FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def flush(self):
+        """Write pending names and the record count, and sync the mapping."""
+        with self._lock:
+            if self._map.closed:
+                return
+            names, self._new_names = self._new_names, []
+            struct.pack_into('<Q', self._map, COUNT_OFFSET, self.count)
+            self._map.flush()
+        if names:
+            self._names_file.write(''.join(json.dumps(name) + '\n' for name in names))
+            self._names_file.flush()
+
+    def close(self):
+        """Stop recording and trim the file to the records written."""
+        if self._map.closed:
+            return
+        self._stopped.set()
+        self._flusher.join()
+        self.flush()
+        size = self._offset
+        with self._lock:
+            self._map.close()
+        self._file.truncate(size)
+        self._file.close()
+        self._names_file.close()
+
+
+class SessionReader:
+    """Read a session file; iterating yields (t_ns, type, name, flags, x, y).
+
+    ``name`` is the key or button name, or None for moves and selections.
+    Records are read in blocks as they are iterated, so a session never has
+    to fit in memory.
+    """
+
+    BLOCK_RECORDS = 4096
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+            f.seek(0, 2)
+            size = f.tell()
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f'{path}: not an input-monitor session file')
+        magic, version, record_size, self.start_time, self.start_ns, count = HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError(f'{path}: not an input-monitor session file')
+        # Records flushed when the header was last written; a recording that
+        # was not closed cleanly may hold more, followed by zeroed space
+        self.count = count
+        self._available = (size - HEADER_SIZE) // RECORD.size
+
+        self.names = []
+        try:
+            with open(names_path(path), encoding='utf-8') as f:
+                self.names = [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            pass
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        names = self.names
+        name_count = len(names)
+        trusted = self.count
+        index = 0
+        with open(self.path, 'rb') as f:
+            f.seek(HEADER_SIZE)
+            while index < self._available:
+                block = f.read(min(self.BLOCK_RECORDS, self._available - index) * RECORD.size)
+                if len(block) < RECORD.size:
+                    return
+                for t_ns, kind, flags, code, x, y in RECORD.iter_unpack(block[:len(block) - len(block) % RECORD.size]):
+                    if index >= trusted and not (t_ns or kind or flags or code or x or y):
+                        return
+                    index += 1
+                    name = None
+                    if kind == KEY_DOWN or kind == KEY_UP or kind == CLICK:
+                        name = names[code] if code < name_count else None
+                    yield t_ns, kind, name, flags, x, y
+
+    def wall_time(self, t_ns):
+        """Convert a record timestamp to epoch seconds."""
+        return self.start_time + (t_ns - self.start_ns) / 1e9
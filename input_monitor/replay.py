@@ -0,0 +1,263 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Replay recorded or synthetic input into the widget.
+
+Event sources are generators of event-queue records ((KEY_DOWN, t, name,
+scan_code), (MOVE, t, x, y), ...), read lazily so long sessions never load
+fully into memory. ``Replayer`` feeds them to the widget's handlers on the Tk
+thread in real time, N times faster, or as fast as possible, and the widget
+runs with its input listeners disabled:
+
+    python -m input_monitor.replay session.imrec --speed 4
+    python -m input_monitor.replay --synthetic 60 --fast --renderer canvas
+"""
+import argparse
+import random
+import time
+import tkinter as tk
+
+from .events import KEY_DOWN, KEY_UP, MOVE, CLICK, SCROLL
+from .recorder import SessionReader, NO_SCAN_CODE
+
+
+def read_session(path):
+    """Yield event records from a session recording."""
+    reader = SessionReader(path)
+    start_time, start_ns = reader.start_time, reader.start_ns
+    for t_ns, kind, name, flags, x, y in reader:
+        t = start_time + (t_ns - start_ns) / 1e9
+        if kind == MOVE:
+            yield (MOVE, t, x, y)
+        elif kind == KEY_DOWN or kind == KEY_UP:
+            yield (kind, t, name, None if x == NO_SCAN_CODE else x)
+        elif kind == CLICK:
+            yield (CLICK, t, x, y, name, bool(flags))
+        elif kind == SCROLL:
+            yield (SCROLL, t, x, y)
+        # Selection records are derived from clicks and moves on replay
+
+
+def synthetic_session(duration, mouse_hz=1000, keys_per_second=8, clicks_per_second=1, seed=0):
+    """Yield a deterministic, pseudo-random session ``duration`` seconds long.
+
+    The mouse wanders at ``mouse_hz`` samples per second while keys are
+    typed (with an occasional Ctrl chord) and the left button is clicked and
+    dragged.
+    """
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    x, y = 500, 500
+    next_key = rng.expovariate(keys_per_second) if keys_per_second else duration
+    next_click = rng.expovariate(clicks_per_second) if clicks_per_second else duration
+    key_releases = []
+    button_release = None
+    step = 1.0 / mouse_hz
+    t = 0.0
+    while t < duration:
+        while key_releases and key_releases[0][1] <= t:
+            yield key_releases.pop(0)
+        if button_release is not None and button_release <= t:
+            yield (CLICK, t, x, y, 'left', False)
+            button_release = None
+
+        if t >= next_key:
+            name = rng.choice(letters)
+            if rng.random() < 0.1:
+                yield (KEY_DOWN, t, 'ctrl', 29)
+                key_releases.append((KEY_UP, t + 0.12, 'ctrl', 29))
+            yield (KEY_DOWN, t, name, None)
+            key_releases.append((KEY_UP, t + rng.uniform(0.04, 0.1), name, None))
+            key_releases.sort(key=lambda record: record[1])
+            next_key = t + rng.expovariate(keys_per_second)
+
+        if t >= next_click and button_release is None:
+            yield (CLICK, t, x, y, 'left', True)
+            button_release = t + rng.uniform(0.08, 0.4)
+            next_click = t + rng.expovariate(clicks_per_second)
+
+        x = min(max(x + rng.randint(-3, 3), 0), 3839)
+        y = min(max(y + rng.randint(-3, 3), 0), 2159)
+        yield (MOVE, t, x, y)
+        t += step
+
+    for record in key_releases:
+        yield record
+    if button_release is not None:
+        yield (CLICK, t, x, y, 'left', False)
+
+
+class Replayer:
+    """Feed event records into ``widget`` from the Tk main loop.
+
+    ``speed`` scales playback (1.0 is real time); None or 0 replays as fast
+    as possible. Event times keep their recorded spacing, rebased to the
+    start of the replay, so replays behave the same at any speed. With
+    ``through_queue`` records are pushed onto the widget's event queue, as
+    the input hooks do, instead of calling the handlers directly.
+    """
+
+    # Longest stretch spent dispatching before Tk gets control back
+    TICK_BUDGET_MS = 8
+    CHECK_EVERY = 64
+
+    def __init__(self, widget, records, speed=1.0, through_queue=False, on_done=None):
+        self.widget = widget
+        self.root = widget.root
+        self.records = iter(records)
+        self.speed = speed or None
+        self.through_queue = through_queue
+        self.on_done = on_done
+
+        self.count = 0
+        self.started = None
+        self.finished = None
+        self._next = None
+        self._job = None
+        self._clock_start = None
+        self._t0 = None
+        self._time_base = None
+
+    @property
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def start(self):
+        self._next = next(self.records, None)
+        self.started = time.perf_counter()
+        self._clock_start = time.monotonic()
+        self._time_base = time.time()
+        if self._next is not None:
+            self._t0 = self._next[1]
+        self._schedule(0)
+
+    def stop(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _schedule(self, delay_ms):
+        if self.speed is None:
+            # Chained through idle callbacks so redraws and timers still run
+            self._job = self.root.after_idle(self._tick)
+        else:
+            self._job = self.root.after(delay_ms, self._tick)
+
+    def _tick(self):
+        self._job = None
+        dispatch = self.widget.events.push if self.through_queue else self.widget._dispatch_event
+        speed = self.speed
+        t0, base = self._t0, self._time_base
+        now = time.monotonic()
+        deadline = time.perf_counter() + self.TICK_BUDGET_MS / 1000.0
+        check = self.CHECK_EVERY
+        due = None
+        record = self._next
+        while record is not None:
+            if speed is not None:
+                due = self._clock_start + (record[1] - t0) / speed
+                if due > now:
+                    break
+            dispatch((record[0], record[1] - t0 + base) + record[2:])
+            self.count += 1
+            record = next(self.records, None)
+            check -= 1
+            if not check:
+                check = self.CHECK_EVERY
+                if time.perf_counter() >= deadline:
+                    break
+                now = time.monotonic()
+        self._next = record
+
+        if record is None:
+            self.finished = time.perf_counter()
+            if self.on_done:
+                self.on_done()
+        elif due is not None and due > now:
+            self._schedule(max(0, int((due - time.monotonic()) * 1000)))
+        else:
+            self._schedule(0)
+
+    def stats(self):
+        elapsed = self.elapsed
+        return {
+            'events': self.count,
+            'elapsed_s': round(elapsed, 6),
+            'events_per_s': round(self.count / elapsed, 1) if elapsed else 0.0,
+            'queue_dropped': self.widget.events.dropped,
+        }
+
+
+def run_headless(records, speed=None, renderer=None, layout=None, show=False, through_queue=False,
+                 settle_ms=100, **options):
+    """Replay ``records`` into a fresh widget and return the replay stats.
+
+    The window is withdrawn unless ``show`` is set; Tk still needs a display.
+    ``options`` are passed on to the widget.
+    """
+    from .app import InputMonitorWidget
+
+    root = tk.Tk()
+    if not show:
+        root.withdraw()
+    widget = InputMonitorWidget(root, renderer=renderer, layout=layout, listeners=False, **options)
+
+    def finish():
+        # Let queued events drain and the last motion refresh run
+        root.after(settle_ms, root.quit)
+
+    replayer = Replayer(widget, records, speed=speed, through_queue=through_queue, on_done=finish)
+    replayer.start()
+    try:
+        root.mainloop()
+    finally:
+        replayer.stop()
+        widget.close_app()
+    return replayer.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-replay',
+        description='Replay a recorded or synthetic input session into the input monitor.'
+    )
+    parser.add_argument('session', nargs='?', help='session file written by the recorder')
+    parser.add_argument('--synthetic', type=float, metavar='SECONDS',
+                        help='replay a generated session of this length instead')
+    parser.add_argument('--seed', type=int, default=0, help='seed for --synthetic (default: 0)')
+    parser.add_argument('--speed', type=float, default=1.0, help='playback speed factor (default: 1.0)')
+    parser.add_argument('--fast', action='store_true', help='replay as fast as possible')
+    parser.add_argument('--queue', action='store_true', help='go through the event queue like the input hooks')
+    parser.add_argument('--renderer', choices=('frame', 'canvas'))
+    parser.add_argument('--layout', choices=('full', 'compact', 'ticker'))
+    parser.add_argument('--show', action='store_true', help='show the window while replaying')
+    parser.add_argument('--analytics', metavar='PATH',
+                        help='write the session analytics here (JSON, or CSV for a .csv PATH)')
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        records = synthetic_session(args.synthetic, seed=args.seed)
+    elif args.session:
+        records = read_session(args.session)
+    else:
+        parser.error('a session file or --synthetic is required')
+
+    stats = run_headless(records, speed=None if args.fast else args.speed, renderer=args.renderer,
+                         layout=args.layout, show=args.show, through_queue=args.queue,
+                         analytics=bool(args.analytics) or None, analytics_path=args.analytics)
+    print(f"{stats['events']} events in {stats['elapsed_s']:.3f} s "
+          f"({stats['events_per_s']:.0f} events/s, {stats['queue_dropped']} dropped)")
+
+
+if __name__ == "__main__":
+    main()
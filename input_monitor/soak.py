@@ -0,0 +1,268 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Soak test: drive millions of synthetic events through the widget and watch
+for resource growth.
+
+Chords, Win combos (the inline icon strip), clicks, double clicks,
+side buttons, scroll bursts, selections and moves are replayed as fast as possible while the process
+RSS, Tk widget count, pending ``after`` jobs, threads and open file
+descriptors (X display connections are sockets) are sampled at intervals.
+After a warm-up, a resource leaks if the lowest value in the second half of
+the samples is above the highest value in the first half (plus a tolerance
+for RSS). The exit status is 1 if anything leaked.
+
+    python -m input_monitor.soak --events 5000000 --output soak.json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+from .events import KEY_DOWN, KEY_UP, MOVE, CLICK, SCROLL
+
+# Fraction of samples ignored while caches and allocator pools fill up
+WARMUP_FRACTION = 0.2
+
+# RSS may wobble this much (bytes, or fraction of the first half's peak)
+RSS_TOLERANCE_BYTES = 2 * 1024 * 1024
+RSS_TOLERANCE_FRACTION = 0.05
+
+
+def soak_events(count, step=0.01):
+    """Yield ``count`` event records cycling through the soak patterns."""
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    t = 0.0
+    produced = 0
+    cycle = 0
+
+    while True:
+        key = letters[cycle % len(letters)]
+        x, y = 200 + cycle % 500, 200 + cycle % 300
+        cycle += 1
+        patterns = (
+            # Ctrl + Shift + key
+            [(KEY_DOWN, 'ctrl', 29), (KEY_DOWN, 'shift', 42), (KEY_DOWN, key, None),
+             (KEY_UP, key, None), (KEY_UP, 'shift', 42), (KEY_UP, 'ctrl', 29)],
+            # Win combos: lone Win, Win + key, Ctrl + Win + key
+            [(KEY_DOWN, 'windows', 125), (KEY_UP, 'windows', 125),
+             (KEY_DOWN, 'windows', 125), (KEY_DOWN, key, None), (KEY_UP, key, None), (KEY_UP, 'windows', 125),
+             (KEY_DOWN, 'ctrl', 29), (KEY_DOWN, 'windows', 125), (KEY_DOWN, key, None),
+             (KEY_UP, key, None), (KEY_UP, 'windows', 125), (KEY_UP, 'ctrl', 29)],
+            # Single and double clicks on each button
+            [(CLICK, x, y, 'left', True), (CLICK, x, y, 'left', False),
+             (CLICK, x, y, 'right', True), (CLICK, x, y, 'right', False),
+             (CLICK, x, y, 'middle', True), (CLICK, x, y, 'middle', False),
+             (CLICK, x, y, 'middle', True), (CLICK, x, y, 'middle', False),
+             (CLICK, x, y, 'left', True), (CLICK, x, y, 'left', False),
+             (CLICK, x, y, 'x1', True), (CLICK, x, y, 'x1', False),
+             (CLICK, x, y, 'x2', True), (CLICK, x, y, 'x2', False)],
+            # Scroll burst, then the other way
+            [(SCROLL, 0, -1)] * 30 + [(SCROLL, 0, 1)] * 10 + [(SCROLL, 1, 0)] * 5,
+            # Selection drag
+            [(CLICK, x, y, 'left', True)] + [(MOVE, x + i * 4, y + i * 3) for i in range(1, 40)]
+            + [(CLICK, x + 156, y + 117, 'left', False)],
+            # Free moves
+            [(MOVE, x + i, y - i) for i in range(50)],
+        )
+        for pattern in patterns:
+            for kind, *fields in pattern:
+                if produced >= count:
+                    return
+                yield (kind, t, *fields)
+                produced += 1
+                t += step
+        # Clear the double click window between cycles
+        t += 1.0
+
+
+def rss_bytes():
+    """Current resident set size of this process, or None."""
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+    return None
+
+
+def open_handles():
+    """(open file descriptors, of which sockets), or (None, None)."""
+    fd_dir = '/proc/self/fd'
+    if not os.path.isdir(fd_dir):
+        return None, None
+    fds = sockets = 0
+    for name in os.listdir(fd_dir):
+        try:
+            target = os.readlink(os.path.join(fd_dir, name))
+        except OSError:
+            continue
+        fds += 1
+        if target.startswith('socket:'):
+            sockets += 1
+    return fds, sockets
+
+
+def count_widgets(widget):
+    count = 1
+    for child in widget.winfo_children():
+        count += count_widgets(child)
+    return count
+
+
+def sample(widget, events):
+    """Take one resource sample."""
+    root = widget.root
+    fds, sockets = open_handles()
+    try:
+        after_jobs = len(root.tk.call('after', 'info'))
+    except Exception:
+        after_jobs = None
+    return {
+        'events': events,
+        'time_s': round(time.monotonic(), 3),
+        'rss': rss_bytes(),
+        'widgets': count_widgets(root),
+        'after_jobs': after_jobs,
+        'threads': threading.active_count(),
+        'fds': fds,
+        'sockets': sockets,
+    }
+
+
+def find_leaks(samples):
+    """Return {metric: (first half peak, second half floor)} for growing metrics."""
+    start = int(len(samples) * WARMUP_FRACTION)
+    steady = samples[start:]
+    if len(steady) < 4:
+        return {}
+    half = len(steady) // 2
+    leaks = {}
+    for metric in ('rss', 'widgets', 'after_jobs', 'threads', 'fds', 'sockets'):
+        first = [s[metric] for s in steady[:half] if s[metric] is not None]
+        second = [s[metric] for s in steady[half:] if s[metric] is not None]
+        if not first or not second:
+            continue
+        peak, floor = max(first), min(second)
+        tolerance = 0
+        if metric == 'rss':
+            tolerance = max(RSS_TOLERANCE_BYTES, peak * RSS_TOLERANCE_FRACTION)
+        if floor > peak + tolerance:
+            leaks[metric] = (peak, floor)
+    return leaks
+
+
+def run(events=1000000, samples=40, renderer=None, force_stub=False, progress=None):
+    """Run the soak and return the report."""
+    from .bench import select_tk
+    from .replay import Replayer
+
+    tk_module, tk_kind, cleanup = select_tk(force_stub)
+    try:
+        from .app import InputMonitorWidget
+
+        root = tk_module.Tk()
+        root.withdraw()
+        widget = InputMonitorWidget(root, renderer=renderer, listeners=False)
+        collected = []
+        every = max(1, events // samples)
+        next_sample = [0]
+
+        def watch():
+            # Sampled from the Tk thread between replay ticks
+            if replayer.count >= next_sample[0]:
+                collected.append(sample(widget, replayer.count))
+                next_sample[0] += every
+                if progress:
+                    progress(collected[-1])
+            if not replayer.done:
+                watch_job[0] = root.after(50, watch)
+
+        def finish():
+            # Let pending timers (reset, motion refresh) run before the last sample
+            root.after(widget.RESET_DELAY_MS + 200, root.quit)
+
+        replayer = Replayer(widget, soak_events(events), speed=None, on_done=finish)
+        watch_job = [root.after(0, watch)]
+        replayer.start()
+        try:
+            root.mainloop()
+        finally:
+            replayer.stop()
+        collected.append(sample(widget, replayer.count))
+        widget.close_app()
+    finally:
+        cleanup()
+
+    leaks = find_leaks(collected)
+    return {
+        'tk': tk_kind,
+        'renderer': renderer or 'frame',
+        'events': replayer.count,
+        'elapsed_s': round(replayer.elapsed, 3),
+        'passed': not leaks,
+        'leaks': {metric: {'first_half_peak': peak, 'second_half_floor': floor}
+                  for metric, (peak, floor) in leaks.items()},
+        'samples': collected,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-soak',
+        description='Drive synthetic input through the input monitor and check for resource growth.'
+    )
+    parser.add_argument('--events', type=int, default=1000000, help='events to replay (default: %(default)s)')
+    parser.add_argument('--samples', type=int, default=40, help='resource samples to take (default: %(default)s)')
+    parser.add_argument('--renderer', choices=('frame', 'canvas'))
+    parser.add_argument('--stub-tk', action='store_true', help='use the stub Tk layer even with a display')
+    parser.add_argument('--output', metavar='PATH', help='write the JSON report here')
+    parser.add_argument('--quiet', action='store_true', help='do not print samples while running')
+    args = parser.parse_args(argv)
+
+    def progress(entry):
+        rss = entry['rss'] / 1048576 if entry['rss'] is not None else float('nan')
+        print(f"{entry['events']:>10} events  rss {rss:7.1f} MiB  widgets {entry['widgets']}  "
+              f"after {entry['after_jobs']}  threads {entry['threads']}  fds {entry['fds']}", file=sys.stderr)
+
+    report = run(args.events, args.samples, args.renderer, args.stub_tk, None if args.quiet else progress)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    if report['passed']:
+        print(f"PASS: {report['events']} events in {report['elapsed_s']} s, no resource growth")
+    else:
+        for metric, values in report['leaks'].items():
+            print(f"FAIL: {metric} grew from {values['first_half_peak']} to at least {values['second_half_floor']}")
+    return 0 if report['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
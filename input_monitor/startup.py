@@ -0,0 +1,208 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Startup timing (``--startup-report``) and the startup-time benchmark.
+
+``input-monitor --startup-report`` starts normally, then prints how long
+each phase took, measured from process start (so the interpreter and, for
+the frozen exe, the bootloader are included), followed by the slowest
+imports from ``python -X importtime``, and exits:
+
+    main        interpreter up, ``main()`` entered
+    widget      widget built
+    first_frame first frame drawn
+    listeners   input backend started (runs in parallel with the above)
+
+The benchmark runs the import steps and the app in fresh processes and
+fails when the median time to first frame is over budget:
+
+    python -m input_monitor.startup --runs 5 --budget-ms 500 --output startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Median time to first frame the benchmark allows, in milliseconds
+FIRST_FRAME_BUDGET_MS = 500.0
+
+PHASES = ('main', 'widget', 'first_frame', 'listeners')
+
+
+def process_uptime():
+    """Seconds since this process started, or None if unknown."""
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/stat') as f:
+                # The command name may contain spaces; fields resume after ')'
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open('/proc/uptime') as f:
+                uptime = float(f.read().split()[0])
+            return uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK')
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        creation, exit_time, kernel, user, now = (wintypes.FILETIME() for _ in range(5))
+        kernel32 = ctypes.windll.kernel32
+        if not kernel32.GetProcessTimes(kernel32.GetCurrentProcess(), ctypes.byref(creation),
+                                        ctypes.byref(exit_time), ctypes.byref(kernel), ctypes.byref(user)):
+            return None
+        kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+
+        def ticks(filetime):
+            return (filetime.dwHighDateTime << 32) | filetime.dwLowDateTime
+
+        # FILETIME counts 100 ns intervals
+        return (ticks(now) - ticks(creation)) / 1e7
+    return None
+
+
+def import_breakdown(module='input_monitor.app', top=15):
+    """Return the ``top`` slowest imports of ``module`` as (self ms, cumulative ms, name)."""
+    if getattr(sys, 'frozen', False):
+        # No interpreter to re-run in a frozen build
+        return []
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except (ValueError, IndexError):
+            # The header line
+            continue
+        rows.append((self_us / 1000.0, cumulative_us / 1000.0, parts[2].strip()))
+    rows.sort(key=lambda row: -row[1])
+    return rows[:top]
+
+
+class StartupTimer:
+    """Phase times in milliseconds since process start."""
+
+    def __init__(self):
+        uptime = process_uptime()
+        self.origin = time.perf_counter() - (uptime if uptime is not None else 0.0)
+        self.from_process_start = uptime is not None
+        self.phases = {}
+
+    def mark(self, phase):
+        self.phases[phase] = round((time.perf_counter() - self.origin) * 1000.0, 1)
+
+    def report(self):
+        return {
+            'from_process_start': self.from_process_start,
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'phases_ms': dict(self.phases),
+            'imports': [
+                {'self_ms': self_ms, 'cumulative_ms': cumulative_ms, 'module': name}
+                for self_ms, cumulative_ms, name in import_breakdown()
+            ],
+        }
+
+    def format(self, report):
+        origin = 'process start' if report['from_process_start'] else 'main()'
+        lines = [f"Startup (ms since {origin}):"]
+        for phase in PHASES:
+            if phase in report['phases_ms']:
+                lines.append(f"  {phase:<12}{report['phases_ms'][phase]:>9.1f}")
+        if report['imports']:
+            lines.append("Slowest imports (cumulative / self ms):")
+            for entry in report['imports']:
+                lines.append(f"  {entry['cumulative_ms']:>9.1f} {entry['self_ms']:>9.1f}  {entry['module']}")
+        return '\n'.join(lines)
+
+
+def _time_import(module):
+    """Milliseconds to import ``module`` in a fresh interpreter."""
+    code = f'import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return float(output.strip()) * 1000.0
+
+
+def _time_first_frame():
+    """Phase times of one ``--startup-report=json`` run, or None without a display."""
+    result = subprocess.run([sys.executable, '-m', 'input_monitor', '--startup-report=json'],
+                            capture_output=True, text=True, timeout=60)
+    if result.returncode != 0:
+        return None
+    try:
+        return json.loads(result.stdout)['phases_ms']
+    except (ValueError, KeyError):
+        return None
+
+
+def run(runs=5):
+    """Run the startup benchmark and return its report (budget not applied)."""
+    from .bench import _start_xvfb
+
+    server = None
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+        server = _start_xvfb()
+    try:
+        samples = {'import_package': [], 'import_app': []}
+        for _ in range(runs):
+            samples['import_package'].append(_time_import('input_monitor'))
+            samples['import_app'].append(_time_import('input_monitor.app'))
+            phases = _time_first_frame()
+            if phases is not None:
+                for phase, value in phases.items():
+                    samples.setdefault(phase, []).append(value)
+    finally:
+        if server:
+            server.terminate()
+
+    return {
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'runs': runs,
+        'median_ms': {name: round(statistics.median(values), 1) for name, values in samples.items() if values},
+        'samples_ms': {name: [round(value, 1) for value in values] for name, values in samples.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='input-monitor-startup',
+        description='Measure input monitor import and time-to-first-frame against a budget.'
+    )
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per measurement (default: %(default)s)')
+    parser.add_argument('--budget-ms', type=float, default=FIRST_FRAME_BUDGET_MS,
+                        help='median time to first frame allowed (default: %(default)s)')
+    parser.add_argument('--output', metavar='PATH', help='write the JSON report here')
+    args = parser.parse_args(argv)
+
+    report = run(args.runs)
+    medians = report['median_ms']
+    report['budget_ms'] = args.budget_ms
+    report['passed'] = medians.get('first_frame', 0.0) <= args.budget_ms
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    for name, value in medians.items():
+        print(f"{name:<16}{value:>9.1f} ms")
+    if 'first_frame' not in medians:
+        print("first_frame not measured (no display); budget not checked")
+    elif report['passed']:
+        print(f"PASS: first frame in {medians['first_frame']} ms (budget {args.budget_ms} ms)")
+    else:
+        print(f"FAIL: first frame in {medians['first_frame']} ms (budget {args.budget_ms} ms)")
+    return 0 if report['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Latency and throughput instrumentation (``--stats``).
+
+For each event type three timings are collected into fixed-size,
+log-bucketed histograms, so memory stays constant however long the session:
+
+    queue_delay   hook timestamp (the event's own time) -> handler start
+    handling      time spent in the handler
+    to_idle       handler end -> Tk idle (pending redraws done)
+"""
+import json
+import math
+import sys
+import time
+
+from .events import EVENT_NAMES
+
+
+class StreamingHistogram:
+    """Histogram of durations in seconds with ~5% relative bucket width."""
+
+    MIN_VALUE = 1e-6
+    MAX_VALUE = 100.0
+    GROWTH = 1.05
+
+    _log_growth = math.log(GROWTH)
+    BUCKETS = int(math.log(MAX_VALUE / MIN_VALUE) / _log_growth) + 2
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        if value <= self.MIN_VALUE:
+            index = 0
+        else:
+            index = min(int(math.log(value / self.MIN_VALUE) / self._log_growth) + 1, self.BUCKETS - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """Return the value below which ``fraction`` of samples fall, or None."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == 0:
+                    return self.MIN_VALUE
+                # Geometric middle of the bucket, capped by the largest sample
+                return min(self.MIN_VALUE * self.GROWTH ** (index - 0.5), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def summary(self):
+        """p50/p99/max/mean in milliseconds."""
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+        return {
+            'count': self.count,
+            'p50_ms': ms(self.percentile(0.50)),
+            'p99_ms': ms(self.percentile(0.99)),
+            'max_ms': ms(self.max if self.count else None),
+            'mean_ms': ms(self.mean),
+        }
+
+
+class EventStats:
+    """Per event type latency histograms and an events/s rate."""
+
+    TIMINGS = ('queue_delay', 'handling', 'to_idle')
+
+    def __init__(self, root):
+        self.root = root
+        self.histograms = {
+            kind: {timing: StreamingHistogram() for timing in self.TIMINGS}
+            for kind in range(len(EVENT_NAMES))
+        }
+        self.started = time.monotonic()
+        self.events = 0
+        self.rate = 0.0
+        self._window_start = self.started
+        self._window_events = 0
+        # (kind, handler end) awaiting the next idle callback; cleared every frame
+        self._awaiting_idle = []
+        self._idle_job = None
+
+    def measure(self, dispatch, record):
+        """Call ``dispatch(record)`` and record its timings."""
+        kind = record[0]
+        histograms = self.histograms[kind]
+        histograms['queue_delay'].add(max(0.0, time.time() - record[1]))
+        start = time.perf_counter()
+        dispatch(record)
+        end = time.perf_counter()
+        histograms['handling'].add(end - start)
+        self._awaiting_idle.append((kind, end))
+        self.events += 1
+        self._window_events += 1
+
+    def frame_done(self):
+        """Called after a batch is handled; times the batch until Tk is idle."""
+        if self._awaiting_idle and self._idle_job is None:
+            self._idle_job = self.root.after_idle(self._on_idle)
+
+    def _on_idle(self):
+        self._idle_job = None
+        now = time.perf_counter()
+        for kind, end in self._awaiting_idle:
+            self.histograms[kind]['to_idle'].add(now - end)
+        self._awaiting_idle = []
+
+    def update_rate(self):
+        """Close the current rate window; returns events per second."""
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed > 0:
+            self.rate = self._window_events / elapsed
+        self._window_start = now
+        self._window_events = 0
+        return self.rate
+
+    def combined(self, timing):
+        """Merge ``timing`` across event types into one histogram."""
+        merged = StreamingHistogram()
+        for histograms in self.histograms.values():
+            source = histograms[timing]
+            merged.counts = [a + b for a, b in zip(merged.counts, source.counts)]
+            merged.count += source.count
+            merged.total += source.total
+            merged.max = max(merged.max, source.max)
+        return merged
+
+    def status_text(self, dropped=0):
+        """One line for the overlay's stats row."""
+        delay = self.combined('queue_delay')
+        p50, p99 = delay.percentile(0.50), delay.percentile(0.99)
+        if p50 is None:
+            lag = "lag -"
+        else:
+            lag = f"lag p50 {p50 * 1000:.1f} / p99 {p99 * 1000:.1f} ms"
+        return f"{lag} | {self.rate:.0f} ev/s | {dropped} dropped"
+
+    def report(self, queue=None):
+        """JSON-serialisable summary of everything collected."""
+        report = {
+            'uptime_s': round(time.monotonic() - self.started, 3),
+            'events': self.events,
+            'events_per_s': round(self.events / max(time.monotonic() - self.started, 1e-9), 1),
+            'types': {
+                EVENT_NAMES[kind]: {timing: histogram.summary() for timing, histogram in histograms.items()}
+                for kind, histograms in self.histograms.items()
+                if histograms['handling'].count
+            },
+        }
+        if queue is not None:
+            report['queue'] = {'received': queue.received, 'coalesced': queue.coalesced, 'dropped': queue.dropped}
+        return report
+
+    def dump(self, path=None, queue=None):
+        """Write the report as JSON to ``path``, or to stderr."""
+        text = json.dumps(self.report(queue), indent=2)
+        if path:
+            with open(path, 'w') as f:
+                f.write(text + '\n')
+        else:
+            print(text, file=sys.stderr)
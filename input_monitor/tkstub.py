@@ -0,0 +1,367 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Minimal in-process stand-in for the parts of tkinter the widget uses.
+
+Used by the benchmarks (and replays) where no display is available. Widgets
+keep their configuration in dicts and every operation that would be a Tcl
+round trip increments ``calls`` on the interpreter object shared by the
+widget tree (``root.tk.calls``), so Tk traffic can be counted without Tk.
+``after`` timers run from ``update`` and ``mainloop``.
+"""
+import heapq
+import itertools
+import struct
+import sys
+import time
+import types
+
+TkVersion = 8.6
+READABLE = 2
+WRITABLE = 4
+EXCEPTION = 8
+BOTH = 'both'
+X = 'x'
+Y = 'y'
+LEFT = 'left'
+RIGHT = 'right'
+TOP = 'top'
+BOTTOM = 'bottom'
+N = 'n'
+S = 's'
+E = 'e'
+W = 'w'
+NW = 'nw'
+CENTER = 'center'
+NORMAL = 'normal'
+HIDDEN = 'hidden'
+
+
+class TclError(Exception):
+    pass
+
+
+class _Interpreter:
+    """Stands in for the ``tkapp`` object; counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.file_handlers = {}
+        # Pending ``after`` jobs: id -> (func, args)
+        self.jobs = {}
+
+    def call(self, *args):
+        self.calls += 1
+        if args == ('after', 'info'):
+            return tuple(self.jobs)
+        return ''
+
+    def createfilehandler(self, fd, mask, func):
+        self.file_handlers[fd] = (mask, func)
+
+    def deletefilehandler(self, fd):
+        self.file_handlers.pop(fd, None)
+
+
+class Misc:
+    _names = itertools.count()
+
+    def __init__(self, master=None, cnf=None, **kw):
+        self.master = master
+        self.tk = master.tk
+        self.children = {}
+        self._config = dict(cnf or {}, **kw)
+        self._name = f'w{next(self._names)}'
+        master.children[self._name] = self
+        self.tk.calls += 1
+
+    def _root(self):
+        widget = self
+        while widget.master is not None:
+            widget = widget.master
+        return widget
+
+    def configure(self, cnf=None, **kw):
+        self.tk.calls += 1
+        self._config.update(cnf or {}, **kw)
+
+    config = configure
+
+    def cget(self, key):
+        self.tk.calls += 1
+        return self._config.get(key, '')
+
+    __getitem__ = cget
+
+    def __setitem__(self, key, value):
+        self.configure({key: value})
+
+    def _geometry(self, *args, **kw):
+        self.tk.calls += 1
+
+    pack = pack_forget = grid = grid_remove = grid_forget = place = place_forget = _geometry
+    columnconfigure = rowconfigure = bind = lift = focus_force = _geometry
+
+    def destroy(self):
+        self.tk.calls += 1
+        for child in list(self.children.values()):
+            child.destroy()
+        if self.master is not None:
+            self.master.children.pop(self._name, None)
+
+    def after(self, ms, func=None, *args):
+        return self._root()._schedule(time.monotonic() + ms / 1000.0, func, args)
+
+    def after_idle(self, func, *args):
+        # Runs on the next pass, after timers that are already due
+        return self._root()._schedule(time.monotonic(), func, args)
+
+    def after_cancel(self, job):
+        self.tk.calls += 1
+        self.tk.jobs.pop(job, None)
+
+    def update(self):
+        self._root()._run_due()
+
+    def update_idletasks(self):
+        self.tk.calls += 1
+
+    def winfo_children(self):
+        return list(self.children.values())
+
+    def winfo_x(self):
+        return 0
+
+    def winfo_y(self):
+        return 0
+
+    def winfo_width(self):
+        return self._config.get('width', 1)
+
+    def winfo_height(self):
+        return self._config.get('height', 1)
+
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+    def winfo_exists(self):
+        return 1
+
+
+class Tk(Misc):
+    def __init__(self, *args, **kw):
+        self.master = None
+        self.tk = _Interpreter()
+        self.children = {}
+        self._config = {}
+        self._name = '.'
+        self._timers = []
+        self._sequence = itertools.count()
+        self._running = False
+
+    def _schedule(self, due, func, args):
+        self.tk.calls += 1
+        number = next(self._sequence)
+        job = f'after#{number}'
+        self.tk.jobs[job] = (func, args)
+        heapq.heappush(self._timers, (due, number, job))
+        return job
+
+    def _run_due(self):
+        now = time.monotonic()
+        timers = self._timers
+        while timers and timers[0][0] <= now:
+            _, _, job = heapq.heappop(timers)
+            entry = self.tk.jobs.pop(job, None)
+            if entry is not None:
+                entry[0](*entry[1])
+
+    def mainloop(self, n=0):
+        self._running = True
+        while self._running:
+            self._run_due()
+            if self._timers:
+                time.sleep(min(max(self._timers[0][0] - time.monotonic(), 0.0), 0.005))
+            else:
+                time.sleep(0.005)
+
+    def quit(self):
+        self._running = False
+
+    def destroy(self):
+        self._running = False
+        Misc.destroy(self)
+
+    def _window_manager(self, *args, **kw):
+        self.tk.calls += 1
+
+    title = overrideredirect = attributes = wm_attributes = geometry = protocol = _window_manager
+    withdraw = deiconify = _window_manager
+
+
+class Frame(Misc):
+    pass
+
+
+class Label(Misc):
+    pass
+
+
+class Button(Misc):
+    pass
+
+
+class Canvas(Misc):
+    def __init__(self, master=None, cnf=None, **kw):
+        super().__init__(master, cnf, **kw)
+        self._items = {}
+        self._ids = itertools.count(1)
+
+    def _create(self, kind, coords, kw):
+        self.tk.calls += 1
+        item = next(self._ids)
+        self._items[item] = dict(kw, coords=coords, kind=kind)
+        return item
+
+    def create_text(self, *coords, **kw):
+        return self._create('text', coords, kw)
+
+    def create_image(self, *coords, **kw):
+        return self._create('image', coords, kw)
+
+    def create_oval(self, *coords, **kw):
+        return self._create('oval', coords, kw)
+
+    def create_rectangle(self, *coords, **kw):
+        return self._create('rectangle', coords, kw)
+
+    def create_line(self, *coords, **kw):
+        return self._create('line', coords, kw)
+
+    def _matching(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            item = self._items.get(tag_or_id)
+            return [item] if item is not None else []
+        return [item for item in self._items.values() if tag_or_id in (item.get('tags') or ())]
+
+    def itemconfig(self, tag_or_id, cnf=None, **kw):
+        self.tk.calls += 1
+        for item in self._matching(tag_or_id):
+            item.update(cnf or {}, **kw)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id, key):
+        self.tk.calls += 1
+        items = self._matching(tag_or_id)
+        return items[0].get(key, '') if items else ''
+
+    def coords(self, tag_or_id, *coords):
+        self.tk.calls += 1
+        for item in self._matching(tag_or_id):
+            item['coords'] = coords
+
+    def move(self, tag_or_id, dx, dy):
+        self.tk.calls += 1
+
+    def delete(self, tag_or_id):
+        self.tk.calls += 1
+        for item_id, item in list(self._items.items()):
+            if tag_or_id == 'all' or item_id == tag_or_id or tag_or_id in (item.get('tags') or ()):
+                del self._items[item_id]
+
+    def tag_bind(self, *args, **kw):
+        self.tk.calls += 1
+
+
+class PhotoImage:
+    _names = itertools.count()
+
+    def __init__(self, name=None, cnf=None, master=None, file=None, width=0, height=0, **kw):
+        self.name = name or f'pyimage{next(self._names)}'
+        self._width, self._height = width, height
+        if file:
+            # PNG dimensions, from the IHDR chunk
+            with open(file, 'rb') as f:
+                header = f.read(24)
+            if header[:8] == b'\x89PNG\r\n\x1a\n':
+                self._width, self._height = struct.unpack('>II', header[16:24])
+
+    def __str__(self):
+        return self.name
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def subsample(self, x, y=''):
+        y = y or x
+        return PhotoImage(width=max(1, self._width // x), height=max(1, self._height // y))
+
+    def zoom(self, x, y=''):
+        y = y or x
+        return PhotoImage(width=self._width * x, height=self._height * y)
+
+    def copy(self):
+        return PhotoImage(width=self._width, height=self._height)
+
+    def put(self, data, to=None):
+        pass
+
+    def blank(self):
+        pass
+
+
+class Font:
+    """Fixed-pitch approximation of ``tkinter.font.Font``."""
+
+    def __init__(self, root=None, font=None, name=None, exists=False, **options):
+        self._options = dict(family='TkDefaultFont', size=10, weight='normal', slant='roman')
+        self._options.update(options)
+
+    def measure(self, text, displayof=None):
+        return int(len(text) * abs(self._options['size']) * 0.6)
+
+    def metrics(self, *options, **kw):
+        linespace = int(abs(self._options['size']) * 1.3)
+        metrics = {'ascent': linespace - 3, 'descent': 3, 'linespace': linespace, 'fixed': 1}
+        return metrics[options[0]] if options else metrics
+
+    def cget(self, option):
+        return self._options[option]
+
+    def configure(self, **options):
+        self._options.update(options)
+
+    config = configure
+
+    def actual(self, option=None, displayof=None):
+        return self._options[option] if option else dict(self._options)
+
+
+font = types.SimpleNamespace(Font=Font)
+
+# Modules that do ``import tkinter as tk`` (and ``tkinter.font as tkfont``)
+PATCHED_MODULES = ('input_monitor.app', 'input_monitor.canvas_view', 'input_monitor.leds',
+                   'input_monitor.replay')
+
+
+def install():
+    """Point the widget modules at this stub instead of tkinter."""
+    import importlib
+
+    stub = sys.modules[__name__]
+    for name in PATCHED_MODULES:
+        module = importlib.import_module(name)
+        module.tk = stub
+        if hasattr(module, 'tkfont'):
+            module.tkfont = font
@@ -0,0 +1,77 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Rolling typed-text line for the typing mode.
+
+Characters go into a fixed-capacity ring, so however long someone types
+the buffer, and the work to render it, stay the same size. Chords and other
+non-character keys are stored in the same ring as marked tokens, which the
+renderers highlight.
+"""
+
+
+class TypedText:
+    """The last ``capacity`` characters typed, with chord tokens marked."""
+
+    def __init__(self, capacity=20):
+        self.capacity = capacity
+        self._chars = [''] * capacity
+        self._marks = [False] * capacity
+        # Characters ever written, and how many of the newest are kept
+        self._end = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, text, mark=False):
+        """Append characters; the oldest are dropped once the ring is full."""
+        capacity = self.capacity
+        for char in text[-capacity:]:
+            index = self._end % capacity
+            self._chars[index] = char
+            self._marks[index] = mark
+            self._end += 1
+        self._count = min(self._count + len(text), capacity)
+
+    def token(self, text):
+        """Append a highlighted token, spaced from its neighbours."""
+        if self._count and self._chars[(self._end - 1) % self.capacity] != ' ':
+            self.append(' ')
+        self.append(text, mark=True)
+        self.append(' ')
+
+    def backspace(self):
+        """Remove the last typed character; tokens are not edited."""
+        if not self._count:
+            return False
+        index = (self._end - 1) % self.capacity
+        if self._marks[index]:
+            return False
+        self._end -= 1
+        self._count -= 1
+        return True
+
+    def clear(self):
+        self._count = 0
+
+    def runs(self):
+        """Return ((text, is_token), ...) from oldest to newest."""
+        runs = []
+        text = []
+        mark = None
+        capacity = self.capacity
+        for position in range(self._end - self._count, self._end):
+            index = position % capacity
+            if self._marks[index] != mark and text:
+                runs.append((''.join(text), mark))
+                text = []
+            mark = self._marks[index]
+            text.append(self._chars[index])
+        if text:
+            runs.append((''.join(text), mark))
+        return tuple(runs)
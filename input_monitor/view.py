@@ -0,0 +1,58 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Retained view-model for the widget.
+
+The widget describes what should be on screen as a handful of fields (input
+text, font, icon, inline layout, readouts, LED colours). Only fields whose
+value actually changed are pushed to Tk, so repeated identical updates such
+as key auto-repeat cost a dictionary lookup instead of widget reconfiguration.
+"""
+
+
+class ViewModel:
+    """Remember the last value pushed for each field and skip redundant pushes.
+
+    ``appliers`` maps a field name to a callable that pushes a new value to
+    the screen.
+    """
+
+    def __init__(self, appliers):
+        self._appliers = appliers
+        self._values = {}
+
+        # Counters
+        self.applied = 0
+        self.skipped = 0
+
+    def get(self, field, default=None):
+        """Return the value currently on screen for ``field``."""
+        return self._values.get(field, default)
+
+    def set(self, field, value):
+        """Push ``value`` for ``field`` if it differs. Returns True if pushed."""
+        values = self._values
+        if field in values and values[field] == value:
+            self.skipped += 1
+            return False
+        values[field] = value
+        self._appliers[field](value)
+        self.applied += 1
+        return True
+
+    def update(self, **fields):
+        """Set several fields in the given order. Returns True if any was pushed."""
+        changed = False
+        for field, value in fields.items():
+            if self.set(field, value):
+                changed = True
+        return changed
+
+    def invalidate(self, *fields):
+        """Forget retained values so the next ``set`` always pushes."""
+        for field in fields or list(self._values):
+            self._values.pop(field, None)
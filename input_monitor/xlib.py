@@ -0,0 +1,142 @@
+"""
+Copyright (C) 2025, Jabez Winston C
+
+Author  : Jabez Winston C <jabezwinston@gmail.com>
+License : MIT
+Date    : 18-Oct-2026
+
+Minimal ctypes bindings for the parts of Xlib, XKB and XInput2 we use.
+
+Libraries are resolved with ``ctypes.util.find_library`` once per process;
+``find_library`` may spawn ldconfig/gcc, so it must stay off hot paths (and
+``ctypes.util``, which imports subprocess, is only loaded when needed).
+"""
+import ctypes
+
+c_int_p = ctypes.POINTER(ctypes.c_int)
+c_uint_p = ctypes.POINTER(ctypes.c_uint)
+c_ulong_p = ctypes.POINTER(ctypes.c_ulong)
+
+# Core protocol
+GenericEvent = 35
+
+# XKB
+XkbUseCoreKbd = 0x100
+XkbIndicatorStateNotifyMask = 1 << 4
+
+# XInput2
+XIAllMasterDevices = 1
+XI_RawKeyPress = 13
+XI_RawKeyRelease = 14
+XI_RawButtonPress = 15
+XI_RawButtonRelease = 16
+XI_RawMotion = 17
+XI_LASTEVENT = XI_RawMotion
+
+
+class XGenericEventCookie(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('extension', ctypes.c_int),
+        ('evtype', ctypes.c_int),
+        ('cookie', ctypes.c_uint),
+        ('data', ctypes.c_void_p),
+    ]
+
+
+class XEvent(ctypes.Union):
+    # The C union is padded to 24 longs
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('xcookie', XGenericEventCookie),
+        ('pad', ctypes.c_long * 24),
+    ]
+
+
+class XIEventMask(ctypes.Structure):
+    _fields_ = [
+        ('deviceid', ctypes.c_int),
+        ('mask_len', ctypes.c_int),
+        ('mask', ctypes.POINTER(ctypes.c_ubyte)),
+    ]
+
+
+class XIValuatorState(ctypes.Structure):
+    _fields_ = [
+        ('mask_len', ctypes.c_int),
+        ('mask', ctypes.POINTER(ctypes.c_ubyte)),
+        ('values', ctypes.POINTER(ctypes.c_double)),
+    ]
+
+
+class XIRawEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('extension', ctypes.c_int),
+        ('evtype', ctypes.c_int),
+        ('time', ctypes.c_ulong),
+        ('deviceid', ctypes.c_int),
+        ('sourceid', ctypes.c_int),
+        ('detail', ctypes.c_int),
+        ('flags', ctypes.c_int),
+        ('valuators', XIValuatorState),
+        ('raw_values', ctypes.POINTER(ctypes.c_double)),
+    ]
+
+
+_libraries = {}
+
+
+def _resolve(name):
+    if name not in _libraries:
+        import ctypes.util
+        path = ctypes.util.find_library(name)
+        if not path:
+            raise OSError(f'lib{name} not found')
+        _libraries[name] = ctypes.cdll.LoadLibrary(path)
+        return _libraries[name], True
+    return _libraries[name], False
+
+
+def load_x11():
+    """Return libX11 with the prototypes we use."""
+    lib, fresh = _resolve('X11')
+    if fresh:
+        d = ctypes.c_void_p
+        lib.XOpenDisplay.restype = d
+        lib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        lib.XCloseDisplay.argtypes = [d]
+        lib.XConnectionNumber.argtypes = [d]
+        lib.XPending.argtypes = [d]
+        lib.XNextEvent.argtypes = [d, ctypes.c_void_p]
+        lib.XFlush.argtypes = [d]
+        lib.XDefaultRootWindow.restype = ctypes.c_ulong
+        lib.XDefaultRootWindow.argtypes = [d]
+        lib.XQueryExtension.argtypes = [d, ctypes.c_char_p, c_int_p, c_int_p, c_int_p]
+        lib.XGetEventData.argtypes = [d, ctypes.POINTER(XGenericEventCookie)]
+        lib.XFreeEventData.argtypes = [d, ctypes.POINTER(XGenericEventCookie)]
+        lib.XQueryPointer.argtypes = [d, ctypes.c_ulong, c_ulong_p, c_ulong_p,
+                                      c_int_p, c_int_p, c_int_p, c_int_p, c_uint_p]
+        lib.XkbKeycodeToKeysym.restype = ctypes.c_ulong
+        lib.XkbKeycodeToKeysym.argtypes = [d, ctypes.c_ubyte, ctypes.c_int, ctypes.c_int]
+        lib.XKeysymToString.restype = ctypes.c_char_p
+        lib.XKeysymToString.argtypes = [ctypes.c_ulong]
+        lib.XkbQueryExtension.argtypes = [d, c_int_p, c_int_p, c_int_p, c_int_p, c_int_p]
+        lib.XkbSelectEvents.argtypes = [d, ctypes.c_uint, ctypes.c_ulong, ctypes.c_ulong]
+        lib.XkbGetIndicatorState.argtypes = [d, ctypes.c_uint, c_uint_p]
+    return lib
+
+
+def load_xi():
+    """Return libXi with the prototypes we use."""
+    lib, fresh = _resolve('Xi')
+    if fresh:
+        lib.XIQueryVersion.argtypes = [ctypes.c_void_p, c_int_p, c_int_p]
+        lib.XISelectEvents.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XIEventMask), ctypes.c_int]
+    return lib
@@ -23,7 +23,7 @@ IF NOT EXIST "input_monitor\__main__.py" IF NOT EXIST "packaging\windows\entry_p
 
 REM Build onefile, windowed GUI with no console. Add icon if present.
 REM Ensure images are included by adding them as PyInstaller data entries
-SET ADD_DATA=--add-data "input_monitor/images/mouse-left-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-middle-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-right-click.png;input_monitor/images" --add-data "input_monitor/images/windows-10-logo.png;input_monitor/images"
+SET ADD_DATA=--add-data "input_monitor/images/mouse-left-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-middle-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-right-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-x1-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-x2-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-scroll.png;input_monitor/images" --add-data "input_monitor/images/windows-10-logo.png;input_monitor/images"
 
 IF EXIST "%ICON%" (
 	py -3 -m PyInstaller --clean --noconfirm --onefile --windowed --icon "%ICON%" -n "%OUTPUT_NAME%" %ADD_DATA% packaging\windows\entry_point.py
@@ -1,6 +1,7 @@
 # PyInstaller spec for input-monitor. Use this if you need more control than the helper scripts.
 
-# One-file, windowed app (no console)
+# One-folder, windowed app (no console). One-file builds unpack themselves on
+# every launch, which adds noticeably to the time to first frame.
 # Adjust datas to include icon and other files if needed.
 
 block_cipher = None
@@ -15,13 +16,18 @@ a = Analysis(
         ('input_monitor/images/mouse-left-click.png', 'input_monitor/images'),
         ('input_monitor/images/mouse-middle-click.png', 'input_monitor/images'),
         ('input_monitor/images/mouse-right-click.png', 'input_monitor/images'),
+        ('input_monitor/images/mouse-x1-click.png', 'input_monitor/images'),
+        ('input_monitor/images/mouse-x2-click.png', 'input_monitor/images'),
+        ('input_monitor/images/mouse-scroll.png', 'input_monitor/images'),
         ('input_monitor/images/windows-10-logo.png', 'input_monitor/images'),
     ],
-    hiddenimports=['pynput', 'keyboard'],
+    # The backends are imported when listeners start, not at import time
+    hiddenimports=['pynput', 'keyboard', 'input_monitor.backends.hooks'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Not used at runtime; keeps the bundle (and its import scan) smaller
+    excludes=['unittest', 'doctest', 'pydoc', 'lib2to3', 'tkinter.test'],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
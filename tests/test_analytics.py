@@ -0,0 +1,84 @@
+import json
+
+from input_monitor.analytics import SessionAnalytics, SlidingCounter, TopK
+
+
+def test_sliding_counter_window():
+    counter = SlidingCounter(60)
+    for t in (0.0, 0.5, 10.0, 59.9):
+        counter.add(t)
+    assert counter.count(59.9) == 4
+    # The first second slides out of the window
+    assert counter.count(60.0) == 2
+    assert counter.count(200.0) == 0
+    assert counter.peak == 4
+
+
+def test_sliding_counter_out_of_order():
+    counter = SlidingCounter(60)
+    counter.add(10.0)
+    counter.add(5.0)
+    assert counter.count(10.0) == 2
+
+
+def test_top_k_exact_within_capacity():
+    top = TopK(4)
+    for name in ['Ctrl + C'] * 5 + ['Ctrl + V'] * 3 + ['Alt + Tab']:
+        top.add(name)
+    assert top.top(2) == [('Ctrl + C', 5, 0), ('Ctrl + V', 3, 0)]
+
+
+def test_top_k_replaces_smallest_counter():
+    top = TopK(2)
+    for name in ('a', 'a', 'a', 'b', 'c'):
+        top.add(name)
+    # 'c' takes over the counter of 'b' and inherits its count as error
+    assert top.top(2) == [('a', 3, 0), ('c', 2, 1)]
+
+
+def _session():
+    analytics = SessionAnalytics(top=3)
+    for i in range(120):
+        analytics.key(100.0 + i * 0.5)
+    analytics.shortcut('Ctrl + S')
+    analytics.shortcut('Ctrl + S')
+    analytics.click('left', False, 100.0)
+    analytics.click('left', True, 100.2)
+    analytics.move(0, 0)
+    analytics.move(3, 4)
+    analytics.selection(10, 20)
+    analytics.selection(30, 5)
+    return analytics
+
+
+def test_report():
+    report = _session().report()
+    assert report['duration_s'] == 59.5
+    assert report['keys']['total'] == 120
+    assert report['keys']['peak_per_minute'] == 120
+    assert report['shortcuts']['top'] == [{'keys': 'Ctrl + S', 'count': 2, 'overestimate': 0}]
+    assert report['clicks'] == {'left': {'clicks': 2, 'double_clicks': 1}}
+    assert report['mouse_travel_px'] == 5
+    assert report['selections'] == {'count': 2, 'mean_area_px': 175, 'largest': [10, 20]}
+    json.dumps(report)
+
+
+def test_csv_dump(tmp_path):
+    path = tmp_path / 'report.csv'
+    _session().dump(str(path))
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'section,name,value'
+    assert 'shortcut,Ctrl + S,2' in lines
+    assert 'selections,largest,10x20' in lines
+
+
+def test_status_text():
+    assert _session().status_text(160.0) == '118 KPM | 5 px | Ctrl + S ×2'
+
+
+def test_short_window_is_scaled_to_a_minute():
+    analytics = SessionAnalytics(window=30)
+    for i in range(30):
+        analytics.key(100.0 + i)
+    assert analytics.status_text(129.5).startswith('60 KPM')
+    assert analytics.report()['keys']['peak_per_minute'] == 60
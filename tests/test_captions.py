@@ -0,0 +1,54 @@
+import time
+
+from input_monitor.captions import CaptionWriter, format_time
+
+
+def test_format_time():
+    assert format_time(0) == '00:00:00.000'
+    assert format_time(3723.4567) == '01:02:03.457'
+    assert format_time(1.5, ',') == '00:00:01,500'
+    assert format_time(-2) == '00:00:00.000'
+
+
+def _write(path, origin_ns, cues):
+    writer = CaptionWriter(path, origin_ns=origin_ns)
+    for text, start, end in cues:
+        writer._put(text, origin_ns + int(start * 1e9), origin_ns + int(end * 1e9))
+    writer.close()
+    return writer
+
+
+def test_vtt_output(tmp_path):
+    path = str(tmp_path / 'track.vtt')
+    writer = _write(path, time.monotonic_ns(), [('Ctrl + <', 1.0, 2.5), ('A & B', 3.0, 4.0)])
+    assert writer.cues == 2
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == ('WEBVTT\n\n'
+                            '00:00:01.000 --> 00:00:02.500\nCtrl + &lt;\n\n'
+                            '00:00:03.000 --> 00:00:04.000\nA &amp; B\n\n')
+
+
+def test_srt_output(tmp_path):
+    path = str(tmp_path / 'track.srt')
+    _write(path, time.monotonic_ns(), [('Ctrl + <', 1.0, 2.5), ('Too short', 3.0, 3.0)])
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == '1\n00:00:01,000 --> 00:00:02,500\nCtrl + <\n\n'
+
+
+def test_show_ends_the_previous_cue(tmp_path):
+    path = str(tmp_path / 'track.vtt')
+    writer = CaptionWriter(path)
+    writer.show('A')
+    time.sleep(0.01)
+    writer.show('A')
+    writer.show('B')
+    time.sleep(0.01)
+    writer.clear()
+    writer.show('C')
+    time.sleep(0.01)
+    writer.close()
+    with open(path, encoding='utf-8') as f:
+        texts = [line for line in f.read().split('\n') if line and '-->' not in line]
+    assert texts == ['WEBVTT', 'A', 'B', 'C']
+    # Closing twice is harmless
+    writer.close()
@@ -0,0 +1,40 @@
+from input_monitor.chord import MOD_CTRL, MOD_SHIFT, ChordState
+
+
+def test_chord_text():
+    chord = ChordState()
+    assert chord.press('Ctrl', 0.0)
+    assert chord.display == 'Ctrl + ...'
+    assert chord.press('S', 0.1)
+    assert not chord.press('S', 0.2)
+    assert chord.text == 'Ctrl + S'
+    assert chord.release('Ctrl')
+    assert chord.text == 'S'
+    assert chord.mask == 0
+
+
+def test_modifiers_sharing_a_bit():
+    chord = ChordState()
+    chord.press('Ctrl', 0.0, MOD_CTRL)
+    chord.press('Right Ctrl', 0.0, MOD_CTRL)
+    chord.release('Ctrl', MOD_CTRL)
+    assert chord.mask == MOD_CTRL
+
+
+def test_sweep_drops_stale_keys():
+    chord = ChordState()
+    chord.press('Shift', 0.0)
+    chord.press('A', 95.0)
+    assert chord.sweep(100.0, 10.0) == ['Shift']
+    assert chord.mask == 0
+    assert chord.text == 'A'
+
+
+def test_sweep_drops_relabelled_modifiers():
+    chord = ChordState()
+    chord.press('Control', 0.0, MOD_CTRL)
+    chord.press('Umschalt', 0.0, MOD_SHIFT)
+    assert chord.sweep(100.0, 10.0) == ['Control', 'Umschalt']
+    assert len(chord) == 0
+    assert chord.mask == 0
+    assert chord.display == ''
@@ -0,0 +1,80 @@
+from input_monitor.events import EventQueue, KEY_DOWN, MOVE, SCROLL
+
+
+def test_records_keep_arrival_order():
+    queue = EventQueue(16)
+    queue.push((KEY_DOWN, 1.0, 'a', 30))
+    queue.push((MOVE, 2.0, 10, 20))
+    queue.push((KEY_DOWN, 3.0, 'b', 48))
+    assert [record[1] for record in queue.pop_batch(16)] == [1.0, 2.0, 3.0]
+    assert len(queue) == 0
+
+
+def test_consecutive_moves_merge():
+    queue = EventQueue(16)
+    for i in range(5):
+        queue.push((MOVE, float(i), i, i * 2))
+    (record,) = queue.pop_batch(16)
+    assert record[:4] == (MOVE, 4.0, 4, 8)
+    assert queue.received == 5
+    assert queue.coalesced == 4
+
+
+def test_merged_moves_keep_a_trail():
+    queue = EventQueue(16)
+    for i in range(5):
+        queue.push((MOVE, float(i), i, i * 2))
+    (record,) = queue.pop_batch(16)
+    assert record[4] == [(0.0, 0, 0), (1.0, 1, 2), (2.0, 2, 4), (3.0, 3, 6)]
+
+
+def test_trail_is_bounded():
+    queue = EventQueue(16)
+    for i in range(EventQueue.MAX_TRAIL + 10):
+        queue.push((MOVE, float(i), i, 0))
+    (record,) = queue.pop_batch(16)
+    assert len(record[4]) == EventQueue.MAX_TRAIL
+
+
+def test_moves_separated_by_other_events_do_not_merge():
+    queue = EventQueue(16)
+    queue.push((MOVE, 1.0, 1, 1))
+    queue.push((KEY_DOWN, 2.0, 'a', 30))
+    queue.push((MOVE, 3.0, 3, 3))
+    assert [len(record) for record in queue.pop_batch(16)] == [4, 4, 4]
+
+def test_consecutive_scrolls_are_summed():
+    queue = EventQueue(16)
+    queue.push((SCROLL, 1.0, 0, 1))
+    queue.push((SCROLL, 2.0, 1, 1))
+    queue.push((SCROLL, 3.0, 0, -3))
+    assert queue.pop_batch(16) == [(SCROLL, 3.0, 1, -1)]
+
+
+def test_full_queue_drops_new_records():
+    queue = EventQueue(2)
+    assert queue.push((KEY_DOWN, 1.0, 'a', 30))
+    assert queue.push((KEY_DOWN, 2.0, 'b', 48))
+    assert queue.push((KEY_DOWN, 3.0, 'c', 46)) is False
+    assert queue.dropped == 1
+    # A move still merges into a queued move when full
+    queue = EventQueue(1)
+    queue.push((MOVE, 1.0, 1, 1))
+    assert queue.push((MOVE, 2.0, 2, 2))
+
+
+def test_pop_batch_limit():
+    queue = EventQueue(16)
+    for i in range(5):
+        queue.push((KEY_DOWN, float(i), 'a', 30))
+    assert len(queue.pop_batch(3)) == 3
+    assert len(queue.pop_batch(3)) == 2
+
+
+def test_wait_reports_queued_records():
+    queue = EventQueue(16)
+    assert queue.wait(0) is False
+    queue.push((KEY_DOWN, 1.0, 'a', 30))
+    assert queue.wait(0) is True
+    queue.pop_batch(16)
+    assert queue.wait(0) is False
@@ -0,0 +1,54 @@
+import io
+
+from input_monitor.events import CLICK, KEY_DOWN, MOVE, SCROLL
+from input_monitor.helper import HEADER, HEARTBEAT, MAGIC, RECORD, HelperReader, pack_record
+
+
+def _stream(records):
+    buffer = bytearray(RECORD.size * len(records))
+    for index, record in enumerate(records):
+        pack_record(buffer, index * RECORD.size, record)
+    return io.BytesIO(HEADER.pack(MAGIC, RECORD.size) + bytes(buffer))
+
+
+def test_records_round_trip():
+    got = []
+    stream = _stream([
+        (KEY_DOWN, 1.0, 'ctrl', 29),
+        (MOVE, 2.0, 10, -20),
+        (CLICK, 3.0, 10, 20, 'right', True),
+        (SCROLL, 4.0, 0, -1),
+        (HEARTBEAT, 5.0, 0, 0),
+    ])
+    HelperReader(stream.read,
+                 key_down=lambda name, t, scan_code: got.append((KEY_DOWN, t, name, scan_code)),
+                 key_up=None,
+                 move=lambda x, y, t: got.append((MOVE, t, x, y)),
+                 click=lambda x, y, button, pressed, t: got.append((CLICK, t, x, y, button, pressed)),
+                 scroll=lambda dx, dy, t: got.append((SCROLL, t, dx, dy))).run()
+    assert got == [(KEY_DOWN, 1.0, 'ctrl', 29), (MOVE, 2.0, 10, -20), (CLICK, 3.0, 10, 20, 'right', True),
+                   (SCROLL, 4.0, 0, -1)]
+
+
+def test_rejected_records_are_retried(monkeypatch):
+    monkeypatch.setattr(HelperReader, 'BACKPRESSURE_SLEEP', 0)
+    attempts = []
+    got = []
+
+    def move(x, y, t):
+        attempts.append(x)
+        if len(attempts) % 3:
+            return False
+        got.append(x)
+
+    HelperReader(_stream([(MOVE, float(i), i, 0) for i in range(4)]).read, None, None, move, None).run()
+    assert got == [0, 1, 2, 3]
+    assert len(attempts) == 12
+
+
+def test_retries_end_when_stopped():
+    got = []
+    reader = HelperReader(_stream([(MOVE, 1.0, 1, 1), (MOVE, 2.0, 2, 2)]).read, None, None,
+                          lambda x, y, t: got.append(x) or False, None, stopped=lambda: True)
+    reader.run()
+    assert got == [1]
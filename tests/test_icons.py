@@ -0,0 +1,48 @@
+import os
+
+from input_monitor.icons import (cached_icon_path, images_dir, read_png, resample, scaled_icon, target_size,
+                                 write_png)
+
+
+def _checker(width, height):
+    rgba = bytearray()
+    for y in range(height):
+        for x in range(width):
+            rgba += bytes((255, 0, 0, 255) if (x + y) % 2 else (0, 0, 255, 128))
+    return rgba
+
+
+def test_png_round_trip(tmp_path):
+    path = str(tmp_path / 'image.png')
+    rgba = _checker(5, 3)
+    write_png(path, 5, 3, rgba)
+    assert read_png(path) == (5, 3, rgba)
+
+
+def test_target_size_keeps_aspect():
+    assert target_size(64, 32, 16) == (16, 8)
+    assert target_size(32, 64, 16) == (8, 16)
+    assert target_size(100, 1, 10) == (10, 1)
+
+
+def test_resample_sizes():
+    rgba = _checker(8, 8)
+    assert len(resample(8, 8, rgba, 3, 5)) == 3 * 5 * 4
+    assert len(resample(8, 8, rgba, 16, 16)) == 16 * 16 * 4
+
+
+def test_resample_keeps_flat_colour():
+    rgba = bytearray(bytes((10, 200, 30, 255)) * 64)
+    out = resample(8, 8, rgba, 3, 3)
+    assert all(abs(a - b) <= 1 for a, b in zip(out, bytes((10, 200, 30, 255)) * 9))
+
+
+def test_scaled_icon_is_cached(tmp_path):
+    source = os.path.join(images_dir(), 'mouse-left-click.png')
+    directory = str(tmp_path)
+    path = cached_icon_path(source, 12, directory)
+    assert not os.path.isfile(path)
+    assert scaled_icon(source, 12, directory) == path
+    width, height, _ = read_png(path)
+    assert max(width, height) == 12
+    assert scaled_icon(source, 12, directory) == path
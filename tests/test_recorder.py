@@ -0,0 +1,51 @@
+import time
+
+from input_monitor.events import CLICK, KEY_DOWN, KEY_UP, MOVE, SCROLL
+from input_monitor.recorder import SessionReader, SessionRecorder
+from input_monitor.replay import read_session
+
+
+def test_session_round_trip(tmp_path):
+    path = str(tmp_path / 'session.imrec')
+    t = time.time()
+    recorder = SessionRecorder(path)
+    recorder.key(KEY_DOWN, 'A', t, 30)
+    recorder.move(10, 20, t + 0.001)
+    recorder.click(10, 20, 'left', True, t + 0.002)
+    recorder.scroll(0, -2, t + 0.003)
+    recorder.key(KEY_UP, 'A', t + 0.004)
+    assert recorder.count == 5
+    recorder.close()
+
+    records = list(read_session(path))
+    assert [record[0] for record in records] == [KEY_DOWN, MOVE, CLICK, SCROLL, KEY_UP]
+    assert records[0][2:] == ('A', 30)
+    assert records[1][2:] == (10, 20)
+    assert records[2][2:] == (10, 20, 'left', True)
+    assert records[3][2:] == (0, -2)
+    assert records[4][2:] == ('A', None)
+    assert abs(records[1][1] - (t + 0.001)) < 1e-3
+
+
+def test_recording_grows_past_one_chunk(tmp_path, monkeypatch):
+    monkeypatch.setattr(SessionRecorder, 'CHUNK_SIZE', 4096)
+    path = str(tmp_path / 'session.imrec')
+    recorder = SessionRecorder(path)
+    for i in range(1000):
+        recorder.move(i, i)
+    recorder.close()
+
+    reader = SessionReader(path)
+    assert len(reader) == 1000
+    assert [record[4] for record in reader] == list(range(1000))
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'\0' * 128)
+    try:
+        SessionReader(str(path))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('expected ValueError')